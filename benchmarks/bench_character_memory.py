@@ -0,0 +1,73 @@
+"""
+Benchmark mémoire et débit de construction des personnages
+
+Compare le Character à __slots__ avec une variante qui rétablit le
+__dict__ par instance, comme avant.
+
+Usage:
+    python -m benchmarks.bench_character_memory --count 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.character import Character
+
+
+class DictCharacter(Character):
+    """Character avec un __dict__ par instance (ancienne représentation)"""
+
+
+def measure(character_class, count):
+    """
+    Mesure la mémoire et le débit de construction d'une classe
+    
+    Args:
+        character_class (type): Classe à mesurer
+        count (int): Nombre de personnages à créer
+    
+    Returns:
+        dict: Octets par personnage et personnages créés par seconde
+    """
+    names = [f"P{i}" for i in range(count)]
+    gc.collect()
+    
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    characters = [character_class(name) for name in names]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del characters
+    gc.collect()
+    
+    start = time.perf_counter()
+    characters = [character_class(name) for name in names]
+    elapsed = time.perf_counter() - start
+    del characters
+    
+    return {
+        'class': character_class.__name__,
+        'bytes_per_character': (after - before) / count,
+        'characters_per_second': count / elapsed if elapsed > 0 else float('inf')
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000,
+                        help="nombre de personnages créés par mesure")
+    args = parser.parse_args(argv)
+    
+    results = [measure(Character, args.count), measure(DictCharacter, args.count)]
+    for result in results:
+        print(f"{result['class']:>15}: {result['bytes_per_character']:8.1f} octets/personnage, "
+              f"{result['characters_per_second']:12,.0f} personnages/s")
+    
+    saved = 1 - results[0]['bytes_per_character'] / results[1]['bytes_per_character']
+    print(f"Gain mémoire: {saved:.0%}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Benchmarks des chemins critiques de Character, Game et Battle
+
+Chaque benchmark est mesuré pour plusieurs nombres de joueurs : temps par
+opération (meilleure de plusieurs répétitions), mémoire conservée et pic
+mémoire par opération (tracemalloc). Les résultats peuvent être enregistrés
+comme référence JSON ; une exécution ultérieure échoue si un chemin
+critique régresse au-delà du seuil donné.
+
+Usage:
+    python -m benchmarks.bench_hot_paths --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_hot_paths --baseline benchmarks/baseline.json --threshold 0.25
+"""
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+from src.battle import Battle
+from src.character import Character
+from src.game import Game
+
+DEFAULT_SIZES = (2, 10, 100, 1_000, 10_000, 100_000)
+
+# Santé assez grande pour qu'aucun joueur ne meure pendant la mesure
+_ENDLESS = 10 ** 12
+
+
+def _characters(size):
+    characters = [Character(f"P{i}", _ENDLESS) for i in range(size)]
+    for character in characters:
+        character.max_health = _ENDLESS
+    return characters
+
+
+def _cycle(size):
+    """Paires (acteur, cible) parcourant tous les joueurs"""
+    return [(i, (i + 1) % size) for i in range(size)]
+
+
+def _game(size):
+    game = Game()
+    for i in range(size):
+        game.add_player(f"P{i}", _ENDLESS)
+    return game
+
+
+def bench_character_attack(size):
+    characters = _characters(size)
+    pairs = [(characters[i], characters[j]) for i, j in _cycle(size)]
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        attacker, target = pairs[index]
+        attacker.attack(target)
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_character_take_damage(size):
+    characters = _characters(size)
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        characters[index].take_damage(1)
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_character_heal(size):
+    characters = _characters(size)
+    for character in characters:
+        character.health = 1
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        characters[index].heal()
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_game_execute_action(size):
+    game = _game(size)
+    names = [player.name for player in game.players]
+    pairs = [(names[i], names[j]) for i, j in _cycle(size)]
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        player, target = pairs[index]
+        game.execute_action(player, 'attack', target)
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_game_simulate_turn(size):
+    game = _game(size)
+    names = [player.name for player in game.players]
+    pairs = [(names[i], names[j]) for i, j in _cycle(size)]
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        player, target = pairs[index]
+        game.simulate_turn(player, target, 'attack')
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_game_get_game_state(size):
+    """Un changement de santé suivi de get_game_state, comme un client qui interroge après chaque action"""
+    game = _game(size)
+    players = game.players
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        players[index].take_damage(1)
+        game.get_game_state()
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_game_get_leaderboard(size):
+    """Un changement de santé suivi du top 10"""
+    game = _game(size)
+    players = game.players
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        players[index].take_damage(1)
+        game.get_leaderboard(10)
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_game_apply_undo(size):
+    """Exploration d'un coup : apply puis undo, sans copie ni historique"""
+    game = _game(size)
+    names = [player.name for player in game.players]
+    moves = [(names[i], 'attack', names[j]) for i, j in _cycle(size)]
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        game.undo(game.apply(moves[index]))
+        state['next'] = (index + 1) % size
+    return op
+
+
+def bench_battle_start_duel(size):
+    """Duels complets entre joueurs voisins, remis en vie avant chaque duel"""
+    characters = [Character(f"P{i}") for i in range(size)]
+    pairs = [(characters[i], characters[j]) for i, j in _cycle(size)]
+    state = {'next': 0}
+    
+    def op():
+        index = state['next']
+        player1, player2 = pairs[index]
+        player1.health = player2.health = Character.MAX_HEALTH
+        Battle(player1, player2).start_duel()
+        state['next'] = (index + 1) % size
+    return op
+
+
+BENCHMARKS = {
+    'character.attack': bench_character_attack,
+    'character.take_damage': bench_character_take_damage,
+    'character.heal': bench_character_heal,
+    'game.execute_action': bench_game_execute_action,
+    'game.simulate_turn': bench_game_simulate_turn,
+    'game.get_game_state': bench_game_get_game_state,
+    'game.get_leaderboard': bench_game_get_leaderboard,
+    'game.apply_undo': bench_game_apply_undo,
+    'battle.start_duel': bench_battle_start_duel,
+}
+
+
+def measure(setup, size, number=1_000, repeat=5):
+    """
+    Mesure une opération pour un nombre de joueurs
+    
+    Args:
+        setup (callable): Fonction size -> opération à mesurer
+        size (int): Nombre de joueurs
+        number (int): Opérations par répétition
+        repeat (int): Répétitions, la meilleure est retenue
+    
+    Returns:
+        dict: seconds_per_op, bytes_per_op (mémoire conservée) et
+            peak_bytes_per_op
+    """
+    op = setup(size)
+    op()  # Échauffement (caches paresseux, premier tri...)
+    
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    for _ in range(number):
+        op()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    best = math.inf
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                op()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    
+    return {
+        'seconds_per_op': best / number,
+        'bytes_per_op': (current - before) / number,
+        'peak_bytes_per_op': (peak - before) / number
+    }
+
+
+def run(sizes=DEFAULT_SIZES, names=None, number=1_000, repeat=5, progress=None):
+    """
+    Exécute les benchmarks
+    
+    Args:
+        sizes (iterable): Nombres de joueurs mesurés
+        names (iterable, optional): Benchmarks à exécuter (défaut: tous)
+        number (int): Opérations par répétition
+        repeat (int): Répétitions par mesure
+        progress (callable, optional): Appelé avec (nom, taille, mesure)
+    
+    Returns:
+        dict: Résultats {nom: {taille (str): mesure}} et métadonnées
+    """
+    names = list(BENCHMARKS) if names is None else list(names)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Benchmarks inconnus: {', '.join(unknown)}")
+    
+    results = {}
+    for name in names:
+        curve = results[name] = {}
+        for size in sizes:
+            curve[str(size)] = measure(BENCHMARKS[name], size, number, repeat)
+            if progress is not None:
+                progress(name, size, curve[str(size)])
+    
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'number': number,
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def scaling_exponents(curve):
+    """
+    Pente log-log du temps par opération entre tailles successives
+    
+    Une pente proche de 0 indique un coût constant par opération, proche
+    de 1 un coût linéaire en nombre de joueurs.
+    
+    Returns:
+        list: (taille, pente) pour chaque taille après la première
+    """
+    points = sorted((int(size), measure['seconds_per_op']) for size, measure in curve.items())
+    exponents = []
+    for (size1, time1), (size2, time2) in zip(points, points[1:]):
+        if time1 > 0 and time2 > 0:
+            exponents.append((size2, math.log(time2 / time1) / math.log(size2 / size1)))
+    return exponents
+
+
+def compare(results, baseline, threshold=0.25, min_bytes=64):
+    """
+    Compare des résultats à une référence
+    
+    Args:
+        results (dict): Résultats de run()
+        baseline (dict): Résultats de référence
+        threshold (float): Dégradation relative tolérée (0.25 = 25 %)
+        min_bytes (int): Écart de mémoire conservée ignoré, en octets par
+            opération
+    
+    Returns:
+        list: Régressions (nom, taille, métrique, référence, mesure)
+    """
+    regressions = []
+    for name, curve in results['results'].items():
+        reference_curve = baseline.get('results', {}).get(name, {})
+        for size, measured in curve.items():
+            reference = reference_curve.get(size)
+            if reference is None:
+                continue
+            if measured['seconds_per_op'] > reference['seconds_per_op'] * (1 + threshold):
+                regressions.append((name, int(size), 'seconds_per_op',
+                                    reference['seconds_per_op'], measured['seconds_per_op']))
+            if measured['bytes_per_op'] > max(reference['bytes_per_op'] * (1 + threshold),
+                                              reference['bytes_per_op'] + min_bytes):
+                regressions.append((name, int(size), 'bytes_per_op',
+                                    reference['bytes_per_op'], measured['bytes_per_op']))
+    return regressions
+
+
+def report(results):
+    """Affiche les courbes de passage à l'échelle"""
+    for name, curve in results['results'].items():
+        print(name)
+        exponents = dict(scaling_exponents(curve))
+        for size, measured in sorted(curve.items(), key=lambda item: int(item[0])):
+            slope = exponents.get(int(size))
+            print(f"  {int(size):>8} joueurs: {measured['seconds_per_op'] * 1e6:10.2f} µs/op, "
+                  f"{measured['bytes_per_op']:8.1f} o/op conservés, "
+                  f"pic {measured['peak_bytes_per_op']:8.1f} o/op"
+                  + (f", pente {slope:+.2f}" if slope is not None else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="nombres de joueurs mesurés")
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS),
+                        help="benchmarks à exécuter (défaut: tous)")
+    parser.add_argument('--number', type=int, default=1_000,
+                        help="opérations par répétition")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="répétitions par mesure, la meilleure est retenue")
+    parser.add_argument('--baseline', help="fichier JSON de référence à comparer")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="dégradation relative tolérée (défaut: 0.25)")
+    parser.add_argument('--save-baseline', metavar='PATH',
+                        help="enregistre les résultats comme référence")
+    args = parser.parse_args(argv)
+    
+    results = run(args.sizes, args.only, args.number, args.repeat)
+    report(results)
+    
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"Référence enregistrée dans {args.save_baseline}")
+    
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, size, metric, reference, measured in regressions:
+            print(f"RÉGRESSION {name} ({size} joueurs) {metric}: {reference:.3g} -> {measured:.3g}")
+        if regressions:
+            return 1
+        print(f"Aucune régression au-delà de {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Benchmark du coût du journal d'actions selon la durabilité
+
+Joue les mêmes actions sans journal puis avec chaque niveau de durabilité,
+et compare les actions journalisées par seconde. En durabilité 'group', un
+commit est fait tous les --batch actions, comme le serveur après chaque
+paquet de requêtes.
+
+Usage:
+    python -m benchmarks.bench_journal --actions 20000 --batch 64
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.game import Game
+from src.journal import ALWAYS, DURABILITY_LEVELS, Journal
+
+BASELINE = 'off'
+
+
+def measure(durability, actions, batch, directory):
+    """
+    Mesure le débit d'actions pour un niveau de durabilité
+    
+    Args:
+        durability (str): Niveau de durabilité, ou 'off' sans journal
+        actions (int): Nombre d'actions jouées
+        batch (int): Actions par commit
+        directory (str): Répertoire du fichier journal
+    
+    Returns:
+        dict: Actions par seconde et nombre de fsync
+    """
+    game = Game()
+    journal = None
+    if durability != BASELINE:
+        journal = Journal(os.path.join(directory, f"{durability}.journal"), durability=durability,
+                          group_size=batch, group_interval=float('inf'))
+        journal.attach(game)
+    game.add_player("Alice", actions + 1)
+    game.add_player("Bob", actions + 1)
+    
+    start = time.perf_counter()
+    for i in range(actions):
+        if i % 2:
+            game.execute_action("Bob", "attack", "Alice")
+        else:
+            game.execute_action("Alice", "attack", "Bob")
+        if journal is not None and i % batch == batch - 1:
+            journal.commit()
+    if journal is not None:
+        journal.close()
+    elapsed = time.perf_counter() - start
+    
+    return {
+        'durability': durability,
+        'actions_per_second': actions / elapsed if elapsed > 0 else float('inf'),
+        'syncs': journal.syncs if journal is not None else 0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--actions', type=int, default=20_000,
+                        help="actions jouées par mesure")
+    parser.add_argument('--batch', type=int, default=64,
+                        help="actions par commit groupé")
+    parser.add_argument('--always-actions', type=int, default=2_000,
+                        help="actions jouées en durabilité 'always', un fsync chacune")
+    args = parser.parse_args(argv)
+    
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for durability in (BASELINE,) + DURABILITY_LEVELS:
+            actions = args.always_actions if durability == ALWAYS else args.actions
+            results.append(measure(durability, actions, args.batch, directory))
+    
+    baseline = results[0]['actions_per_second']
+    for result in results:
+        print(f"{result['durability']:>7}: {result['actions_per_second']:12,.0f} actions/s "
+              f"({result['actions_per_second'] / baseline:6.1%} du débit sans journal), "
+              f"{result['syncs']} fsync")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,145 @@
-"""Point d'entrée principal du jeu RPG-CI."""
+"""
+Point d'entrée principal du jeu RPG-CI.
+
+Usage:
+    python main.py                                  # un combat commenté
+    python main.py --games 100000 --workers 4 --quiet
+"""
+import argparse
+import random
+import sys
+
 from src.character import Character
 from src.battle import Battle
+from src.tournament import Tournament
 
-def main():
-    """Fonction principale du jeu."""
-    print("⚔️ Bienvenue dans RPG-CI ⚔️\n")
+HERO = "Héros"
+ENEMY = "Ennemi"
+
+
+def play_verbose(health=Character.MAX_HEALTH, seed=0, out=sys.stdout):
+    """
+    Joue un combat commenté tour par tour
+    
+    Le texte est assemblé en mémoire et écrit en une fois à la fin.
+    
+    Args:
+        health (int): HP de départ des deux combattants
+        seed (int): Graine du tirage de celui qui frappe en premier
+        out: Flux de sortie
+    
+    Returns:
+        Character or None: Le gagnant
+    """
+    lines = ["⚔️ Bienvenue dans RPG-CI ⚔️\n"]
     
     # Création des personnages
-    hero = Character("Héros", health=10)
-    enemy = Character("Ennemi", health=10)
+    hero = Character(HERO, health=health)
+    enemy = Character(ENEMY, health=health)
+    hero.max_health = enemy.max_health = health
     
-    print("Personnages créés:")
-    print(f"- {hero}")
-    print(f"- {enemy}\n")
+    lines.append("Personnages créés:")
+    lines.append(f"- {hero}")
+    lines.append(f"- {enemy}\n")
     
-    # Initialisation du combat
-    combat = Battle(hero, enemy)
-    tour = 0
+    # Tirer au sort qui frappe en premier, comme dans les tournois
+    first, second = (hero, enemy) if random.Random(seed).random() >= 0.5 else (enemy, hero)
+    combat = Battle(first, second)
     
-    print("Début du combat!\n")
+    lines.append("Début du combat!\n")
     
     # Boucle de combat principale
     while not combat.is_battle_over():
-        tour += 1
-        print(f"--- Tour {tour} ---")
-        
-        # Tour du héros
-        if hero.is_alive():
-            print(f"{hero.name} attaque {enemy.name}!")
-            result = combat.execute_turn(hero, enemy)
-            print(f"→ {enemy.name} perd 1 HP (reste: {enemy.health}/10)")
-        
-        # Tour de l'ennemi s'il est encore vivant
-        if enemy.is_alive():
-            print(f"{enemy.name} attaque {hero.name}!")
-            result = combat.execute_turn(enemy, hero)
-            print(f"→ {hero.name} perd 1 HP (reste: {hero.health}/10)")
-        
-        print()
+        lines.append(f"--- Tour {combat.turn_count + 1} ---")
+        for attacker, defender in ((first, second), (second, first)):
+            if combat.is_battle_over():
+                break
+            lines.append(f"{attacker.name} attaque {defender.name}!")
+            result = combat.execute_turn(attacker, defender)
+            lines.append(f"→ {result['defender']} perd {result['damage']} HP "
+                         f"(reste: {result['defender_health']}/{defender.max_health})")
+        lines.append("")
     
     # Résultat final
-    print("\n🏁 Combat terminé!")
+    lines.append("\n🏁 Combat terminé!")
     gagnant = combat.get_winner()
     if gagnant:
-        print(f"🎉 {gagnant.name} remporte la victoire!")
+        lines.append(f"🎉 {gagnant.name} remporte la victoire!")
     else:
-        print("Match nul!")
+        lines.append("Match nul!")
+    
+    out.write('\n'.join(lines) + '\n')
+    return gagnant
+
+
+def play_headless(games, workers=1, seed=0, health=Character.MAX_HEALTH, defend_chance=0.0):
+    """
+    Joue de nombreux combats sans sortie par tour
+    
+    Les combats sont répartis sur des processus par Tournament ; celui qui
+    frappe en premier est tiré au sort à chaque combat.
+    
+    Args:
+        games (int): Nombre de combats
+        workers (int): Nombre de processus
+        seed (int): Graine rendant la série reproductible
+        health (int): HP de départ des deux combattants
+        defend_chance (float): Probabilité de commencer un combat en défense
+    
+    Returns:
+        TournamentResult: Résultats agrégés
+    """
+    tournament = Tournament([(HERO, health), (ENEMY, health)], workers=workers,
+                            seed=seed, defend_chance=defend_chance)
+    return tournament.round_robin(rounds=games)
+
+
+def format_summary(result):
+    """Résumé d'une série de combats : taux de victoire et débit"""
+    lines = [f"{result.duels} combats en {result.elapsed:.2f}s "
+             f"({result.duels_per_second:,.0f} combats/s, "
+             f"{result.turns / result.duels if result.duels else 0:.1f} tours en moyenne)"]
+    for name, wins, losses in result.standings():
+        lines.append(f"- {name}: {wins} victoires, {losses} défaites "
+                     f"({result.win_rate(name):.1%})")
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Combats RPG-CI")
+    parser.add_argument('--games', type=int, default=1,
+                        help="nombre de combats (défaut: 1, commenté)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="nombre de processus pour les séries de combats")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="graine rendant les combats reproductibles")
+    parser.add_argument('--health', type=int, default=Character.MAX_HEALTH,
+                        help="HP de départ des combattants")
+    parser.add_argument('--defend-chance', type=float, default=0.0,
+                        help="probabilité de commencer un combat en défense")
+    parser.add_argument('--quiet', action='store_true',
+                        help="aucune sortie par tour, seulement le résumé")
+    args = parser.parse_args(argv)
+    
+    if args.games < 1:
+        parser.error("--games doit être positif")
+    if args.workers < 1:
+        parser.error("--workers doit être positif")
+    if args.health < 1:
+        parser.error("--health doit être positif")
+    return args
+
+
+def main(argv=None):
+    """Fonction principale du jeu."""
+    args = parse_args(argv)
+    if args.games == 1 and not args.quiet:
+        return play_verbose(args.health, args.seed)
+    
+    result = play_headless(args.games, args.workers, args.seed, args.health, args.defend_chance)
+    print(format_summary(result))
+    return result
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
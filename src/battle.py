@@ -1,38 +1,215 @@
+from .battle_log import BattleLog
+from .character import Character
+
+
 class Battle:
-    def __init__(self, player1, player2):
+    # Methods defining the combat rules the closed-form duel relies on
+    RULE_METHODS = ('attack', 'take_damage', 'is_alive', 'is_dead')
+    
+    def __init__(self, player1, player2, log_enabled=True):
         """
         Initialize a battle between two players.
         
         Args:
             player1: First player/character
             player2: Second player/character
+            log_enabled (bool): Record the battle log (disable for headless runs)
         """
         self.player1 = player1
         self.player2 = player2
         self.turn_count = 0
-        self.battle_log = []
+        self.log_enabled = log_enabled
+        self._log = BattleLog((player1.name, player2.name))
+        self._rendered_log = []
+        self._pending_duel = None
+    
+    @property
+    def log(self):
+        """Structured battle log, filled in for lazily resolved duels."""
+        self._expand_pending_duel()
+        return self._log
+    
+    @property
+    def battle_log(self):
+        """Battle log lines, rendered from the structured log on access."""
+        log = self.log
+        if len(self._rendered_log) < len(log):
+            self._rendered_log.extend(log.render(len(self._rendered_log)))
+        return self._rendered_log
     
     def start_duel(self):
         """Start a duel between the two players."""
-        self.battle_log.append(f"Duel started between {self.player1.name} and {self.player2.name}")
+        if self._has_standard_rules():
+            return self._resolve_duel()
+        
+        log = self.log if self.log_enabled else None
+        if log is not None:
+            log.record(BattleLog.START, self.turn_count, 0, 1)
         
         while self.player1.is_alive() and self.player2.is_alive():
             self.turn_count += 1
             
             # Player 1's turn
             if self.player1.is_alive():
-                damage = self.player1.attack(self.player2)
-                self.battle_log.append(f"Turn {self.turn_count}: {self.player1.name} attacks {self.player2.name} for {damage} damage")
+                old_health = self.player2.health
+                self.player1.attack(self.player2)
+                if log is not None:
+                    log.record(BattleLog.ATTACK, self.turn_count, 0, 1, old_health - self.player2.health)
             
             # Player 2's turn
             if self.player2.is_alive():
-                damage = self.player2.attack(self.player1)
-                self.battle_log.append(f"Turn {self.turn_count}: {self.player2.name} attacks {self.player1.name} for {damage} damage")
+                old_health = self.player1.health
+                self.player2.attack(self.player1)
+                if log is not None:
+                    log.record(BattleLog.ATTACK, self.turn_count, 1, 0, old_health - self.player1.health)
         
         winner = self.player1 if self.player1.is_alive() else self.player2
-        self.battle_log.append(f"Battle ended! Winner: {winner.name}")
+        if log is not None:
+            log.record(BattleLog.END, self.turn_count, 0 if winner is self.player1 else 1)
         return winner
     
+    def _has_standard_rules(self):
+        """Check that the duel outcome can be computed in closed form."""
+        player1, player2 = self.player1, self.player2
+        if player1 is player2:
+            return False
+        
+        for player in (player1, player2):
+            if not isinstance(player, Character):
+                return False
+            player_class = type(player)
+            if any(getattr(player_class, name) is not getattr(Character, name)
+                   for name in self.RULE_METHODS):
+                return False
+            if not isinstance(player.health, int) or not isinstance(player.ATTACK_DAMAGE, int):
+                return False
+            if player.ATTACK_DAMAGE <= 0:
+                return False
+        return True
+    
+    def _resolve_duel(self):
+        """
+        Resolve the duel in O(1) with the same outcome as the turn loop.
+        
+        Player 1 always strikes first, which clears their own defense before
+        player 2 can hit back, so only player 2's defense matters: it halves
+        the first hit it takes (minimum 1).
+        """
+        player1, player2 = self.player1, self.player2
+        start_turn = self.turn_count
+        health1, health2 = player1.health, player2.health
+        damage1, damage2 = player1.ATTACK_DAMAGE, player2.ATTACK_DAMAGE
+        first_hit = max(1, damage1 // 2) if player2.is_defending else damage1
+        turns = 0
+        
+        if player1.is_alive() and player2.is_alive():
+            hits_to_kill_player2 = 1 + max(0, -(-(health2 - first_hit) // damage1))
+            hits_to_kill_player1 = -(-health1 // damage2)
+            
+            if hits_to_kill_player2 <= hits_to_kill_player1:
+                turns = hits_to_kill_player2
+                player1_health = health1 - (turns - 1) * damage2
+                player2_health = 0
+            else:
+                turns = hits_to_kill_player1
+                player1_health = 0
+                player2_health = health2 - first_hit - (turns - 1) * damage1
+            
+            player1.is_defending = False
+            player2.is_defending = False
+            player1.health = player1_health
+            player2.health = player2_health
+            self.turn_count += turns
+        
+        winner = player1 if player1.is_alive() else player2
+        if self.log_enabled:
+            self._expand_pending_duel()
+            self._pending_duel = (start_turn, turns, winner is player1, health1, health2,
+                                  first_hit, damage1, damage2)
+        return winner
+    
+    def _expand_pending_duel(self):
+        """Write the records of a lazily resolved duel into the log."""
+        if self._pending_duel is None:
+            return
+        start_turn, turns, player1_won, health1, health2, first_hit, damage1, damage2 = self._pending_duel
+        self._pending_duel = None
+        
+        log = self._log
+        log.record(BattleLog.START, start_turn, 0, 1)
+        hit = first_hit
+        for turn in range(start_turn + 1, start_turn + turns + 1):
+            dealt = min(hit, health2)
+            health2 -= dealt
+            hit = damage1
+            log.record(BattleLog.ATTACK, turn, 0, 1, dealt)
+            if health2 > 0:
+                dealt = min(damage2, health1)
+                health1 -= dealt
+                log.record(BattleLog.ATTACK, turn, 1, 0, dealt)
+        log.record(BattleLog.END, start_turn + turns, 0 if player1_won else 1)
+    
+    def execute_turn(self, attacker, defender):
+        """
+        Have one player attack the other, for turn-by-turn battles.
+        
+        Player 1 opens each turn, so a new turn starts whenever player 1
+        attacks.
+        
+        Args:
+            attacker: The attacking player (player1 or player2)
+            defender: The other player
+        
+        Returns:
+            dict: success, attacker and defender names, actual damage dealt,
+                defender's remaining health and whether the battle is over
+        
+        Raises:
+            ValueError: If the players are not the two sides of this battle
+        """
+        if (attacker, defender) not in ((self.player1, self.player2), (self.player2, self.player1)):
+            raise ValueError("Both players must be the two sides of this battle")
+        
+        log = self.log if self.log_enabled else None
+        if log is not None and not len(log):
+            log.record(BattleLog.START, self.turn_count, 0, 1)
+        attacker_index = 0 if attacker is self.player1 else 1
+        if attacker_index == 0:
+            self.turn_count += 1
+        
+        old_health = defender.health
+        success = not self.is_battle_over() and attacker.attack(defender)
+        damage = old_health - defender.health
+        if log is not None and success:
+            log.record(BattleLog.ATTACK, self.turn_count, attacker_index, 1 - attacker_index, damage)
+        
+        over = self.is_battle_over()
+        if log is not None and success and over:
+            log.record(BattleLog.END, self.turn_count, 0 if self.get_winner() is self.player1 else 1)
+        
+        return {
+            'success': success,
+            'attacker': attacker.name,
+            'defender': defender.name,
+            'damage': damage,
+            'defender_health': defender.health,
+            'battle_over': over
+        }
+    
+    def is_battle_over(self):
+        """Check whether one of the players is dead."""
+        return not (self.player1.is_alive() and self.player2.is_alive())
+    
+    def get_winner(self):
+        """Return the surviving player, or None while the battle goes on or if both are dead."""
+        if not self.is_battle_over():
+            return None
+        if self.player1.is_alive():
+            return self.player1
+        if self.player2.is_alive():
+            return self.player2
+        return None
+    
     def get_battle_stats(self):
         """Get battle statistics."""
         return {
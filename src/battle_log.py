@@ -0,0 +1,74 @@
+from array import array
+
+
+class BattleLog:
+    """
+    Structured battle log stored as typed columns.
+    
+    Each record is (kind, turn, attacker, defender, damage), where attacker
+    and defender are indices into ``names``. Human-readable lines are only
+    built by ``render``.
+    """
+    
+    START = 0
+    ATTACK = 1
+    END = 2
+    
+    # Wording of the START record
+    START_TEXT = "Duel started between {} and {}"
+    
+    def __init__(self, names):
+        """
+        Initialize an empty log.
+        
+        Args:
+            names: Combatant names, indexed by the attacker/defender columns
+        """
+        self.names = names
+        self.kinds = array('b')
+        self.turns = array('l')
+        self.attackers = array('l')
+        self.defenders = array('l')
+        self.damages = array('l')
+    
+    def __len__(self):
+        return len(self.kinds)
+    
+    def __iter__(self):
+        return zip(self.kinds, self.turns, self.attackers, self.defenders, self.damages)
+    
+    def record(self, kind, turn, attacker, defender=-1, damage=0):
+        """Append one record."""
+        self.kinds.append(kind)
+        self.turns.append(turn)
+        self.attackers.append(attacker)
+        self.defenders.append(defender)
+        self.damages.append(damage)
+    
+    def clear(self):
+        """Drop every record."""
+        for column in (self.kinds, self.turns, self.attackers, self.defenders, self.damages):
+            del column[:]
+    
+    def render(self, start=0):
+        """
+        Render records as log lines.
+        
+        Args:
+            start (int): Index of the first record to render
+        
+        Returns:
+            list: One string per record
+        """
+        names = self.names
+        lines = []
+        for kind, turn, attacker, defender, damage in zip(
+                self.kinds[start:], self.turns[start:], self.attackers[start:],
+                self.defenders[start:], self.damages[start:]):
+            if kind == self.ATTACK:
+                lines.append(f"Turn {turn}: {names[attacker]} attacks {names[defender]} for {damage} damage")
+            elif kind == self.START:
+                lines.append(self.START_TEXT.format(names[attacker], names[defender]))
+            else:
+                lines.append(f"Battle ended! Winner: {names[attacker]}")
+        return lines
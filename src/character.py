@@ -12,6 +12,10 @@ class Character:
     ATTACK_DAMAGE = 1
     HEAL_AMOUNT = 2
     
+    # Pas de __dict__ par instance : les grosses listes de personnages
+    # coûtent nettement moins de mémoire
+    __slots__ = ('name', '_health', '_max_health', '_is_defending', '_listeners')
+    
     def __init__(self, name, health=None):
         """
         Initialise un nouveau personnage
@@ -23,10 +27,68 @@ class Character:
         if not name or not isinstance(name, str):
             raise ValueError("Le nom doit être une chaîne non vide")
             
+        self._listeners = ()
         self.name = name
-        self.health = health if health is not None else self.MAX_HEALTH
-        self.max_health = self.MAX_HEALTH
-        self.is_defending = False
+        self._health = health if health is not None else self.MAX_HEALTH
+        self._max_health = self.MAX_HEALTH
+        self._is_defending = False
+    
+    @property
+    def health(self):
+        """Points de vie actuels"""
+        return self._health
+    
+    @health.setter
+    def health(self, value):
+        old_health = self._health
+        self._health = value
+        if self._listeners and value != old_health:
+            self._notify('health', old_health, value)
+    
+    @property
+    def max_health(self):
+        """Points de vie maximum"""
+        return self._max_health
+    
+    @max_health.setter
+    def max_health(self, value):
+        old_value = self._max_health
+        self._max_health = value
+        if self._listeners and value != old_value:
+            self._notify('max_health', old_value, value)
+    
+    @property
+    def is_defending(self):
+        """Indique si le personnage est en position défensive"""
+        return self._is_defending
+    
+    @is_defending.setter
+    def is_defending(self, value):
+        old_value = self._is_defending
+        self._is_defending = value
+        if self._listeners and value != old_value:
+            self._notify('is_defending', old_value, value)
+    
+    def add_listener(self, listener):
+        """
+        Abonne un observateur aux changements d'état du personnage
+        
+        Args:
+            listener (callable): Appelé avec (personnage, attribut, ancienne
+                valeur, nouvelle valeur) à chaque changement
+        """
+        if not self._listeners:
+            self._listeners = []
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """Désabonne un observateur précédemment ajouté"""
+        self._listeners.remove(listener)
+    
+    def _notify(self, attribute, old_value, new_value):
+        """Prévient les observateurs d'un changement d'attribut"""
+        for listener in self._listeners:
+            listener(self, attribute, old_value, new_value)
     
     def is_alive(self):
         """Vérifie si le personnage est vivant"""
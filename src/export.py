@@ -0,0 +1,249 @@
+"""
+Export en flux de l'historique et des résultats d'une partie
+
+Deux formats, écrits par paquets de taille fixe pour que la mémoire utilisée
+ne dépende pas du nombre d'entrées :
+
+- JSON lignes : une entrée par ligne, compressée en gzip si le chemin se
+  termine par .gz.
+- Colonnes : un répertoire avec un fichier binaire par champ et un
+  manifest.json qui décrit chaque colonne. Les entiers sont des int64
+  petit-boutistes, les booléens des int8, et les chaînes sont codées par
+  dictionnaire en int32, le dictionnaire étant dans le manifeste. Une
+  valeur absente vaut la valeur null de sa colonne. Une colonne se relit
+  avec numpy.fromfile(chemin, dtype).
+"""
+import gzip
+import json
+import os
+import sys
+from array import array
+from itertools import islice
+
+# Colonnes par défaut d'un historique : (champ, type)
+HISTORY_COLUMNS = (
+    ('turn', 'int'),
+    ('player', 'str'),
+    ('action', 'str'),
+    ('target', 'str'),
+    ('success', 'bool'),
+    ('damage_dealt', 'int'),
+    ('target_health', 'int'),
+    ('health_restored', 'int'),
+    ('current_health', 'int'),
+)
+
+# Colonnes par défaut des résultats (iter_results)
+RESULT_COLUMNS = (
+    ('rank', 'int'),
+    ('name', 'str'),
+    ('health', 'int'),
+    ('max_health', 'int'),
+    ('is_alive', 'bool'),
+)
+
+# Type de tableau, dtype numpy et valeur null de chaque type de colonne
+_KINDS = {
+    'int': ('q', '<i8', -2 ** 63),
+    'bool': ('b', '<i1', -1),
+    'str': ('i', '<i4', -1),
+}
+
+MANIFEST = 'manifest.json'
+FORMAT_VERSION = 1
+
+
+def _chunks(entries, chunk_size):
+    if chunk_size < 1:
+        raise ValueError("La taille des paquets doit être positive")
+    entries = iter(entries)
+    return iter(lambda: list(islice(entries, chunk_size)), [])
+
+
+def iter_results(game):
+    """
+    Résultats d'une partie, un par joueur dans l'ordre du classement
+    
+    Yields:
+        dict: rank, name, health, max_health et is_alive
+    """
+    for rank, player in enumerate(game.leaderboard, 1):
+        yield {
+            'rank': rank,
+            'name': player.name,
+            'health': player.health,
+            'max_health': player.max_health,
+            'is_alive': player.is_alive()
+        }
+
+
+def write_jsonl(entries, path, chunk_size=10_000):
+    """
+    Écrit des entrées en JSON lignes
+    
+    Args:
+        entries (iterable): Dictionnaires à écrire, par exemple
+            Game.iter_history()
+        path (str): Fichier de sortie (.gz pour le compresser)
+        chunk_size (int): Entrées sérialisées par écriture
+    
+    Returns:
+        int: Nombre d'entrées écrites
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    count = 0
+    with opener(path, 'wt', encoding='utf-8') as file:
+        for chunk in _chunks(entries, chunk_size):
+            file.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in chunk))
+            count += len(chunk)
+    return count
+
+
+class _Column:
+    """Colonne en cours d'écriture : tampon du paquet courant et fichier"""
+    
+    def __init__(self, field, kind, directory):
+        if kind not in _KINDS:
+            raise ValueError(f"Type de colonne inconnu: {kind}")
+        self.field = field
+        self.kind = kind
+        self.typecode, self.dtype, self.null = _KINDS[kind]
+        self.filename = f"{field}.bin"
+        self.file = open(os.path.join(directory, self.filename), 'wb')
+        self.values = array(self.typecode)
+        self.dictionary = {} if kind == 'str' else None
+    
+    def append(self, value):
+        if value is None:
+            self.values.append(self.null)
+        elif self.dictionary is not None:
+            code = self.dictionary.get(value)
+            if code is None:
+                code = self.dictionary[value] = len(self.dictionary)
+            self.values.append(code)
+        else:
+            self.values.append(int(value))
+    
+    def flush(self):
+        if sys.byteorder == 'big':
+            self.values.byteswap()
+        self.values.tofile(self.file)
+        self.values = array(self.typecode)
+    
+    def describe(self):
+        column = {'file': self.filename, 'type': self.kind, 'dtype': self.dtype, 'null': self.null}
+        if self.dictionary is not None:
+            column['dictionary'] = list(self.dictionary)
+        return column
+
+
+def write_columnar(entries, directory, columns=HISTORY_COLUMNS, chunk_size=16_384):
+    """
+    Écrit des entrées en colonnes, un fichier par champ
+    
+    Seuls les dictionnaires des colonnes de chaînes grandissent avec les
+    données, avec le nombre de valeurs distinctes.
+    
+    Args:
+        entries (iterable): Dictionnaires à écrire
+        directory (str): Répertoire de sortie, créé si besoin
+        columns (iterable): Couples (champ, type) avec type 'int', 'bool'
+            ou 'str'
+        chunk_size (int): Entrées accumulées avant chaque écriture
+    
+    Returns:
+        int: Nombre d'entrées écrites
+    
+    Raises:
+        ValueError: Si un type de colonne est inconnu
+    """
+    os.makedirs(directory, exist_ok=True)
+    writers = []
+    try:
+        for field, kind in columns:
+            writers.append(_Column(field, kind, directory))
+        
+        count = 0
+        for chunk in _chunks(entries, chunk_size):
+            for writer in writers:
+                field = writer.field
+                append = writer.append
+                for entry in chunk:
+                    append(entry.get(field))
+                writer.flush()
+            count += len(chunk)
+    finally:
+        for writer in writers:
+            writer.file.close()
+    
+    manifest = {
+        'version': FORMAT_VERSION,
+        'rows': count,
+        'chunk_size': chunk_size,
+        'columns': {writer.field: writer.describe() for writer in writers}
+    }
+    # Le manifeste est écrit en dernier : sa présence marque un export complet
+    with open(os.path.join(directory, MANIFEST), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False)
+    return count
+
+
+def read_columnar(directory, fields=None):
+    """
+    Relit des colonnes écrites par write_columnar
+    
+    Les chaînes sont décodées, et les valeurs absentes rendues par None.
+    
+    Args:
+        directory (str): Répertoire de l'export
+        fields (iterable, optional): Champs à relire (défaut: tous)
+    
+    Returns:
+        dict: Liste des valeurs de chaque champ
+    """
+    with open(os.path.join(directory, MANIFEST), encoding='utf-8') as file:
+        manifest = json.load(file)
+    
+    result = {}
+    for field, column in manifest['columns'].items():
+        if fields is not None and field not in fields:
+            continue
+        values = array(_KINDS[column['type']][0])
+        with open(os.path.join(directory, column['file']), 'rb') as file:
+            values.fromfile(file, manifest['rows'])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        
+        null = column['null']
+        dictionary = column.get('dictionary')
+        if dictionary is not None:
+            result[field] = [None if code == null else dictionary[code] for code in values]
+        elif column['type'] == 'bool':
+            result[field] = [None if value == null else bool(value) for value in values]
+        else:
+            result[field] = [None if value == null else value for value in values]
+    return result
+
+
+def export_history(game, path, format='jsonl', chunk_size=None):
+    """
+    Exporte l'historique d'une partie
+    
+    Args:
+        game (Game): La partie
+        path (str): Fichier (jsonl) ou répertoire (columnar) de sortie
+        format (str): 'jsonl' ou 'columnar'
+        chunk_size (int, optional): Entrées par paquet écrit
+    
+    Returns:
+        int: Nombre d'entrées écrites
+    
+    Raises:
+        ValueError: Si le format est inconnu
+    """
+    options = {} if chunk_size is None else {'chunk_size': chunk_size}
+    if format == 'jsonl':
+        return write_jsonl(game.iter_history(), path, **options)
+    if format == 'columnar':
+        return write_columnar(game.iter_history(), path, **options)
+    raise ValueError(f"Format d'export inconnu: {format}")
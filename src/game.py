@@ -1,4 +1,33 @@
+import bisect
+import gc
+from functools import partial
+from operator import itemgetter
+
+import numpy as np
+
 from .character import Character
+from .history import HistoryStore
+from .leaderboard import Leaderboard
+from .transposition import DEFENDING, HEALTH, SIDE_TO_MOVE, zobrist_key, zobrist_keys
+
+
+class UndoToken:
+    """
+    Jeton rendu par Game.apply, à passer à Game.undo pour annuler l'action
+    
+    Attributes:
+        result (dict): Résultat de l'action, comme pour execute_action
+    """
+    
+    __slots__ = ('result', '_turn_count', '_game_over', '_winner', '_saved')
+    
+    def __init__(self, result, turn_count, game_over, winner, saved):
+        self.result = result
+        self._turn_count = turn_count
+        self._game_over = game_over
+        self._winner = winner
+        self._saved = saved
+
 
 class Game:
     """
@@ -10,13 +39,86 @@ class Game:
     - Déterminer le gagnant
     """
     
-    def __init__(self):
-        """Initialise une nouvelle partie"""
+    # Champs de Character.get_status suivis pour les deltas d'état
+    STATUS_FIELDS = ('name', 'health', 'max_health', 'is_alive', 'is_defending', 'health_percentage')
+    
+    def __init__(self, history_limit=None, history_segment_size=None, history_dir=None):
+        """
+        Initialise une nouvelle partie
+        
+        Args:
+            history_limit (int, optional): Entrées d'historique gardées en
+                mémoire, les plus anciennes étant déversées sur disque
+                (défaut: tout garder en mémoire)
+            history_segment_size (int, optional): Entrées par segment sur disque
+            history_dir (str, optional): Répertoire des segments d'historique
+        """
         self.players = []
+        # Index par nom et identifiants stables, tenus à jour avec players
+        self._players_by_name = {}
+        self._players_by_id = {}
+        # Identifiants dans l'ordre de players, croissants : la place d'un
+        # joueur retiré se trouve par dichotomie
+        self._player_order = []
+        self._player_ids = {}
+        self._next_player_id = 0
+        self._player_listeners = {}
+        # Joueurs vivants et morts par identifiant, mis à jour à chaque
+        # changement de santé pour que la fin de partie se teste en O(1)
+        self._alive = {}
+        self._dead = {}
+        self._alive_sorted = True
+        self._dead_sorted = True
+        self.leaderboard = Leaderboard()
+        # Suivi des modifications : chaque changement d'un joueur incrémente
+        # version, ce qui permet de servir un état en cache ou un delta
+        self.version = 0
+        self._field_versions = {}
+        self._changed_players = {}
+        self._removed_players = []
+        self._statuses = {}
+        self._dirty_players = set()
+        self._state_players = None
+        self._state_positions = {}
+        self._cached_state = None
+        self._cached_state_key = None
         self.turn_count = 0
+        self._undo_stack = []
+        # Hachage de Zobrist des santés et défenses, tenu à jour par les observateurs
+        self._players_hash = 0
         self.game_over = False
         self.winner = None
-        self.history = []
+        self.history = HistoryStore(history_limit, history_segment_size, history_dir)
+        # Observateurs des événements de la partie (journal, etc.)
+        self._listeners = []
+    
+    def add_listener(self, listener):
+        """
+        Abonne un observateur aux événements de la partie
+        
+        L'observateur est appelé avec (partie, événement, données) après
+        chaque événement enregistré dans l'historique :
+        - 'player_added' : {'name', 'health'}
+        - 'players_added' : {'players'}, les personnages créés
+        - 'player_removed' : {'name'}
+        - 'action' : {'player', 'action', 'target', 'amount', 'result'},
+          pour execute_action comme pour execute_actions
+        
+        Les actions de apply, annulables et hors historique, ne sont pas
+        signalées.
+        
+        Args:
+            listener (callable): L'observateur
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """Désabonne un observateur des événements de la partie"""
+        self._listeners.remove(listener)
+    
+    def _emit(self, event, data):
+        for listener in self._listeners:
+            listener(self, event, data)
     
     def add_player(self, name, health=None):
         """
@@ -36,21 +138,91 @@ class Game:
             raise ValueError("Le nom du joueur doit être une chaîne non vide")
         
         # Vérifier que le nom n'existe pas déjà
-        if any(player.name == name for player in self.players):
+        if name in self._players_by_name:
             raise ValueError(f"Un joueur nommé '{name}' existe déjà")
         
         player = Character(name, health)
-        self.players.append(player)
+        self._register_player(player)
         
         self.history.append({
             'turn': self.turn_count,
             'action': 'player_added',
             'player': name,
+            'health': player.health,
             'details': f"{name} rejoint la partie avec {player.health} HP"
         })
+        if self._listeners:
+            self._emit('player_added', {'name': name, 'health': player.health})
         
         return player
     
+    def add_players(self, players, on_duplicate='error'):
+        """
+        Ajoute des joueurs en bloc
+        
+        Les joueurs sont validés et dédoublonnés en un seul passage, puis
+        inscrits ensemble. Un seul événement 'players_added' est ajouté à
+        l'historique : un résumé (nombre de joueurs, premier et dernier
+        identifiant), qui ne recopie pas le roster. Les observateurs
+        (add_listener) reçoivent les personnages créés. En cas d'erreur,
+        aucun joueur n'est ajouté.
+        
+        Args:
+            players (iterable): Noms ou tuples (nom, HP) des joueurs
+            on_duplicate (str): 'error' pour refuser un nom déjà pris,
+                'skip' pour ignorer le doublon
+        
+        Returns:
+            list: Les personnages créés, dans l'ordre
+        
+        Raises:
+            ValueError: Si un nom est invalide, ou déjà pris avec 'error'
+        """
+        if on_duplicate not in ('error', 'skip'):
+            raise ValueError(f"Traitement des doublons inconnu: {on_duplicate}")
+        
+        # Les millions d'objets créés déclencheraient des collectes répétées
+        # du ramasse-miettes, chacune parcourant tous les objets déjà créés
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            created = self._create_players(players, on_duplicate)
+            if created:
+                first_id = self._next_player_id
+                self._register_players(created)
+                self.history.append({
+                    'turn': self.turn_count,
+                    'action': 'players_added',
+                    'count': len(created),
+                    'first_player_id': first_id,
+                    'last_player_id': self._next_player_id - 1,
+                    'details': f"{len(created)} joueurs rejoignent la partie"
+                })
+                if self._listeners:
+                    self._emit('players_added', {'players': created})
+        finally:
+            if gc_enabled:
+                gc.enable()
+        
+        return created
+    
+    def _create_players(self, players, on_duplicate):
+        """Valide et dédoublonne les joueurs en un passage, et crée leurs personnages"""
+        existing = self._players_by_name
+        seen = set()
+        created = []
+        for entry in players:
+            name, health = (entry, None) if isinstance(entry, str) else entry
+            if not name or not isinstance(name, str):
+                raise ValueError("Le nom du joueur doit être une chaîne non vide")
+            if name in existing or name in seen:
+                if on_duplicate == 'skip':
+                    continue
+                raise ValueError(f"Un joueur nommé '{name}' existe déjà")
+            seen.add(name)
+            created.append(Character(name, health))
+        return created
+    
     def get_player(self, name):
         """
         Récupère un joueur par son nom
@@ -61,20 +233,260 @@ class Game:
         Returns:
             Character or None: Le joueur trouvé
         """
-        return next((player for player in self.players if player.name == name), None)
+        return self._players_by_name.get(name)
+    
+    def get_player_id(self, name):
+        """
+        Retourne l'identifiant entier stable d'un joueur
+        
+        Args:
+            name (str): Nom du joueur
+            
+        Returns:
+            int or None: L'identifiant, ou None si le joueur n'existe pas
+        """
+        return self._player_ids.get(name)
+    
+    def get_player_by_id(self, player_id):
+        """
+        Récupère un joueur par son identifiant
+        
+        Args:
+            player_id (int): Identifiant du joueur
+            
+        Returns:
+            Character or None: Le joueur trouvé
+        """
+        return self._players_by_id.get(player_id)
+    
+    def remove_player(self, name):
+        """
+        Retire un joueur de la partie
+        
+        Args:
+            name (str): Nom du joueur
+            
+        Returns:
+            Character: Le joueur retiré
+            
+        Raises:
+            ValueError: Si le joueur n'existe pas
+        """
+        player = self._unregister_player(name)
+        if player is None:
+            raise ValueError(f"Aucun joueur nommé '{name}'")
+        
+        self.history.append({
+            'turn': self.turn_count,
+            'action': 'player_removed',
+            'player': name,
+            'details': f"{name} quitte la partie"
+        })
+        if self._listeners:
+            self._emit('player_removed', {'name': name})
+        
+        return player
+    
+    def _register_player(self, player, player_id=None):
+        """Inscrit un personnage dans la liste et les index, sans historique"""
+        if player_id is None:
+            player_id = self._next_player_id
+        self._next_player_id = max(self._next_player_id, player_id + 1)
+        
+        self.players.append(player)
+        self._player_order.append(player_id)
+        self._players_by_name[player.name] = player
+        self._players_by_id[player_id] = player
+        self._player_ids[player.name] = player_id
+        
+        if player.is_alive():
+            self._alive[player_id] = player
+        else:
+            self._dead[player_id] = player
+        
+        self.leaderboard.add(player_id, player)
+        self._players_hash ^= self._player_hash(player_id, player)
+        self.version += 1
+        self._field_versions[player_id] = dict.fromkeys(self.STATUS_FIELDS, self.version)
+        self._changed_players[player_id] = self.version
+        self._dirty_players.add(player_id)
+        self._state_players = None
+        
+        listener = partial(self._on_player_changed, player_id)
+        self._player_listeners[player_id] = listener
+        player.add_listener(listener)
+        return player_id
+    
+    def _register_players(self, players):
+        """Inscrit des personnages comme _register_player, en une seule version"""
+        if not players:
+            return
+        first_id = self._next_player_id
+        self._next_player_id = first_id + len(players)
+        self.version += 1
+        version = self.version
+        initial_fields = dict.fromkeys(self.STATUS_FIELDS, version)
+        
+        players_by_name = self._players_by_name
+        players_by_id = self._players_by_id
+        player_ids = self._player_ids
+        alive = self._alive
+        dead = self._dead
+        field_versions = self._field_versions
+        changed_players = self._changed_players
+        listeners = self._player_listeners
+        on_changed = self._on_player_changed
+        
+        for player_id, player in enumerate(players, first_id):
+            players_by_name[player.name] = player
+            players_by_id[player_id] = player
+            player_ids[player.name] = player_id
+            if player.is_alive():
+                alive[player_id] = player
+            else:
+                dead[player_id] = player
+            field_versions[player_id] = initial_fields.copy()
+            changed_players[player_id] = version
+            listener = listeners[player_id] = partial(on_changed, player_id)
+            player.add_listener(listener)
+        
+        self.players.extend(players)
+        self._player_order.extend(range(first_id, self._next_player_id))
+        # Clés de Zobrist calculées en bloc plutôt qu'une à une
+        player_ids = np.arange(first_id, self._next_player_id)
+        healths = [player.health for player in players]
+        defending = [player.is_defending for player in players]
+        self._players_hash ^= int(np.bitwise_xor.reduce(zobrist_keys(player_ids, HEALTH, healths)))
+        self._players_hash ^= int(np.bitwise_xor.reduce(
+            zobrist_keys(player_ids[defending], DEFENDING), initial=np.uint64(0)))
+        self.leaderboard.add_many(enumerate(players, first_id))
+        self._dirty_players.update(range(first_id, self._next_player_id))
+        self._state_players = None
+    
+    def _unregister_player(self, name):
+        """Retire un personnage de la liste et des index, sans historique"""
+        player = self._players_by_name.pop(name, None)
+        if player is None:
+            return None
+        
+        player_id = self._player_ids.pop(name)
+        del self._players_by_id[player_id]
+        self._alive.pop(player_id, None)
+        self._dead.pop(player_id, None)
+        self.leaderboard.remove(player_id)
+        self._players_hash ^= self._player_hash(player_id, player)
+        player.remove_listener(self._player_listeners.pop(player_id))
+        self._remove_from_list(player, player_id)
+        
+        self.version += 1
+        del self._field_versions[player_id]
+        self._changed_players.pop(player_id, None)
+        self._statuses.pop(player_id, None)
+        self._dirty_players.discard(player_id)
+        self._removed_players.append((self.version, name))
+        self._state_players = None
+        return player
+    
+    def _remove_from_list(self, player, player_id):
+        """Retire un joueur de players, trouvé par dichotomie sur les identifiants"""
+        players = self.players
+        order = self._player_order
+        index = bisect.bisect_left(order, player_id)
+        if index < len(players) and players[index] is player and order[index] == player_id:
+            del players[index]
+            del order[index]
+            return
+        # players a été modifiée hors de la partie : recherche linéaire
+        players.remove(player)
+        ids = self._player_ids
+        self._player_order = [ids.get(other.name, -1) for other in players]
+    
+    def _on_player_changed(self, player_id, player, attribute, old_value, new_value):
+        """Tient à jour le suivi des modifications, le classement et les vivants/morts"""
+        self.version += 1
+        fields = self._field_versions[player_id]
+        self._changed_players.pop(player_id, None)
+        self._changed_players[player_id] = self.version
+        self._dirty_players.add(player_id)
+        
+        if attribute != 'health':
+            fields[attribute] = self.version
+            if attribute == 'max_health':
+                fields['health_percentage'] = self.version
+            elif attribute == 'is_defending':
+                self._players_hash ^= zobrist_key(player_id, DEFENDING)
+            return
+        
+        self._players_hash ^= zobrist_key(player_id, HEALTH, old_value) ^ zobrist_key(player_id, HEALTH, new_value)
+        fields['health'] = fields['health_percentage'] = self.version
+        self.leaderboard.update(player_id, new_value)
+        if (old_value > 0) == (new_value > 0):
+            return
+        
+        fields['is_alive'] = self.version
+        
+        if new_value > 0:
+            del self._dead[player_id]
+            self._alive_sorted = self._alive_sorted and self._is_last_id(self._alive, player_id)
+            self._alive[player_id] = player
+        else:
+            del self._alive[player_id]
+            self._dead_sorted = self._dead_sorted and self._is_last_id(self._dead, player_id)
+            self._dead[player_id] = player
+    
+    @staticmethod
+    def _player_hash(player_id, player):
+        """Part d'un joueur dans le hachage de la position"""
+        key = zobrist_key(player_id, HEALTH, player.health)
+        if player.is_defending:
+            key ^= zobrist_key(player_id, DEFENDING)
+        return key
+    
+    @property
+    def state_hash(self):
+        """
+        Hachage de Zobrist de 64 bits de la position
+        
+        Couvre la santé et la défense de chaque joueur ainsi que le joueur au
+        trait (turn_count modulo le nombre de joueurs) : deux suites
+        d'actions menant à la même position donnent le même hachage. Il est
+        tenu à jour en O(1) à chaque changement de santé ou de défense.
+        """
+        side = self.turn_count % len(self.players) if self.players else 0
+        return self._players_hash ^ zobrist_key(side, SIDE_TO_MOVE)
+    
+    @staticmethod
+    def _is_last_id(players_by_id, player_id):
+        """Vérifie qu'un ajout en fin de dictionnaire garde l'ordre des ids"""
+        return not players_by_id or next(reversed(players_by_id)) < player_id
     
     def get_alive_players(self):
         """Retourne la liste des joueurs vivants"""
-        return [player for player in self.players if player.is_alive()]
+        if not self._alive_sorted:
+            self._alive = dict(sorted(self._alive.items()))
+            self._alive_sorted = True
+        return list(self._alive.values())
     
     def get_dead_players(self):
         """Retourne la liste des joueurs morts"""
-        return [player for player in self.players if player.is_dead()]
+        if not self._dead_sorted:
+            self._dead = dict(sorted(self._dead.items()))
+            self._dead_sorted = True
+        return list(self._dead.values())
+    
+    @property
+    def alive_count(self):
+        """Nombre de joueurs vivants"""
+        return len(self._alive)
+    
+    @property
+    def dead_count(self):
+        """Nombre de joueurs morts"""
+        return len(self._dead)
     
     def is_game_over(self):
         """Vérifie si la partie est terminée"""
-        alive_players = self.get_alive_players()
-        return len(alive_players) <= 1
+        return len(self._alive) <= 1
     
     def get_winner(self):
         """
@@ -83,11 +495,10 @@ class Game:
         Returns:
             Character or None: Le gagnant ou None si pas de gagnant
         """
-        if not self.is_game_over():
+        if len(self._alive) != 1:
             return None
         
-        alive_players = self.get_alive_players()
-        return alive_players[0] if alive_players else None
+        return next(iter(self._alive.values()))
     
     def execute_action(self, player_name, action, target_name=None, amount=None):
         """
@@ -102,6 +513,131 @@ class Game:
         Returns:
             dict: Résultat de l'action
         """
+        result = self._execute_action(player_name, action, target_name, amount, self.history.append)
+        if self._listeners:
+            self._emit_action(player_name, action, target_name, amount, result)
+        return result
+    
+    def _emit_action(self, player_name, action, target_name, amount, result):
+        self._emit('action', {'player': player_name, 'action': action, 'target': target_name,
+                              'amount': amount, 'result': result})
+    
+    def iter_history(self, start=0, actions=None):
+        """
+        Parcourt l'historique sans le copier
+        
+        Args:
+            start (int): Indice de la première entrée
+            actions (iterable, optional): Types d'action gardés (défaut: tous)
+        
+        Yields:
+            dict: Les entrées, dans l'ordre
+        """
+        entries = self.history.iter_from(start)
+        if actions is None:
+            yield from entries
+            return
+        actions = frozenset(actions)
+        for entry in entries:
+            if entry.get('action') in actions:
+                yield entry
+    
+    def execute_actions(self, actions):
+        """
+        Exécute un flux d'actions, avec la même sémantique qu'une suite
+        d'appels à execute_action
+        
+        Les résultats sont produits un par un, ce qui permet de traiter un
+        flux de taille quelconque en mémoire constante. Chaque entrée
+        d'historique est ajoutée avant que son résultat soit produit, si bien
+        qu'un flux abandonné en cours laisse une partie cohérente. La lecture
+        du flux s'arrête dès que la partie est terminée.
+        
+        Args:
+            actions (iterable): Tuples (joueur, action, cible, montant), la
+                cible et le montant étant facultatifs
+            
+        Yields:
+            dict: Résultat de chaque action
+        """
+        execute = self._execute_action
+        record = self.history.append
+        for player_name, action, *arguments in actions:
+            target_name = arguments[0] if arguments else None
+            amount = arguments[1] if len(arguments) > 1 else None
+            
+            result = execute(player_name, action, target_name, amount, record)
+            if self._listeners:
+                self._emit_action(player_name, action, target_name, amount, result)
+            
+            yield result
+            if result.get('game_over'):
+                return
+    
+    def apply(self, action):
+        """
+        Exécute une action de façon réversible, sans l'ajouter à l'historique
+        
+        Destiné à l'exploration de coups (IA) : apply puis undo laissent la
+        partie exactement dans son état de départ, sans la copier. Les
+        annulations se font dans l'ordre inverse des applications.
+        
+        Args:
+            action (tuple): (joueur, action, cible, montant), la cible et le
+                montant étant facultatifs
+            
+        Returns:
+            UndoToken: Jeton d'annulation, dont result est le résultat de
+                l'action
+        """
+        player_name, action_name, *arguments = action
+        target_name = arguments[0] if arguments else None
+        amount = arguments[1] if len(arguments) > 1 else None
+        
+        # Seuls l'acteur et sa cible peuvent changer
+        saved = []
+        for name in (player_name, target_name):
+            player = self._players_by_name.get(name)
+            if player is not None:
+                saved.append((player, player.health, player.is_defending))
+        
+        token = UndoToken(None, self.turn_count, self.game_over, self.winner, saved)
+        token.result = self._execute_action(player_name, action_name, target_name, amount,
+                                            self._discard_entry)
+        self._undo_stack.append(token)
+        return token
+    
+    def undo(self, token):
+        """
+        Annule une action exécutée par apply
+        
+        Restaure la santé et la défense des joueurs concernés, le compteur de
+        tours, la fin de partie et le gagnant.
+        
+        Args:
+            token (UndoToken): Jeton de la dernière action appliquée
+            
+        Raises:
+            ValueError: Si le jeton n'est pas celui de la dernière action
+                appliquée et pas encore annulée
+        """
+        if not self._undo_stack or self._undo_stack[-1] is not token:
+            raise ValueError("Seule la dernière action appliquée peut être annulée")
+        self._undo_stack.pop()
+        
+        for player, health, is_defending in reversed(token._saved):
+            player.health = health
+            player.is_defending = is_defending
+        self.turn_count = token._turn_count
+        self.game_over = token._game_over
+        self.winner = token._winner
+    
+    @staticmethod
+    def _discard_entry(entry):
+        pass
+    
+    def _execute_action(self, player_name, action, target_name, amount, record):
+        """Exécute une action et passe son entrée d'historique à record"""
         if self.is_game_over():
             return {
                 'success': False,
@@ -170,7 +706,7 @@ class Game:
         self.turn_count += 1
         
         # Ajouter à l'historique
-        self.history.append(result.copy())
+        record(result.copy())
         
         # Vérifier fin de partie
         if self.is_game_over():
@@ -185,28 +721,123 @@ class Game:
         """
         Retourne l'état complet de la partie
         
+        L'état est mis en cache : seuls les statuts des joueurs modifiés
+        depuis le dernier appel sont recalculés. Chaque appel rend des
+        copies des statuts, que l'appelant peut modifier sans toucher au
+        cache.
+        
         Returns:
             dict: État de la partie
         """
+        key = (self.version, self.turn_count, len(self.history))
+        if key != self._cached_state_key:
+            self._cached_state = self._summary()
+            self._cached_state['players'] = self._player_statuses()
+            self._cached_state_key = key
+        
+        state = dict(self._cached_state)
+        state['players'] = [dict(status) for status in state['players']]
+        return state
+    
+    def get_state_delta(self, since_version):
+        """
+        Retourne ce qui a changé depuis une version de l'état
+        
+        Le résumé de la partie est toujours inclus ; seuls les joueurs
+        modifiés depuis since_version sont listés, avec leur nom et les
+        seuls champs qui ont changé.
+        
+        Args:
+            since_version (int): Version connue du client (0 pour tout)
+            
+        Returns:
+            dict: Résumé, 'version' courante, 'players' modifiés et
+                'removed_players' retirés depuis since_version
+        """
+        changed = []
+        for player_id, version in reversed(self._changed_players.items()):
+            if version <= since_version:
+                break
+            player = self._players_by_id[player_id]
+            status = player.get_status()
+            delta = {'name': player.name}
+            for field, field_version in self._field_versions[player_id].items():
+                if field_version > since_version:
+                    delta[field] = status[field]
+            changed.append((player_id, delta))
+        changed.sort(key=lambda item: item[0])
+        
+        start = bisect.bisect_right(self._removed_players, since_version, key=itemgetter(0))
+        delta = self._summary()
+        delta.update({
+            'version': self.version,
+            'since_version': since_version,
+            'players': [player_delta for _, player_delta in changed],
+            'removed_players': [name for _, name in self._removed_players[start:]]
+        })
+        return delta
+    
+    def _summary(self):
+        """Champs de l'état de la partie qui ne dépendent pas des joueurs un à un"""
+        winner = self.get_winner()
         return {
             'turn_count': self.turn_count,
             'total_players': len(self.players),
-            'alive_players': len(self.get_alive_players()),
-            'dead_players': len(self.get_dead_players()),
-            'players': [player.get_status() for player in self.players],
+            'alive_players': len(self._alive),
+            'dead_players': len(self._dead),
             'game_over': self.is_game_over(),
-            'winner': self.get_winner().name if self.get_winner() else None,
+            'winner': winner.name if winner else None,
             'history_length': len(self.history)
         }
     
-    def get_leaderboard(self):
+    def _player_statuses(self):
+        """Liste des statuts des joueurs, en ne recalculant que les modifiés"""
+        statuses = self._statuses
+        for player_id in self._dirty_players:
+            statuses[player_id] = self._players_by_id[player_id].get_status()
+        
+        if self._state_players is None:
+            ids = self._player_ids
+            order = [ids[player.name] for player in self.players]
+            self._state_players = [statuses[player_id] for player_id in order]
+            self._state_positions = {player_id: position for position, player_id in enumerate(order)}
+        else:
+            positions = self._state_positions
+            for player_id in self._dirty_players:
+                self._state_players[positions[player_id]] = statuses[player_id]
+        
+        self._dirty_players.clear()
+        return self._state_players
+    
+    def get_leaderboard(self, limit=None):
         """
         Retourne le classement des joueurs par HP
         
+        Le classement est tenu à jour à chaque changement de santé ; à HP
+        égaux, les joueurs gardent leur ordre d'arrivée.
+        
+        Args:
+            limit (int, optional): Nombre de joueurs retournés (défaut: tous)
+            
         Returns:
             list: Joueurs triés par HP décroissant
         """
-        return sorted(self.players, key=lambda p: p.health, reverse=True)
+        if limit is not None:
+            return self.leaderboard.top_k(limit)
+        return list(self.leaderboard)
+    
+    def get_player_rank(self, name):
+        """
+        Retourne le rang d'un joueur dans le classement (1 pour le premier)
+        
+        Args:
+            name (str): Nom du joueur
+            
+        Returns:
+            int or None: Le rang, ou None si le joueur n'existe pas
+        """
+        player_id = self._player_ids.get(name)
+        return None if player_id is None else self.leaderboard.rank_of(player_id)
     
     def simulate_turn(self, player_name, target_name, action):
         """
@@ -0,0 +1,184 @@
+import bisect
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import weakref
+from itertools import islice
+
+
+class HistoryStore:
+    """
+    Historique de partie borné en mémoire
+    
+    Les entrées récentes restent en mémoire dans une liste, indexée en
+    O(1). Quand elle dépasse memory_limit, les plus anciennes sont écrites
+    dans des segments JSONL compressés (gzip), en ajout seul, sur le disque
+    local, puis retirées de la tête de la liste par paquet de segment_size.
+    L'itération, l'indexation et len() couvrent les deux niveaux.
+    
+    Les entrées relues depuis le disque sont des copies : les modifier ne
+    change pas l'historique.
+    """
+    
+    def __init__(self, memory_limit=None, segment_size=None, spill_dir=None):
+        """
+        Initialise l'historique
+        
+        Args:
+            memory_limit (int, optional): Nombre maximum d'entrées gardées en
+                mémoire (défaut: illimité)
+            segment_size (int, optional): Nombre d'entrées par segment écrit
+                sur disque (défaut: un quart de memory_limit)
+            spill_dir (str, optional): Répertoire des segments (défaut:
+                répertoire temporaire)
+        
+        Raises:
+            ValueError: Si les limites sont invalides
+        """
+        if memory_limit is not None and memory_limit < 1:
+            raise ValueError("La limite mémoire doit être positive")
+        if segment_size is None and memory_limit is not None:
+            segment_size = max(1, memory_limit // 4)
+        if segment_size is not None and not 1 <= segment_size <= (memory_limit or segment_size):
+            raise ValueError("La taille de segment doit être entre 1 et la limite mémoire")
+        
+        self.memory_limit = memory_limit
+        self.segment_size = segment_size
+        self.spill_dir = spill_dir
+        self._recent = []
+        self._segments = []
+        self._segment_starts = []
+        self._spilled = 0
+        self._directory = None
+        self._cached_segment = (None, None)
+    
+    def __len__(self):
+        return self._spilled + len(self._recent)
+    
+    def __iter__(self):
+        return self.iter_from(0)
+    
+    def iter_from(self, start=0):
+        """
+        Itère sur les entrées à partir de l'indice start
+        
+        Les segments entièrement avant start ne sont pas relus, chaque
+        segment est décodé ligne à ligne et les entrées en mémoire sont
+        lues sur place, sans copie : la mémoire utilisée ne dépend pas de
+        la longueur de l'historique. Les entrées ajoutées pendant
+        l'itération sont produites aussi ; si des entrées sont déversées
+        sur disque entre-temps, la lecture reprend dans leur segment.
+        """
+        if start < 0:
+            start = max(0, start + len(self))
+        index = start
+        while index < len(self):
+            if index < self._spilled:
+                segment = bisect.bisect_right(self._segment_starts, index) - 1
+                entries = self._read_segment(self._segments[segment])
+                for entry in islice(entries, index - self._segment_starts[segment], None):
+                    yield entry
+                    index += 1
+                continue
+            
+            # Lecture sur place, tant qu'aucun déversement ne décale la liste
+            recent = self._recent
+            spilled = self._spilled
+            position = index - spilled
+            while position < len(recent) and self._spilled == spilled:
+                yield recent[position]
+                position += 1
+            index = spilled + position
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Indice d'historique hors limites")
+        
+        if index >= self._spilled:
+            return self._recent[index - self._spilled]
+        
+        segment = bisect.bisect_right(self._segment_starts, index) - 1
+        return self._load_segment(segment)[index - self._segment_starts[segment]]
+    
+    def __repr__(self):
+        return f"HistoryStore(len={len(self)}, in_memory={len(self._recent)})"
+    
+    def append(self, entry):
+        """Ajoute une entrée, en déversant les plus anciennes si nécessaire"""
+        self._recent.append(entry)
+        if self.memory_limit is not None and len(self._recent) > self.memory_limit:
+            self._spill()
+    
+    def extend(self, entries):
+        """Ajoute plusieurs entrées"""
+        for entry in entries:
+            self.append(entry)
+    
+    @property
+    def in_memory(self):
+        """Nombre d'entrées gardées en mémoire"""
+        return len(self._recent)
+    
+    def close(self):
+        """Supprime les segments écrits sur disque et vide l'historique"""
+        if self._directory is not None:
+            self._finalizer()
+            self._directory = None
+        self._recent.clear()
+        self._segments.clear()
+        self._segment_starts.clear()
+        self._spilled = 0
+        self._cached_segment = (None, None)
+    
+    def _spill(self):
+        """Écrit les entrées les plus anciennes dans un nouveau segment"""
+        if self._directory is None:
+            if self.spill_dir is not None:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            self._directory = tempfile.mkdtemp(prefix='rpg-history-', dir=self.spill_dir)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._directory, True)
+        
+        count = max(len(self._recent) - self.memory_limit, self.segment_size)
+        path = os.path.join(self._directory, f"segment-{len(self._segments):06d}.jsonl.gz")
+        with gzip.open(path, 'wt', encoding='utf-8') as segment:
+            for entry in islice(self._recent, count):
+                segment.write(json.dumps(entry, ensure_ascii=False))
+                segment.write('\n')
+        del self._recent[:count]
+        
+        self._segments.append(path)
+        self._segment_starts.append(self._spilled)
+        self._spilled += count
+    
+    @staticmethod
+    def _read_segment(path):
+        with gzip.open(path, 'rt', encoding='utf-8') as segment:
+            for line in segment:
+                yield json.loads(line)
+    
+    def _load_segment(self, segment):
+        """Décode un segment entier, en gardant le dernier en cache"""
+        cached_index, entries = self._cached_segment
+        if cached_index != segment:
+            entries = list(self._read_segment(self._segments[segment]))
+            self._cached_segment = (segment, entries)
+        return entries
+    
+    def __getstate__(self):
+        return {
+            'memory_limit': self.memory_limit,
+            'segment_size': self.segment_size,
+            'spill_dir': self.spill_dir,
+            'entries': list(self)
+        }
+    
+    def __setstate__(self, state):
+        self.__init__(state['memory_limit'], state['segment_size'], state['spill_dir'])
+        self.extend(state['entries'])
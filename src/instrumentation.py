@@ -0,0 +1,309 @@
+"""
+Instrumentation facultative des actions de jeu
+
+Instrumentation.instrument() remplace, sur une instance donnée seulement,
+Game.execute_action, Game.simulate_turn ou Battle.start_duel par une
+version mesurée. Les instances non instrumentées appellent directement
+les méthodes de la classe : l'instrumentation désactivée ne coûte rien.
+
+Usage:
+    stats = Instrumentation(slow_threshold=0.005, on_slow=print)
+    stats.instrument(game, label="partie-1")
+    ...
+    print(stats.to_prometheus())
+"""
+import bisect
+import random
+import sys
+import time
+import weakref
+from functools import partial, wraps
+
+# Bornes supérieures des seaux de latence, en secondes
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+# Méthodes instrumentées et position de l'argument donnant le type d'action
+INSTRUMENTED_METHODS = {
+    'execute_action': ('action', 1),
+    'simulate_turn': ('action', 2),
+    'start_duel': (None, None),
+}
+
+# Types d'action étiquetés tels quels ; les autres, venus par exemple d'un
+# client, partagent l'étiquette OTHER_ACTION pour borner le nombre de séries
+KNOWN_ACTIONS = frozenset(('attack', 'defend', 'heal'))
+OTHER_ACTION = 'other'
+
+# Marque l'absence d'attribut d'instance avant instrumentation
+_MISSING = object()
+
+
+class ActionStats:
+    """Compteurs, histogramme de latence et allocations d'un type d'action"""
+    
+    __slots__ = ('count', 'errors', 'total_seconds', 'max_seconds', 'allocated_blocks', 'buckets')
+    
+    def __init__(self, bucket_count):
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.allocated_blocks = 0
+        # Un seau de plus pour les durées au-delà de la dernière borne
+        self.buckets = [0] * (bucket_count + 1)
+    
+    def to_dict(self, bounds):
+        cumulative = 0
+        histogram = {}
+        for bound, count in zip(list(bounds) + [float('inf')], self.buckets):
+            cumulative += count
+            histogram[bound] = cumulative
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.count if self.count else 0.0,
+            'max_seconds': self.max_seconds,
+            'allocated_blocks': self.allocated_blocks,
+            'histogram': histogram
+        }
+
+
+class Instrumentation:
+    """
+    Statistiques par partie, par méthode et par type d'action
+    
+    Chaque appel instrumenté est compté, chronométré et rangé dans un
+    histogramme de latence ; le nombre net de blocs mémoire alloués pendant
+    l'appel est cumulé si track_allocations est vrai. Un appel plus lent que
+    slow_threshold est signalé à on_slow, avec le profil de l'appel s'il a
+    été échantillonné par le profileur.
+    """
+    
+    def __init__(self, buckets=DEFAULT_BUCKETS, track_allocations=True, slow_threshold=None,
+                 on_slow=None, profiler=None, profile_rate=0.01, seed=None):
+        """
+        Initialise l'instrumentation
+        
+        Args:
+            buckets (iterable): Bornes supérieures des seaux de latence (s)
+            track_allocations (bool): Compter les blocs mémoire alloués
+            slow_threshold (float, optional): Durée (s) à partir de laquelle
+                un appel est signalé à on_slow
+            on_slow (callable, optional): Appelé avec un dict décrivant
+                l'appel lent (label, operation, action, seconds, args,
+                profile)
+            profiler (callable, optional): Fabrique d'un profileur utilisable
+                comme gestionnaire de contexte, par exemple cProfile.Profile
+            profile_rate (float): Fraction des appels exécutés sous le
+                profileur
+            seed (int, optional): Graine de l'échantillonnage du profileur
+        
+        Raises:
+            ValueError: Si les bornes ou le taux sont invalides
+        """
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets or self.buckets[0] <= 0:
+            raise ValueError("Les bornes des seaux doivent être positives")
+        if not 0 <= profile_rate <= 1:
+            raise ValueError("Le taux d'échantillonnage doit être entre 0 et 1")
+        
+        self.track_allocations = track_allocations
+        self.slow_threshold = slow_threshold
+        self.on_slow = on_slow
+        self.profiler = profiler
+        self.profile_rate = profile_rate
+        self.stats = {}
+        self._random = random.Random(seed)
+        self._instrumented = weakref.WeakKeyDictionary()
+    
+    def instrument(self, target, label='default'):
+        """
+        Instrumente une partie ou un combat
+        
+        Args:
+            target (Game or Battle): L'objet à instrumenter
+            label (str): Nom de l'objet dans les statistiques
+        
+        Returns:
+            L'objet instrumenté
+        
+        Raises:
+            ValueError: Si l'objet n'a aucune méthode instrumentable
+        """
+        methods = [name for name in INSTRUMENTED_METHODS if hasattr(type(target), name)]
+        if not methods:
+            raise ValueError(f"Rien à instrumenter sur {type(target).__name__}")
+        
+        self.uninstrument(target)
+        # Attribut d'instance remplacé (ou _MISSING) et enveloppe, par méthode
+        replaced = {}
+        for name in methods:
+            previous = target.__dict__.get(name, _MISSING)
+            wrapper = self._wrap(target, previous, label, name)
+            replaced[name] = (previous, wrapper)
+            setattr(target, name, wrapper)
+        self._instrumented[target] = replaced
+        return target
+    
+    def uninstrument(self, target):
+        """
+        Rend à un objet les méthodes qu'il avait avant instrument()
+        
+        Un attribut d'instance déjà posé (une autre enveloppe, par exemple)
+        est rétabli. Une méthode enveloppée depuis par un autre code est
+        laissée en place, pour ne pas lui retirer son enveloppe.
+        """
+        for name, (previous, wrapper) in self._instrumented.pop(target, {}).items():
+            if target.__dict__.get(name) is not wrapper:
+                continue
+            if previous is _MISSING:
+                del target.__dict__[name]
+            else:
+                target.__dict__[name] = previous
+    
+    def is_instrumented(self, target):
+        return target in self._instrumented
+    
+    def reset(self):
+        """Remet les statistiques à zéro"""
+        self.stats.clear()
+    
+    def _wrap(self, target, previous, label, operation):
+        # L'enveloppe, gardée dans _instrumented, ne doit pas tenir l'objet en
+        # vie : elle appelle la méthode de la classe sur une référence faible
+        keyword, position = INSTRUMENTED_METHODS[operation]
+        function = getattr(type(target), operation) if previous is _MISSING else None
+        target_ref = weakref.ref(target)
+        
+        @wraps(previous if function is None else function)
+        def wrapper(*args, **kwargs):
+            if keyword is None:
+                action = operation
+            else:
+                if keyword in kwargs:
+                    action = kwargs[keyword]
+                elif len(args) > position:
+                    action = args[position]
+                else:
+                    action = None
+                if not (isinstance(action, str) and action in KNOWN_ACTIONS):
+                    action = OTHER_ACTION
+            method = previous if function is None else partial(function, target_ref())
+            return self._call(method, label, operation, action, args, kwargs)
+        
+        return wrapper
+    
+    def _call(self, method, label, operation, action, args, kwargs):
+        profile = None
+        if self.profiler is not None and self._random.random() < self.profile_rate:
+            profile = self.profiler()
+        
+        blocks = sys.getallocatedblocks() if self.track_allocations else 0
+        failed = True
+        start = time.perf_counter()
+        try:
+            if profile is None:
+                result = method(*args, **kwargs)
+            else:
+                with profile:
+                    result = method(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            if self.track_allocations:
+                blocks = sys.getallocatedblocks() - blocks
+            self._record(label, operation, action, elapsed, blocks, failed)
+            if self.slow_threshold is not None and elapsed >= self.slow_threshold and self.on_slow is not None:
+                self.on_slow({
+                    'label': label,
+                    'operation': operation,
+                    'action': action,
+                    'seconds': elapsed,
+                    'args': args,
+                    'profile': profile
+                })
+    
+    def _record(self, label, operation, action, elapsed, blocks, failed):
+        key = (label, operation, action)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = ActionStats(len(self.buckets))
+        stats.count += 1
+        stats.errors += failed
+        stats.total_seconds += elapsed
+        if elapsed > stats.max_seconds:
+            stats.max_seconds = elapsed
+        stats.allocated_blocks += blocks
+        stats.buckets[bisect.bisect_left(self.buckets, elapsed)] += 1
+    
+    def to_dict(self):
+        """
+        Exporte les statistiques
+        
+        Returns:
+            dict: {label: {operation: {action: statistiques}}}, l'histogramme
+                étant cumulatif par borne supérieure
+        """
+        exported = {}
+        for (label, operation, action), stats in self.stats.items():
+            exported.setdefault(label, {}).setdefault(operation, {})[action] = stats.to_dict(self.buckets)
+        return exported
+    
+    def to_prometheus(self, prefix='rpg'):
+        """
+        Exporte les statistiques au format texte de Prometheus
+        
+        Args:
+            prefix (str): Préfixe des noms de métriques
+        
+        Returns:
+            str: Les métriques, une par ligne
+        """
+        lines = [
+            f"# HELP {prefix}_actions_total Appels instrumentés",
+            f"# TYPE {prefix}_actions_total counter",
+        ]
+        rows = sorted(self.stats.items())
+        for key, stats in rows:
+            lines.append(f"{prefix}_actions_total{{{_labels(key)}}} {stats.count}")
+        
+        lines += [
+            f"# HELP {prefix}_action_errors_total Appels terminés par une exception",
+            f"# TYPE {prefix}_action_errors_total counter",
+        ]
+        for key, stats in rows:
+            lines.append(f"{prefix}_action_errors_total{{{_labels(key)}}} {stats.errors}")
+        
+        lines += [
+            f"# HELP {prefix}_action_allocated_blocks_total Blocs mémoire alloués (net) pendant les appels",
+            f"# TYPE {prefix}_action_allocated_blocks_total counter",
+        ]
+        for key, stats in rows:
+            lines.append(f"{prefix}_action_allocated_blocks_total{{{_labels(key)}}} {stats.allocated_blocks}")
+        
+        name = f"{prefix}_action_duration_seconds"
+        lines += [
+            f"# HELP {name} Durée des appels instrumentés",
+            f"# TYPE {name} histogram",
+        ]
+        for key, stats in rows:
+            labels = _labels(key)
+            for bound, cumulative in stats.to_dict(self.buckets)['histogram'].items():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {stats.total_seconds!r}")
+            lines.append(f"{name}_count{{{labels}}} {stats.count}")
+        
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(key):
+    label, operation, action = key
+    pairs = (('game', label), ('operation', operation), ('action', action))
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in pairs)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,292 @@
+"""
+Journal d'actions en ajout seul, pour relancer les parties après un arrêt brutal
+
+Chaque ligne du fichier est un enregistrement JSON :
+    {"op": "create", "game": 1, "turn_count": 0, "players": [[nom, HP, défense], ...]}
+    {"op": "add_player", "game": 1, "name": "Alice", "health": 10}
+    {"op": "add_players", "game": 1, "players": [[nom, HP], ...]}
+    {"op": "remove_player", "game": 1, "name": "Alice"}
+    {"op": "action", "game": 1, "player": "Alice", "action": "attack", "target": "Bob", "amount": null}
+    {"op": "close", "game": 1}
+
+Seules les actions acceptées (success) sont journalisées. Rejouer le journal
+dans l'ordre reconstruit chaque partie, historique compris. Une dernière
+ligne incomplète, laissée par un arrêt en pleine écriture, est ignorée puis
+tronquée à la réouverture.
+"""
+import json
+import os
+import time
+from .character import Character
+from .game import Game
+
+# Niveaux de durabilité
+NONE = 'none'      # écrit dans le cache du système, jamais de fsync
+GROUP = 'group'    # fsync groupé, par paquet d'enregistrements ou délai
+ALWAYS = 'always'  # fsync après chaque enregistrement
+
+DURABILITY_LEVELS = (NONE, GROUP, ALWAYS)
+
+
+class Journal:
+    """
+    Journal d'écriture anticipée des parties
+    
+    En durabilité 'group', les enregistrements s'accumulent et un seul fsync
+    couvre tout un paquet : dès group_size enregistrements, dès que le plus
+    ancien attend depuis group_interval secondes, ou à l'appel de commit().
+    Un serveur qui ne répond qu'après commit() garantit que toute action
+    confirmée survit à un arrêt brutal.
+    """
+    
+    def __init__(self, path, durability=GROUP, group_size=256, group_interval=0.01):
+        """
+        Ouvre (ou crée) un journal en ajout seul
+        
+        Utiliser Journal.open pour retrouver aussi les parties journalisées.
+        
+        Args:
+            path (str): Chemin du fichier
+            durability (str): 'none', 'group' ou 'always'
+            group_size (int): Enregistrements par fsync groupé
+            group_interval (float): Attente maximale (s) d'un enregistrement
+                avant fsync groupé
+        
+        Raises:
+            ValueError: Si la durabilité ou la taille des paquets est invalide
+        """
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Durabilité inconnue: {durability}")
+        if group_size < 1:
+            raise ValueError("La taille des paquets doit être positive")
+        
+        self.path = path
+        self.durability = durability
+        self.group_size = group_size
+        self.group_interval = group_interval
+        self.records = 0
+        self.syncs = 0
+        self.games = {}
+        self._ids = {}
+        self._listeners = {}
+        self.next_game_id = 1
+        self._pending = 0
+        self._oldest_pending = 0.0
+        
+        _truncate_torn_tail(path)
+        self._file = open(path, 'ab')
+    
+    @classmethod
+    def open(cls, path, **options):
+        """
+        Ouvre un journal en rejouant les parties qu'il contient
+        
+        Les parties retrouvées sont dans games, rattachées au journal sous
+        leur identifiant d'origine.
+        
+        Args:
+            path (str): Chemin du fichier
+            **options: Arguments passés au constructeur
+        
+        Returns:
+            Journal: Le journal, prêt à recevoir de nouveaux enregistrements
+        """
+        games, next_game_id = _replay(path)
+        journal = cls(path, **options)
+        journal.next_game_id = next_game_id
+        for game_id, game in games.items():
+            journal.attach(game, game_id, record=False)
+        return journal
+    
+    def attach(self, game, game_id=None, record=True):
+        """
+        Journalise une partie
+        
+        L'état courant de la partie est enregistré, puis chaque ajout ou
+        retrait de joueur et chaque action acceptée, qu'elle passe par
+        execute_action ou execute_actions. Le journal s'abonne aux
+        événements de la partie (Game.add_listener) sans toucher à ses
+        méthodes.
+        
+        Args:
+            game (Game): La partie
+            game_id (int, optional): Identifiant (défaut: le suivant libre)
+            record (bool): Enregistrer l'état de départ de la partie
+        
+        Returns:
+            int: L'identifiant de la partie dans le journal
+        
+        Raises:
+            ValueError: Si l'identifiant ou la partie est déjà journalisé
+        """
+        if game in self._ids:
+            raise ValueError("Cette partie est déjà journalisée")
+        if game_id is None:
+            game_id = self.next_game_id
+        if game_id in self.games:
+            raise ValueError(f"Partie {game_id} déjà journalisée")
+        self.next_game_id = max(self.next_game_id, game_id + 1)
+        
+        if record:
+            self._write({
+                'op': 'create',
+                'game': game_id,
+                'turn_count': game.turn_count,
+                'players': [[player.name, player.health, player.is_defending]
+                            for player in game.players]
+            })
+        listener = self._listeners[game] = self._listener(game_id)
+        game.add_listener(listener)
+        self.games[game_id] = game
+        self._ids[game] = game_id
+        return game_id
+    
+    def detach(self, game):
+        """
+        Arrête de journaliser une partie, qui ne sera plus retrouvée
+        
+        Args:
+            game (Game): La partie
+        """
+        game_id = self._ids.pop(game)
+        del self.games[game_id]
+        game.remove_listener(self._listeners.pop(game))
+        self._write({'op': 'close', 'game': game_id})
+    
+    def game_id(self, game):
+        """Identifiant d'une partie journalisée, ou None"""
+        return self._ids.get(game)
+    
+    def _listener(self, game_id):
+        write = self._write
+        
+        def listener(game, event, data):
+            if event == 'action':
+                if data['result'].get('success'):
+                    write({'op': 'action', 'game': game_id, 'player': data['player'],
+                           'action': data['action'], 'target': data['target'],
+                           'amount': data['amount']})
+            elif event == 'player_added':
+                write({'op': 'add_player', 'game': game_id, 'name': data['name'],
+                       'health': data['health']})
+            elif event == 'players_added':
+                write({'op': 'add_players', 'game': game_id,
+                       'players': [[player.name, player.health] for player in data['players']]})
+            elif event == 'player_removed':
+                write({'op': 'remove_player', 'game': game_id, 'name': data['name']})
+        return listener
+    
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.records += 1
+        
+        if self.durability == ALWAYS:
+            self._sync()
+        elif self.durability == GROUP:
+            if not self._pending:
+                self._oldest_pending = time.monotonic()
+            self._pending += 1
+            if (self._pending >= self.group_size
+                    or time.monotonic() - self._oldest_pending >= self.group_interval):
+                self._sync()
+    
+    def commit(self):
+        """
+        Rend durables les enregistrements en attente
+        
+        Sans effet en durabilité 'none' au-delà du vidage du tampon Python.
+        """
+        if self.durability == NONE:
+            self._file.flush()
+        elif self._pending:
+            self._sync()
+    
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.syncs += 1
+        self._pending = 0
+    
+    def close(self):
+        """Valide les enregistrements en attente et ferme le fichier"""
+        if self._file.closed:
+            return
+        if self.durability != NONE and self._pending:
+            self._sync()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def recover(path):
+    """
+    Reconstruit les parties d'un journal, sans le rouvrir en écriture
+    
+    Args:
+        path (str): Chemin du journal
+    
+    Returns:
+        dict: Parties encore ouvertes, par identifiant
+    """
+    return _replay(path)[0]
+
+
+def _replay(path):
+    """Rejoue un journal et renvoie (parties par identifiant, identifiant suivant)"""
+    games = {}
+    next_game_id = 1
+    if not os.path.exists(path):
+        return games, next_game_id
+    
+    with open(path, 'rb') as file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                break  # Écriture interrompue par l'arrêt
+            record = json.loads(line)
+            op = record['op']
+            game_id = record['game']
+            
+            if op == 'create':
+                next_game_id = max(next_game_id, game_id + 1)
+                game = games[game_id] = Game()
+                for name, health, is_defending in record['players']:
+                    player = Character(name, health)
+                    player.is_defending = is_defending
+                    game._register_player(player)
+                game.turn_count = record['turn_count']
+            elif op == 'close':
+                games.pop(game_id, None)
+            elif op == 'add_player':
+                games[game_id].add_player(record['name'], record['health'])
+            elif op == 'add_players':
+                games[game_id].add_players(record['players'])
+            elif op == 'remove_player':
+                games[game_id].remove_player(record['name'])
+            else:
+                games[game_id].execute_action(record['player'], record['action'],
+                                              record['target'], record['amount'])
+    return games, next_game_id
+
+
+def _truncate_torn_tail(path):
+    """Coupe une dernière ligne incomplète pour que l'ajout reparte proprement"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r+b') as file:
+        size = file.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            start = max(0, end - 4096)
+            file.seek(start)
+            chunk = file.read(end - start)
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        if end != size:
+            file.truncate(end)
@@ -0,0 +1,160 @@
+import bisect
+from itertools import chain, islice
+
+
+class Leaderboard:
+    """
+    Classement des joueurs tenu trié par santé décroissante
+    
+    Les égalités sont départagées par identifiant croissant, c'est-à-dire
+    par ordre d'arrivée dans la partie, comme le tri stable de la liste des
+    joueurs.
+    
+    Les clés (-santé, identifiant) sont rangées dans une liste de seaux
+    triés d'au plus 2 * LOAD clés, avec la plus grande clé de chaque seau.
+    Une mise à jour cherche son seau puis sa place par dichotomie et ne
+    déplace que les clés de ce seau : O(log n + LOAD) au lieu de O(n) pour
+    une seule liste. rank_of additionne en plus la taille des seaux qui
+    précèdent, et top_k et in_health_range ne parcourent que leur résultat.
+    """
+    
+    # Taille visée des seaux
+    LOAD = 1000
+    
+    def __init__(self):
+        self._buckets = []
+        self._maxes = []
+        self._players = {}
+        self._health = {}
+    
+    def __len__(self):
+        return len(self._health)
+    
+    def __iter__(self):
+        players = self._players
+        return (players[player_id] for _, player_id in chain.from_iterable(self._buckets))
+    
+    def _insert(self, key):
+        buckets, maxes = self._buckets, self._maxes
+        if not buckets:
+            buckets.append([key])
+            maxes.append(key)
+            return
+        
+        index = bisect.bisect_left(maxes, key)
+        if index == len(maxes):
+            index -= 1
+            buckets[index].append(key)
+            maxes[index] = key
+        else:
+            bisect.insort(buckets[index], key)
+        
+        bucket = buckets[index]
+        if len(bucket) > 2 * self.LOAD:
+            # Un seau trop plein est coupé en deux
+            buckets.insert(index + 1, bucket[self.LOAD:])
+            del bucket[self.LOAD:]
+            maxes.insert(index, bucket[-1])
+    
+    def _delete(self, key):
+        buckets, maxes = self._buckets, self._maxes
+        index = bisect.bisect_left(maxes, key)
+        bucket = buckets[index]
+        del bucket[bisect.bisect_left(bucket, key)]
+        if bucket:
+            maxes[index] = bucket[-1]
+        else:
+            del buckets[index]
+            del maxes[index]
+    
+    def _position(self, key):
+        """Indice du seau et position dans ce seau de la première clé >= key"""
+        index = bisect.bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return index, 0
+        return index, bisect.bisect_left(self._buckets[index], key)
+    
+    def _keys_from(self, key):
+        """Clés du classement à partir de la première clé >= key"""
+        index, position = self._position(key)
+        buckets = self._buckets
+        if index == len(buckets):
+            return iter(())
+        return chain(islice(buckets[index], position, None),
+                     chain.from_iterable(islice(buckets, index + 1, None)))
+    
+    def add(self, player_id, player):
+        """Ajoute un joueur au classement"""
+        self._players[player_id] = player
+        self._health[player_id] = player.health
+        self._insert((-player.health, player_id))
+    
+    def add_many(self, players):
+        """
+        Ajoute des joueurs au classement en un seul tri
+        
+        Args:
+            players (iterable): Couples (identifiant, joueur)
+        """
+        keys = list(chain.from_iterable(self._buckets))
+        for player_id, player in players:
+            self._players[player_id] = player
+            self._health[player_id] = player.health
+            keys.append((-player.health, player_id))
+        # Le tri fusionne les deux suites déjà ordonnées en temps linéaire
+        keys.sort()
+        load = self.LOAD
+        self._buckets = [keys[start:start + load] for start in range(0, len(keys), load)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+    
+    def remove(self, player_id):
+        """Retire un joueur du classement"""
+        health = self._health.pop(player_id)
+        del self._players[player_id]
+        self._delete((-health, player_id))
+    
+    def update(self, player_id, health):
+        """Replace un joueur après un changement de santé"""
+        old_health = self._health[player_id]
+        if health == old_health:
+            return
+        self._delete((-old_health, player_id))
+        self._insert((-health, player_id))
+        self._health[player_id] = health
+    
+    def top_k(self, k):
+        """
+        Retourne les k premiers du classement
+        
+        Args:
+            k (int): Nombre de joueurs
+        
+        Returns:
+            list: Les joueurs, du plus au moins en santé
+        """
+        return list(islice(self, max(0, k)))
+    
+    def rank_of(self, player_id):
+        """
+        Retourne le rang d'un joueur (1 pour le premier)
+        
+        Raises:
+            KeyError: Si le joueur n'est pas classé
+        """
+        index, position = self._position((-self._health[player_id], player_id))
+        return sum(map(len, islice(self._buckets, index))) + position + 1
+    
+    def in_health_range(self, low, high):
+        """
+        Retourne les joueurs dont la santé est entre low et high inclus
+        
+        Returns:
+            list: Les joueurs, dans l'ordre du classement
+        """
+        players = self._players
+        result = []
+        for health, player_id in self._keys_from((-high,)):
+            if health > -low:
+                break
+            result.append(players[player_id])
+        return result
@@ -0,0 +1,206 @@
+"""
+Générateur de charge local pour GameServer
+
+Usage:
+    python -m src.load_client --games 100 --actions 100000 --connections 8
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+
+from .server import GameServer, ServerError
+
+
+class GameClient:
+    """Client du protocole JSON ligne par ligne, avec requêtes en pipeline"""
+    
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._receiver = asyncio.create_task(self._receive())
+    
+    @classmethod
+    async def connect(cls, address):
+        """
+        Ouvre une connexion
+        
+        Args:
+            address (tuple or str): (hôte, port) ou chemin d'un socket Unix
+        """
+        if isinstance(address, str):
+            reader, writer = await asyncio.open_unix_connection(address)
+        else:
+            reader, writer = await asyncio.open_connection(*address)
+        return cls(reader, writer)
+    
+    async def request(self, op, **params):
+        """
+        Envoie une requête et attend sa réponse
+        
+        Returns:
+            Le résultat de la requête
+        
+        Raises:
+            ServerError: Si le serveur renvoie une erreur
+        """
+        if self._receiver.done():
+            raise ConnectionError("Connexion fermée")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(json.dumps({'id': request_id, 'op': op, **params}).encode('utf-8') + b'\n')
+        await self._writer.drain()
+        return await future
+    
+    async def close(self):
+        """Ferme la connexion"""
+        self._writer.close()
+        await self._receiver
+    
+    async def _receive(self):
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._pending.pop(response['id'], None)
+                if future is None:
+                    # Réponse sans requête associée, par exemple un refus de connexion
+                    error = ServerError(response.get('error', 'Réponse inattendue'))
+                    for future in self._pending.values():
+                        future.set_exception(error)
+                    self._pending.clear()
+                elif response['ok']:
+                    future.set_result(response['result'])
+                else:
+                    future.set_exception(ServerError(response['error']))
+        except ConnectionError:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connexion fermée"))
+
+
+async def run_load(address, games=10, players_per_game=4, actions=10_000,
+                   connections=4, concurrency=64, seed=0):
+    """
+    Envoie une charge d'actions à un serveur et mesure débit et latences
+    
+    Args:
+        address (tuple or str): Adresse du serveur
+        games (int): Nombre de parties créées
+        players_per_game (int): Joueurs par partie
+        actions (int): Nombre total d'actions envoyées
+        connections (int): Nombre de connexions ouvertes
+        concurrency (int): Requêtes en vol par connexion
+        seed (int): Graine du choix des actions
+    
+    Returns:
+        dict: Actions envoyées, durée, actions par seconde, latences p50/p99 (ms)
+    """
+    clients = [await GameClient.connect(address) for _ in range(connections)]
+    rng = random.Random(seed)
+    names = [f"P{i}" for i in range(players_per_game)]
+    
+    game_ids = []
+    for _ in range(games):
+        game_id = (await clients[0].request('create_game'))['game']
+        for name in names:
+            await clients[0].request('add_player', game=game_id, name=name, health=1_000_000)
+        game_ids.append(game_id)
+    
+    plan = []
+    for _ in range(actions):
+        player, target = rng.sample(names, 2)
+        action = rng.choice(('attack', 'attack', 'defend', 'heal'))
+        plan.append((rng.choice(game_ids), player, action, target))
+    
+    latencies = []
+    
+    async def drive(client, share):
+        async def one(game_id, player, action, target):
+            sent = time.perf_counter()
+            await client.request('execute_action', game=game_id, player=player,
+                                 action=action, target=target)
+            latencies.append(time.perf_counter() - sent)
+        
+        pending = set()
+        for item in share:
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            pending.add(asyncio.create_task(one(*item)))
+        if pending:
+            await asyncio.gather(*pending)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(drive(client, plan[index::connections])
+                           for index, client in enumerate(clients)))
+    elapsed = time.perf_counter() - start
+    
+    for client in clients:
+        await client.close()
+    
+    latencies.sort()
+    return {
+        'actions': len(latencies),
+        'elapsed': elapsed,
+        'actions_per_second': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000
+    }
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def _main(args):
+    server = None
+    if args.unix:
+        address = args.unix
+    elif args.port:
+        address = (args.host, args.port)
+    else:
+        server = GameServer()
+        address = await server.start()
+    
+    try:
+        stats = await run_load(address, args.games, args.players, args.actions,
+                               args.connections, args.concurrency, args.seed)
+    finally:
+        if server is not None:
+            await server.close()
+    
+    print(f"{stats['actions']} actions en {stats['elapsed']:.2f}s: "
+          f"{stats['actions_per_second']:,.0f} actions/s, "
+          f"p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Générateur de charge pour GameServer")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="port d'un serveur existant (défaut: serveur local)")
+    parser.add_argument('--unix', help="chemin du socket Unix d'un serveur existant")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--actions', type=int, default=100_000)
+    parser.add_argument('--connections', type=int, default=8)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--seed', type=int, default=0)
+    return asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
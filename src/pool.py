@@ -0,0 +1,290 @@
+import numpy as np
+
+from .character import Character
+
+
+class CharacterPool:
+    """
+    Réserve de personnages stockés en colonnes NumPy
+    
+    Les points de vie, les maximums et les postures défensives sont rangés
+    dans des tableaux, ce qui permet d'appliquer des lots entiers
+    d'attaques, de défenses et de soins en une seule opération vectorisée,
+    avec les mêmes règles que Character.
+    
+    Un lot est résolu de façon simultanée : la vivacité des attaquants et
+    des cibles ainsi que les défenses sont lues au début du lot. Une cible
+    touchée plusieurs fois ne bénéficie de sa défense que pour le premier
+    coup.
+    """
+    
+    def __init__(self, names, health=None, character_class=Character):
+        """
+        Initialise la réserve
+        
+        Args:
+            names (iterable): Noms des personnages
+            health (int or array-like, optional): HP initiaux (défaut: MAX_HEALTH)
+            character_class (type): Classe dont on reprend les constantes
+        
+        Raises:
+            ValueError: Si un nom est invalide
+        """
+        self.names = list(names)
+        for name in self.names:
+            if not name or not isinstance(name, str):
+                raise ValueError("Le nom doit être une chaîne non vide")
+        
+        size = len(self.names)
+        self.attack_damage = character_class.ATTACK_DAMAGE
+        self.heal_amount = character_class.HEAL_AMOUNT
+        
+        if health is None:
+            health = character_class.MAX_HEALTH
+        self.health = np.empty(size, dtype=np.int64)
+        self.health[:] = health
+        self.max_health = np.full(size, character_class.MAX_HEALTH, dtype=np.int64)
+        self.is_defending = np.zeros(size, dtype=bool)
+        self._views = {}
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __getitem__(self, index):
+        """Retourne la vue Character (mise en cache) du personnage index"""
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError("Indice de personnage hors limites")
+        
+        view = self._views.get(index)
+        if view is None:
+            view = PooledCharacter(self, index)
+            self._views[index] = view
+        return view
+    
+    def __iter__(self):
+        return (self[index] for index in range(len(self.names)))
+    
+    def alive_mask(self):
+        """Retourne le masque des personnages vivants"""
+        return self.health > 0
+    
+    def alive_count(self):
+        """Nombre de personnages vivants"""
+        return int(np.count_nonzero(self.health > 0))
+    
+    def attack(self, attackers, targets):
+        """
+        Applique un lot d'attaques
+        
+        Args:
+            attackers (array-like): Indices des attaquants
+            targets (array-like): Indices des cibles, de même longueur
+        
+        Returns:
+            numpy.ndarray: Masque des attaques réussies
+        
+        Raises:
+            ValueError: Si les deux tableaux n'ont pas la même longueur
+        """
+        attackers = np.asarray(attackers, dtype=np.intp)
+        targets = np.asarray(targets, dtype=np.intp)
+        if attackers.shape != targets.shape:
+            raise ValueError("Il faut autant de cibles que d'attaquants")
+        
+        alive = self.health > 0
+        success = alive[attackers] & alive[targets]
+        
+        hits = np.bincount(targets[success], minlength=len(self.names))
+        hit = np.flatnonzero(hits)
+        old_health = self.health[hit]
+        # Cibles et attaquants qui perdront leur défense, pour les observateurs
+        reset = np.concatenate((hit, attackers[success]))
+        was_defending = np.unique(reset[self.is_defending[reset]])
+        
+        # Seul le premier coup est réduit par la défense (min 1)
+        damage = self.attack_damage
+        first_hit = np.where(self.is_defending[hit], max(1, damage // 2), damage)
+        total = first_hit + (hits[hit] - 1) * damage
+        self.health[hit] = np.maximum(0, old_health - total)
+        
+        # Réinitialiser la défense des cibles touchées puis des attaquants
+        self.is_defending[hit] = False
+        self.is_defending[attackers[success]] = False
+        
+        self._notify_views(hit, old_health)
+        self._notify_defense(was_defending)
+        return success
+    
+    def take_damage(self, indices, damage):
+        """
+        Inflige des dégâts à un lot de personnages
+        
+        Args:
+            indices (array-like): Indices des personnages touchés (uniques)
+            damage (int or array-like): Dégâts pour chacun
+        
+        Raises:
+            ValueError: Si des dégâts sont négatifs
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        damage = np.broadcast_to(np.asarray(damage, dtype=np.int64), indices.shape)
+        if np.any(damage < 0):
+            raise ValueError("Les dégâts ne peuvent pas être négatifs")
+        
+        alive = self.health[indices] > 0
+        indices = indices[alive]
+        damage = damage[alive]
+        
+        old_health = self.health[indices]
+        was_defending = self.is_defending[indices]
+        actual = np.where(was_defending, np.maximum(1, damage // 2), damage)
+        self.health[indices] = np.maximum(0, old_health - actual)
+        self.is_defending[indices] = False
+        
+        self._notify_views(indices, old_health)
+        self._notify_defense(indices[was_defending])
+    
+    def defend(self, indices):
+        """Met en position défensive les personnages vivants du lot"""
+        indices = np.asarray(indices, dtype=np.intp)
+        indices = indices[self.health[indices] > 0]
+        changed = np.unique(indices[~self.is_defending[indices]])
+        self.is_defending[indices] = True
+        self._notify_defense(changed)
+    
+    def heal(self, indices, amount=None):
+        """
+        Soigne un lot de personnages
+        
+        Args:
+            indices (array-like): Indices des personnages soignés
+            amount (int, optional): Montant des soins (défaut: HEAL_AMOUNT)
+        
+        Returns:
+            numpy.ndarray: HP réellement rendus à chaque personnage du lot
+        
+        Raises:
+            ValueError: Si le montant est négatif
+        """
+        heal_amount = amount if amount is not None else self.heal_amount
+        if heal_amount < 0:
+            raise ValueError("Les soins ne peuvent pas être négatifs")
+        
+        indices = np.asarray(indices, dtype=np.intp)
+        alive = self.health[indices] > 0
+        healed = indices[alive]
+        
+        # Rang de chaque soin parmi ceux reçus par le même personnage, pour
+        # créditer chaque soin comme s'ils étaient appliqués l'un après l'autre
+        order = np.argsort(healed, kind='stable')
+        sorted_indices = healed[order]
+        positions = np.arange(len(sorted_indices))
+        starts = np.ones(len(sorted_indices), dtype=bool)
+        starts[1:] = sorted_indices[1:] != sorted_indices[:-1]
+        rank = positions - np.maximum.accumulate(np.where(starts, positions, 0))
+        
+        room = self.max_health[sorted_indices] - self.health[sorted_indices]
+        gains = np.where(
+            rank == 0,
+            np.minimum(heal_amount, room),
+            np.minimum(heal_amount, np.maximum(0, room - rank * heal_amount))
+        )
+        
+        touched = sorted_indices[starts]
+        old_health = self.health[touched]
+        np.add.at(self.health, sorted_indices, gains)
+        
+        restored = np.zeros(indices.shape, dtype=np.int64)
+        restored[np.flatnonzero(alive)[order]] = gains
+        
+        self._notify_views(touched, old_health)
+        return restored
+    
+    def _notify_defense(self, indices):
+        """Prévient les observateurs des vues dont la défense a basculé"""
+        if not self._views:
+            return
+        
+        for index in indices.tolist():
+            view = self._views.get(index)
+            if view is not None and view._listeners:
+                new_value = bool(self.is_defending[index])
+                view._notify('is_defending', not new_value, new_value)
+    
+    def _notify_views(self, indices, old_health):
+        """Prévient les observateurs des vues dont la santé a changé"""
+        if not self._views:
+            return
+        
+        for index, old_value in zip(indices.tolist(), old_health.tolist()):
+            view = self._views.get(index)
+            if view is not None and view._listeners:
+                new_value = int(self.health[index])
+                if new_value != old_value:
+                    view._notify('health', old_value, new_value)
+
+
+class PooledCharacter(Character):
+    """
+    Vue Character sur un personnage d'une CharacterPool
+    
+    Toutes les méthodes de Character fonctionnent et lisent ou écrivent
+    directement dans les tableaux de la réserve.
+    """
+    
+    __slots__ = ('_pool', '_index')
+    
+    def __init__(self, pool, index):
+        self._listeners = ()
+        self._pool = pool
+        self._index = index
+        self.name = pool.names[index]
+    
+    @property
+    def ATTACK_DAMAGE(self):
+        return self._pool.attack_damage
+    
+    @property
+    def HEAL_AMOUNT(self):
+        return self._pool.heal_amount
+    
+    @property
+    def health(self):
+        """Points de vie actuels"""
+        return int(self._pool.health[self._index])
+    
+    @health.setter
+    def health(self, value):
+        old_health = int(self._pool.health[self._index])
+        self._pool.health[self._index] = value
+        if self._listeners and value != old_health:
+            self._notify('health', old_health, value)
+    
+    @property
+    def max_health(self):
+        """Points de vie maximum"""
+        return int(self._pool.max_health[self._index])
+    
+    @max_health.setter
+    def max_health(self, value):
+        old_value = int(self._pool.max_health[self._index])
+        self._pool.max_health[self._index] = value
+        if self._listeners and value != old_value:
+            self._notify('max_health', old_value, value)
+    
+    @property
+    def is_defending(self):
+        """Indique si le personnage est en position défensive"""
+        return bool(self._pool.is_defending[self._index])
+    
+    @is_defending.setter
+    def is_defending(self, value):
+        old_value = bool(self._pool.is_defending[self._index])
+        self._pool.is_defending[self._index] = value
+        if self._listeners and value != old_value:
+            self._notify('is_defending', old_value, value)
+    
+    def __repr__(self):
+        return f"PooledCharacter(name='{self.name}', health={self.health})"
@@ -0,0 +1,222 @@
+import bisect
+import re
+
+from .character import Character
+from .game import Game
+from .snapshot import dumps, loads
+
+_JOIN_HEALTH = re.compile(r"avec (-?\d+) HP$")
+
+
+class ReplayEngine:
+    """
+    Rejoue un historique de partie pour en reconstruire l'état
+    
+    Des instantanés binaires sont pris toutes les checkpoint_interval
+    actions, si bien que seek(turn) ne rejoue qu'au plus un intervalle
+    depuis l'instantané précédent.
+    
+    Un historique incomplet est toléré : un joueur inconnu est recréé avec
+    la santé déduite de l'entrée qui le mentionne, et un trou dans les tours
+    est comblé. Ces réparations sont listées dans repairs, et les écarts
+    entre l'historique et le rejeu dans divergences.
+    
+    L'historique ne garde qu'un résumé des ajouts en bloc (Game.add_players) :
+    leurs joueurs sont lus dans rosters, par exemple les rosters chargés
+    avec load_roster ou les enregistrements du journal. Sans roster, ces
+    joueurs sont recréés comme des joueurs inconnus, à leur première
+    mention.
+    """
+    
+    def __init__(self, log, checkpoint_interval=100, verify=True, rosters=None):
+        """
+        Initialise le rejeu
+        
+        Args:
+            log (iterable): Entrées d'historique (Game.history ou équivalent)
+            checkpoint_interval (int): Actions rejouées entre deux instantanés
+            verify (bool): Comparer chaque résultat à l'entrée enregistrée
+            rosters (dict, optional): Joueurs de chaque ajout en bloc, par
+                premier identifiant (first_player_id) : liste de noms ou de
+                tuples (nom, HP), comme passée à Game.add_players
+        
+        Raises:
+            ValueError: Si l'intervalle n'est pas positif
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("L'intervalle entre instantanés doit être positif")
+        
+        self.entries = log if hasattr(log, '__getitem__') and hasattr(log, '__len__') else list(log)
+        self.checkpoint_interval = checkpoint_interval
+        self.verify = verify
+        self.rosters = rosters or {}
+        self.game = Game()
+        self.position = 0
+        self.repairs = []
+        self.divergences = []
+        self._replayed = 0
+        self._actions_since_checkpoint = 0
+        self._checkpoint_turns = [0]
+        self._checkpoints = [(0, dumps(self.game))]
+    
+    @property
+    def turn(self):
+        """Tour atteint par le rejeu"""
+        return self.game.turn_count
+    
+    def step(self):
+        """
+        Rejoue l'entrée suivante
+        
+        Returns:
+            dict or None: Résultat de l'action rejouée, None pour une entrée
+                sans action ou à la fin de l'historique
+        """
+        if self.position >= len(self.entries):
+            return None
+        
+        index = self.position
+        entry = self.entries[index]
+        self.position += 1
+        result = self._apply(index, entry)
+        self._replayed = max(self._replayed, self.position)
+        return result
+    
+    def run(self, verify=None):
+        """
+        Rejoue tout l'historique restant, sans produire de résultats
+        
+        Args:
+            verify (bool, optional): Remplace le réglage de vérification le
+                temps du rejeu (False pour un rejeu le plus rapide possible)
+        
+        Returns:
+            Game: La partie rejouée
+        """
+        saved = self.verify
+        if verify is not None:
+            self.verify = verify
+        try:
+            while self.position < len(self.entries):
+                self.step()
+        finally:
+            self.verify = saved
+        return self.game
+    
+    def seek(self, turn):
+        """
+        Place le rejeu juste après l'action du tour donné
+        
+        Args:
+            turn (int): Tour visé (0 pour l'état initial)
+        
+        Returns:
+            Game: La partie au tour demandé
+        """
+        # Repartir de l'instantané le plus proche s'il faut reculer ou s'il
+        # est plus avancé que l'état courant
+        slot = bisect.bisect_right(self._checkpoint_turns, turn) - 1
+        if turn < self.game.turn_count or self._checkpoint_turns[slot] > self.game.turn_count:
+            self.position, data = self._checkpoints[slot]
+            self.game = loads(data)
+            self._actions_since_checkpoint = 0
+        
+        while self.position < len(self.entries) and self.game.turn_count < turn:
+            self.step()
+        # Rejouer aussi les arrivées et départs de joueurs de ce tour
+        while self.position < len(self.entries) and self._is_roster_change(self.entries[self.position]):
+            self.step()
+        return self.game
+    
+    @staticmethod
+    def _is_roster_change(entry):
+        return entry.get('action') in ('player_added', 'players_added', 'player_removed')
+    
+    def _apply(self, index, entry):
+        action = entry.get('action')
+        game = self.game
+        
+        if action == 'player_added':
+            if game.get_player(entry['player']) is None:
+                health = entry.get('health')
+                if health is None:
+                    # Historiques antérieurs au champ 'health' : lu dans le texte
+                    match = _JOIN_HEALTH.search(entry.get('details', ''))
+                    health = int(match.group(1)) if match else None
+                self._add_player(entry['player'], health)
+            return None
+        if action == 'players_added':
+            self._add_players(index, entry)
+            return None
+        if action == 'player_removed':
+            game._unregister_player(entry['player'])
+            return None
+        if action not in ('attack', 'defend', 'heal'):
+            return None
+        
+        player_name = entry.get('player')
+        target_name = entry.get('target')
+        amount = None
+        
+        if game.get_player(player_name) is None:
+            health = None
+            if action == 'heal' and 'current_health' in entry:
+                health = entry['current_health'] - entry.get('health_restored', 0)
+            self._repair(index, f"joueur {player_name} absent de l'historique")
+            self._add_player(player_name, health)
+        if action == 'attack' and game.get_player(target_name) is None:
+            self._repair(index, f"cible {target_name} absente de l'historique")
+            self._add_player(target_name, entry.get('target_health', 0) + entry.get('damage_dealt', 0))
+        if action == 'heal':
+            amount = max(0, entry.get('health_restored', 0))
+        
+        expected_turn = entry.get('turn')
+        if expected_turn is not None and expected_turn != game.turn_count + 1:
+            self._repair(index, f"tours {game.turn_count + 1} à {expected_turn - 1} absents")
+            game.turn_count = expected_turn - 1
+        
+        result = game._execute_action(player_name, action, target_name, amount, self._discard)
+        if self.verify and index >= self._replayed:
+            self._check(index, entry, result)
+        
+        self._actions_since_checkpoint += 1
+        if self._actions_since_checkpoint >= self.checkpoint_interval:
+            self._checkpoint()
+        return result
+    
+    def _checkpoint(self):
+        self._actions_since_checkpoint = 0
+        turn = self.game.turn_count
+        if turn > self._checkpoint_turns[-1]:
+            self._checkpoint_turns.append(turn)
+            self._checkpoints.append((self.position, dumps(self.game)))
+    
+    def _add_player(self, name, health):
+        player = Character(name, health)
+        self.game._register_player(player)
+    
+    def _add_players(self, index, entry):
+        game = self.game
+        first_id = entry.get('first_player_id', game._next_player_id)
+        roster = self.rosters.get(first_id)
+        if roster is None:
+            self._repair(index, f"roster de l'ajout en bloc {first_id} absent")
+            # Les identifiants des joueurs arrivés ensuite restent les mêmes
+            game._next_player_id = max(game._next_player_id, entry.get('last_player_id', -1) + 1)
+            return
+        game._next_player_id = max(game._next_player_id, first_id)
+        game._register_players(game._create_players(roster, 'skip'))
+    
+    def _repair(self, index, message):
+        # Une entrée rejouée après un retour en arrière n'est signalée qu'une fois
+        if index >= self._replayed:
+            self.repairs.append((index, message))
+    
+    def _check(self, index, entry, result):
+        for field in ('success', 'turn', 'damage_dealt', 'target_health', 'current_health', 'health_restored'):
+            if field in entry and result.get(field) != entry[field]:
+                self.divergences.append((index, field, entry[field], result.get(field)))
+    
+    @staticmethod
+    def _discard(entry):
+        pass
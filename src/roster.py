@@ -0,0 +1,138 @@
+"""
+Lecture en flux de listes de joueurs (rosters) au format CSV ou JSON lignes
+
+CSV : une ligne d'en-tête avec une colonne name et une colonne health
+facultative ; une santé vide prend la valeur par défaut.
+
+    name,health
+    Alice,10
+    Bob,
+
+JSON lignes : un objet par ligne, les lignes vides sont ignorées.
+
+    {"name": "Alice", "health": 10}
+    {"name": "Bob"}
+
+Les fichiers terminés par .gz sont décompressés à la volée. Les lecteurs
+produisent des tuples (nom, HP) un par un, pour Game.add_players.
+"""
+import csv
+import gzip
+import json
+import os
+
+
+def _open_text(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def _parse_health(value, line_number):
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Ligne {line_number}: santé invalide {value!r}") from None
+
+
+def read_csv(path, name_field='name', health_field='health'):
+    """
+    Lit un roster CSV
+    
+    Args:
+        path (str): Chemin du fichier
+        name_field (str): Colonne des noms
+        health_field (str): Colonne des santés, facultative
+    
+    Yields:
+        tuple: (nom, HP ou None)
+    
+    Raises:
+        ValueError: Si la colonne des noms manque ou si une santé est invalide
+    """
+    with _open_text(path) as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        if name_field not in header:
+            raise ValueError(f"Colonne '{name_field}' absente de l'en-tête")
+        name_index = header.index(name_field)
+        health_index = header.index(health_field) if health_field in header else None
+        
+        for line_number, row in enumerate(reader, 2):
+            if not row:
+                continue
+            health = None
+            if health_index is not None and health_index < len(row):
+                health = _parse_health(row[health_index], line_number)
+            yield (row[name_index] if name_index < len(row) else ''), health
+
+
+def read_jsonl(path):
+    """
+    Lit un roster JSON lignes
+    
+    Args:
+        path (str): Chemin du fichier
+    
+    Yields:
+        tuple: (nom, HP ou None)
+    
+    Raises:
+        ValueError: Si une ligne n'est pas un objet JSON valide
+    """
+    with _open_text(path) as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Ligne {line_number}: JSON invalide ({error.msg})") from None
+            if not isinstance(record, dict):
+                raise ValueError(f"Ligne {line_number}: un objet JSON est attendu")
+            yield record.get('name'), _parse_health(record.get('health'), line_number)
+
+
+def read_roster(path, format=None):
+    """
+    Lit un roster, au format déduit de l'extension si besoin
+    
+    Args:
+        path (str): Chemin du fichier (.csv, .jsonl ou .ndjson, éventuellement .gz)
+        format (str, optional): 'csv' ou 'jsonl'
+    
+    Returns:
+        iterator: Tuples (nom, HP ou None)
+    
+    Raises:
+        ValueError: Si le format est inconnu
+    """
+    if format is None:
+        base = path[:-3] if path.endswith('.gz') else path
+        extension = os.path.splitext(base)[1].lower()
+        format = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}.get(extension)
+    if format == 'csv':
+        return read_csv(path)
+    if format == 'jsonl':
+        return read_jsonl(path)
+    raise ValueError(f"Format de roster inconnu: {format or path}")
+
+
+def load_roster(game, path, format=None, on_duplicate='error'):
+    """
+    Ajoute à une partie les joueurs d'un roster
+    
+    Args:
+        game (Game): La partie
+        path (str): Chemin du roster
+        format (str, optional): 'csv' ou 'jsonl' (défaut: selon l'extension)
+        on_duplicate (str): 'error' ou 'skip', comme Game.add_players
+    
+    Returns:
+        list: Les personnages créés
+    """
+    return game.add_players(read_roster(path, format), on_duplicate)
@@ -0,0 +1,250 @@
+import asyncio
+import json
+
+from .game import Game
+
+
+class ServerError(Exception):
+    """Erreur renvoyée au client dans la réponse à sa requête"""
+
+
+class GameServer:
+    """
+    Serveur asyncio hébergeant de nombreuses parties dans une seule boucle
+    
+    Les clients envoient une requête JSON par ligne, sur TCP ou socket Unix :
+        {"id": 1, "op": "execute_action", "game": 3, "player": "Alice",
+         "action": "attack", "target": "Bob"}
+    et reçoivent une réponse JSON par ligne, portant le même id :
+        {"id": 1, "ok": true, "result": {...}}
+    
+    Opérations : create_game, close_game, add_player, execute_action,
+    get_game_state, get_state_delta.
+    
+    Les requêtes d'une partie passent par une file bornée traitée dans
+    l'ordre par une seule tâche, ce qui sérialise les actions. Une file
+    pleine suspend la lecture de la connexion (contre-pression), de même
+    qu'un trop grand nombre de requêtes en cours sur une connexion.
+    
+    Avec un journal, les parties qu'il contient sont reprises au démarrage,
+    et les requêtes en file d'une partie sont traitées par paquet : un seul
+    commit du journal couvre le paquet, avant l'envoi des réponses.
+    """
+    
+    def __init__(self, max_connections=1000, max_pending_per_game=1024,
+                 max_inflight_per_connection=256, instrumentation=None, journal=None):
+        """
+        Initialise le serveur
+        
+        Args:
+            max_connections (int): Connexions simultanées acceptées
+            max_pending_per_game (int): Taille de la file de chaque partie
+            max_inflight_per_connection (int): Requêtes sans réponse
+                autorisées par connexion
+            instrumentation (Instrumentation, optional): Instrumente chaque
+                partie créée, étiquetée par son identifiant
+            journal (Journal, optional): Journal des parties, ouvert par
+                Journal.open pour reprendre les parties qu'il contient
+        """
+        self.max_connections = max_connections
+        self.max_pending_per_game = max_pending_per_game
+        self.max_inflight_per_connection = max_inflight_per_connection
+        self.instrumentation = instrumentation
+        self.journal = journal
+        self.games = {}
+        self.connections = 0
+        self._queues = {}
+        self._workers = {}
+        self._next_game_id = 1
+        self._server = None
+        if journal is not None:
+            self.games.update(journal.games)
+            self._next_game_id = journal.next_game_id
+    
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """
+        Démarre l'écoute sur TCP, ou sur un socket Unix si path est donné
+        
+        Returns:
+            tuple or str: Adresse (hôte, port) ou chemin du socket
+        """
+        # Parties reprises du journal
+        for game_id in self.games:
+            if game_id not in self._workers:
+                self._start_game(game_id)
+        
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path)
+            return path
+        
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+    
+    async def serve_forever(self):
+        """Sert les clients jusqu'à l'annulation"""
+        async with self._server:
+            await self._server.serve_forever()
+    
+    async def close(self):
+        """Arrête l'écoute et les tâches des parties"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for game_id in list(self.games):
+            # Les parties restent dans le journal pour être reprises
+            await self._close_game(game_id, forget=False)
+        if self.journal is not None:
+            self.journal.commit()
+    
+    async def _handle_connection(self, reader, writer):
+        if self.connections >= self.max_connections:
+            writer.write(self._encode({'id': None, 'ok': False, 'error': 'Trop de connexions'}))
+            await writer.drain()
+            writer.close()
+            return
+        
+        self.connections += 1
+        inflight = asyncio.Semaphore(self.max_inflight_per_connection)
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                await inflight.acquire()
+                task = asyncio.create_task(self._answer(line, writer, inflight))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+    
+    async def _answer(self, line, writer, inflight):
+        """Traite une requête et écrit sa réponse"""
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ServerError("La requête doit être un objet JSON")
+            request_id = request.get('id')
+            response = {'id': request_id, 'ok': True, 'result': await self._dispatch(request)}
+        except Exception as error:
+            # Toute erreur d'une requête est rendue au client, jamais propagée
+            response = {'id': request_id, 'ok': False, 'error': str(error) or type(error).__name__}
+        finally:
+            inflight.release()
+        
+        if writer.is_closing():
+            return
+        try:
+            writer.write(self._encode(response))
+            await writer.drain()
+        except ConnectionError:
+            pass
+    
+    async def _dispatch(self, request):
+        op = request.get('op')
+        if op == 'create_game':
+            return {'game': self._create_game()}
+        
+        game_id = request.get('game')
+        if game_id not in self.games:
+            raise ServerError(f"Partie {game_id} introuvable")
+        
+        if op == 'close_game':
+            await self._close_game(game_id)
+            return {'game': game_id}
+        if op not in ('add_player', 'execute_action', 'get_game_state', 'get_state_delta'):
+            raise ServerError(f"Opération inconnue: {op}")
+        for field in ('amount', 'health', 'since'):
+            self._check_integer(request, field)
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queues[game_id].put((op, request, future))
+        return await future
+    
+    @staticmethod
+    def _check_integer(request, field):
+        """Refuse un paramètre numérique qui n'est pas un entier"""
+        value = request.get(field)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
+            raise ServerError(f"Le paramètre '{field}' doit être un entier")
+    
+    def _create_game(self):
+        game_id = self._next_game_id
+        self._next_game_id += 1
+        self.games[game_id] = Game()
+        if self.journal is not None:
+            self.journal.attach(self.games[game_id], game_id)
+            self.journal.commit()
+        self._start_game(game_id)
+        return game_id
+    
+    def _start_game(self, game_id):
+        if self.instrumentation is not None:
+            self.instrumentation.instrument(self.games[game_id], label=str(game_id))
+        self._queues[game_id] = asyncio.Queue(self.max_pending_per_game)
+        self._workers[game_id] = asyncio.create_task(self._run_game(game_id))
+    
+    async def _close_game(self, game_id, forget=True):
+        worker = self._workers.pop(game_id)
+        worker.cancel()
+        queue = self._queues.pop(game_id)
+        game = self.games.pop(game_id)
+        if self.instrumentation is not None:
+            self.instrumentation.uninstrument(game)
+        if forget and self.journal is not None:
+            self.journal.detach(game)
+            self.journal.commit()
+        while not queue.empty():
+            _, _, future = queue.get_nowait()
+            future.set_exception(ServerError(f"Partie {game_id} fermée"))
+    
+    async def _run_game(self, game_id):
+        """Applique une par une les requêtes d'une partie"""
+        game = self.games[game_id]
+        queue = self._queues[game_id]
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            outcomes = []
+            for op, request, future in batch:
+                if future.cancelled():
+                    continue
+                # Une requête en échec ne doit pas arrêter la boucle de la partie
+                try:
+                    outcomes.append((future, True, self._apply(game, op, request)))
+                except Exception as error:
+                    outcomes.append((future, False, error))
+            
+            # Les réponses ne partent qu'une fois le paquet rendu durable
+            if self.journal is not None:
+                self.journal.commit()
+            for future, ok, outcome in outcomes:
+                if future.cancelled():
+                    continue
+                if ok:
+                    future.set_result(outcome)
+                else:
+                    future.set_exception(outcome)
+    
+    @staticmethod
+    def _apply(game, op, request):
+        if op == 'execute_action':
+            return game.execute_action(request.get('player'), request.get('action'),
+                                       request.get('target'), request.get('amount'))
+        if op == 'add_player':
+            return game.add_player(request.get('name'), request.get('health')).get_status()
+        if op == 'get_state_delta':
+            return game.get_state_delta(request.get('since', 0))
+        return game.get_game_state()
+    
+    @staticmethod
+    def _encode(response):
+        return json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n'
@@ -0,0 +1,351 @@
+"""
+Mêlée générale répartie sur plusieurs processus
+
+Les joueurs sont répartis entre des fragments (shards), chacun tenu par un
+processus de travail. La partie avance par tours synchronisés :
+
+1. Chaque fragment fait agir ses joueurs vivants. Une attaque contre un
+   joueur du même fragment est résolue sur place ; une attaque contre un
+   autre fragment est seulement comptée dans la boîte d'envoi du fragment
+   visé.
+2. Le coordinateur additionne les boîtes d'envoi et remet à chaque fragment
+   le paquet des attaques qui le visent, résolues contre des cibles tirées
+   parmi ses joueurs encore vivants.
+
+Comme dans Game, une attaque d'un joueur déjà mort échoue, si bien que la
+partie ne peut pas finir sans survivant. Quand les paquets du tour
+pourraient vider tous les fragments, ils sont remis un fragment après
+l'autre : le dernier fragment encore peuplé ignore les attaques venues de
+fragments déjà vidés, dont les attaquants sont morts.
+
+Les dégâts ne dépendent que de l'état de la cible, donc un paquet
+d'attaques distantes se réduit à un nombre. Chaque fragment a son propre
+flux aléatoire dérivé de la graine : une partie ne dépend pas de son
+exécution sur place ou dans des processus.
+"""
+import multiprocessing
+import os
+import random
+from bisect import bisect_right
+from itertools import accumulate
+
+from .character import Character
+
+
+class Shard:
+    """Fragment de la partie : une partie des joueurs et leurs attaques"""
+    
+    def __init__(self, index, shards, entrants, character_class=Character,
+                 defend_chance=0.0, seed=0):
+        """
+        Args:
+            index (int): Indice du fragment
+            shards (int): Nombre total de fragments
+            entrants (list): Tuples (nom, HP) des joueurs du fragment
+            character_class (type): Classe des joueurs
+            defend_chance (float): Probabilité de se défendre au lieu d'attaquer
+            seed (int): Graine de la partie
+        """
+        self.index = index
+        self.shards = shards
+        self.character_class = character_class
+        self.defend_chance = defend_chance
+        self.rng = random.Random(f"{seed}:{index}")
+        self.players = [character_class(name, health) for name, health in entrants]
+        # Joueurs vivants, retirés en O(1) en déplaçant le dernier à leur place
+        self._alive = [player for player in self.players if player.is_alive()]
+        self._positions = {id(player): position for position, player in enumerate(self._alive)}
+        self.attacks = 0
+        self.remote_attacks = 0
+    
+    @property
+    def alive_count(self):
+        """Nombre de joueurs vivants du fragment"""
+        return len(self._alive)
+    
+    def _remove(self, player):
+        position = self._positions.pop(id(player))
+        last = self._alive.pop()
+        if last is not player:
+            self._alive[position] = last
+            self._positions[id(last)] = position
+    
+    def _hit(self, attacker, target):
+        attacker.attack(target)
+        self.attacks += 1
+        if target.is_dead():
+            self._remove(target)
+    
+    def act(self, alive_counts):
+        """
+        Fait agir une fois chaque joueur vivant du fragment
+        
+        La cible d'une attaque est tirée uniformément parmi les autres
+        joueurs vivants de la partie, d'après les effectifs du début du tour
+        pour les autres fragments.
+        
+        Args:
+            alive_counts (list): Joueurs vivants par fragment au début du tour
+        
+        Returns:
+            tuple: (nombre d'attaques envoyées à chaque fragment, joueurs
+                vivants du fragment après ces actions)
+        """
+        rng = self.rng
+        outbox = [0] * self.shards
+        remote = [0 if shard == self.index else count for shard, count in enumerate(alive_counts)]
+        cumulative = list(accumulate(remote))
+        remote_total = cumulative[-1]
+        
+        for player in list(self._alive):
+            if player.is_dead():
+                continue
+            if rng.random() < self.defend_chance:
+                player.defend()
+                continue
+            
+            local = len(self._alive) - 1
+            if not local + remote_total:
+                break
+            choice = rng.randrange(local + remote_total)
+            if choice < local:
+                target = self._alive[choice]
+                if target is player:
+                    target = self._alive[-1]
+                self._hit(player, target)
+            else:
+                # Attaque distante : seul l'effet sur l'attaquant est local
+                outbox[bisect_right(cumulative, choice - local)] += 1
+                player.is_defending = False
+                self.remote_attacks += 1
+        return outbox, len(self._alive)
+    
+    def receive(self, attacks, keep=0):
+        """
+        Résout un paquet d'attaques venues d'autres fragments
+        
+        Args:
+            attacks (int): Nombre d'attaques reçues
+            keep (int): Effectif à partir duquel les attaques restantes
+                sont ignorées, leurs auteurs étant tous morts
+        
+        Returns:
+            int: Joueurs vivants du fragment après le paquet
+        """
+        rng = self.rng
+        damage = self.character_class.ATTACK_DAMAGE
+        for _ in range(attacks):
+            if len(self._alive) <= keep:
+                break
+            target = self._alive[rng.randrange(len(self._alive))]
+            target.take_damage(damage)
+            if target.is_dead():
+                self._remove(target)
+        return len(self._alive)
+    
+    def survivors(self, limit=None):
+        """Joueurs vivants du fragment, au plus limit"""
+        return self._alive[:limit]
+    
+    def stats(self):
+        """Compteurs du fragment"""
+        return {
+            'players': len(self.players),
+            'alive': len(self._alive),
+            'attacks': self.attacks,
+            'remote_attacks': self.remote_attacks
+        }
+
+
+def _serve_shard(connection, shard_args):
+    """Boucle d'un processus de travail : appelle les méthodes demandées du fragment"""
+    shard = Shard(*shard_args)
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        method, args = request
+        try:
+            connection.send((True, getattr(shard, method)(*args)))
+        except Exception as error:
+            connection.send((False, error))
+    connection.close()
+
+
+class ShardedGame:
+    """
+    Mêlée générale dont les joueurs sont répartis entre des fragments
+    
+    Le coordinateur ne garde que les effectifs vivants par fragment ;
+    is_game_over et get_winner ont la même sémantique que dans Game.
+    """
+    
+    def __init__(self, entrants, shards=None, inline=False, defend_chance=0.0, seed=0,
+                 character_class=Character):
+        """
+        Initialise la partie et démarre les processus des fragments
+        
+        Args:
+            entrants (iterable): Noms ou tuples (nom, HP) des joueurs
+            shards (int, optional): Nombre de fragments (défaut: nombre de cœurs)
+            inline (bool): Faire tourner les fragments dans ce processus
+            defend_chance (float): Probabilité de se défendre au lieu d'attaquer
+            seed (int): Graine rendant la partie reproductible
+            character_class (type): Classe des joueurs (MAX_HEALTH, etc.)
+        
+        Raises:
+            ValueError: Si les joueurs ou les paramètres sont invalides
+        """
+        entrants = [(entrant, None) if isinstance(entrant, str) else tuple(entrant)
+                    for entrant in entrants]
+        if len(entrants) < 2:
+            raise ValueError("Il faut au moins deux joueurs")
+        if len({name for name, _ in entrants}) != len(entrants):
+            raise ValueError("Les noms des joueurs doivent être uniques")
+        
+        self.shards = shards or os.cpu_count() or 1
+        if self.shards < 1:
+            raise ValueError("Le nombre de fragments doit être positif")
+        self.inline = inline
+        self.turn_count = 0
+        self.players = len(entrants)
+        
+        # Répartition circulaire : des fragments de tailles égales à un près
+        shard_args = [(index, self.shards, entrants[index::self.shards], character_class,
+                       defend_chance, seed) for index in range(self.shards)]
+        if inline:
+            self._shards = [Shard(*args) for args in shard_args]
+            self._connections = []
+            self._processes = []
+        else:
+            self._shards = []
+            self._connections = []
+            self._processes = []
+            for args in shard_args:
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=_serve_shard, args=(child, args), daemon=True)
+                process.start()
+                child.close()
+                self._connections.append(parent)
+                self._processes.append(process)
+        # Un paquet vide renvoie l'effectif vivant de chaque fragment
+        self.alive_counts = self._call_all('receive', [(0,)] * self.shards)
+    
+    def _call_all(self, method, args):
+        """Appelle une méthode sur chaque fragment, en parallèle hors mode sur place"""
+        if self.inline:
+            return [getattr(shard, method)(*shard_args)
+                    for shard, shard_args in zip(self._shards, args)]
+        
+        for connection, shard_args in zip(self._connections, args):
+            connection.send((method, shard_args))
+        return [self._result(connection) for connection in self._connections]
+    
+    def _call(self, index, method, args):
+        """Appelle une méthode sur un seul fragment"""
+        if self.inline:
+            return getattr(self._shards[index], method)(*args)
+        connection = self._connections[index]
+        connection.send((method, args))
+        return self._result(connection)
+    
+    @staticmethod
+    def _result(connection):
+        ok, result = connection.recv()
+        if not ok:
+            raise result
+        return result
+    
+    @property
+    def alive_count(self):
+        """Nombre de joueurs vivants dans la partie"""
+        return sum(self.alive_counts)
+    
+    def is_game_over(self):
+        """Vérifie si la partie est terminée"""
+        return self.alive_count <= 1
+    
+    def get_winner(self):
+        """
+        Détermine le gagnant de la partie
+        
+        Returns:
+            Character or None: Le gagnant (copie hors mode sur place) ou
+                None si pas de gagnant
+        """
+        if self.alive_count != 1:
+            return None
+        
+        shard = next(index for index, count in enumerate(self.alive_counts) if count)
+        return self._call(shard, 'survivors', (1,))[0]
+    
+    def play_turn(self):
+        """
+        Joue un tour : actions dans chaque fragment, puis attaques distantes
+        
+        Returns:
+            list: Joueurs vivants par fragment à la fin du tour
+        """
+        acted = self._call_all('act', [(self.alive_counts,)] * self.shards)
+        counts = [count for _, count in acted]
+        inboxes = [sum(outbox[shard] for outbox, _ in acted) for shard in range(self.shards)]
+        
+        # Une attaque tue au plus un joueur : un fragment plus peuplé que son
+        # paquet garde un survivant, et les paquets peuvent être remis en parallèle
+        if any(count > inbox for count, inbox in zip(counts, inboxes)):
+            counts = self._call_all('receive', [(inbox,) for inbox in inboxes])
+        else:
+            for shard in range(self.shards):
+                others_alive = any(count for other, count in enumerate(counts) if other != shard)
+                counts[shard] = self._call(shard, 'receive', (inboxes[shard], 0 if others_alive else 1))
+        self.alive_counts = counts
+        self.turn_count += 1
+        return self.alive_counts
+    
+    def play(self, max_turns=None):
+        """
+        Joue des tours jusqu'à la fin de la partie
+        
+        Args:
+            max_turns (int, optional): Nombre maximum de tours joués
+        
+        Returns:
+            Character or None: Le gagnant, s'il y en a un
+        """
+        played = 0
+        while not self.is_game_over() and (max_turns is None or played < max_turns):
+            self.play_turn()
+            played += 1
+        return self.get_winner()
+    
+    def get_stats(self):
+        """Statistiques agrégées de la partie"""
+        shard_stats = self._call_all('stats', [()] * self.shards)
+        return {
+            'players': self.players,
+            'shards': self.shards,
+            'turn_count': self.turn_count,
+            'alive_players': self.alive_count,
+            'attacks': sum(stats['attacks'] for stats in shard_stats),
+            'remote_attacks': sum(stats['remote_attacks'] for stats in shard_stats),
+            'game_over': self.is_game_over()
+        }
+    
+    def close(self):
+        """Arrête les processus des fragments"""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
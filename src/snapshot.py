@@ -0,0 +1,270 @@
+"""
+Instantanés binaires compacts d'une partie
+
+Format (petit-boutiste), version 1 :
+    en-tête     magic b'RPGS', version, drapeaux, turn_count, prochain id de
+                joueur, indice du gagnant (-1 si aucun), nombre de joueurs,
+                taille des noms, taille de l'historique
+    joueurs     un enregistrement de taille fixe par joueur : health,
+                max_health, id, position et longueur du nom, is_defending
+    noms        noms UTF-8 concaténés
+    historique  facultatif, JSON lignes compressé par zlib
+
+Les enregistrements de taille fixe permettent de lire un joueur sans
+décoder le reste du fichier, qui est ouvert via mmap.
+"""
+import json
+import mmap
+import struct
+import zlib
+
+from .character import Character
+from .game import Game
+
+MAGIC = b'RPGS'
+VERSION = 1
+
+FLAG_GAME_OVER = 1
+FLAG_HISTORY = 2
+
+_HEADER = struct.Struct('<4sHHqqiIIQ')
+_PLAYER = struct.Struct('<qqqIIB')
+
+
+def _compress_history(game, chunk_size=1024):
+    """Compresse l'historique par paquets de lignes, sans le sérialiser d'un bloc"""
+    compressor = zlib.compressobj()
+    blocks = []
+    separator = ''
+    lines = []
+    for entry in game.iter_history():
+        lines.append(json.dumps(entry, ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            blocks.append(compressor.compress((separator + '\n'.join(lines)).encode('utf-8')))
+            separator = '\n'
+            lines.clear()
+    if lines:
+        blocks.append(compressor.compress((separator + '\n'.join(lines)).encode('utf-8')))
+    blocks.append(compressor.flush())
+    return b''.join(blocks)
+
+
+def _encode(game, include_history):
+    """Prépare les blocs de l'instantané et calcule sa taille"""
+    players = game.players
+    names = [player.name.encode('utf-8') for player in players]
+    names_blob = b''.join(names)
+    
+    history_blob = b''
+    flags = FLAG_GAME_OVER if game.game_over else 0
+    if include_history:
+        flags |= FLAG_HISTORY
+        history_blob = _compress_history(game)
+    
+    winner_index = -1
+    if game.winner is not None:
+        winner_index = next((index for index, player in enumerate(players)
+                             if player is game.winner), -1)
+    
+    header = (MAGIC, VERSION, flags, game.turn_count, game._next_player_id, winner_index,
+              len(players), len(names_blob), len(history_blob))
+    size = _HEADER.size + _PLAYER.size * len(players) + len(names_blob) + len(history_blob)
+    return header, names, names_blob, history_blob, size
+
+
+def _write(buffer, game, header, names, names_blob, history_blob):
+    """Écrit l'instantané dans un tampon modifiable de la bonne taille"""
+    _HEADER.pack_into(buffer, 0, *header)
+    offset = _HEADER.size
+    name_offset = 0
+    for player, name in zip(game.players, names):
+        _PLAYER.pack_into(buffer, offset, player.health, player.max_health,
+                          game._player_ids[player.name], name_offset, len(name),
+                          player.is_defending)
+        offset += _PLAYER.size
+        name_offset += len(name)
+    
+    buffer[offset:offset + len(names_blob)] = names_blob
+    offset += len(names_blob)
+    buffer[offset:offset + len(history_blob)] = history_blob
+
+
+def dumps(game, include_history=False):
+    """
+    Sérialise une partie
+    
+    Args:
+        game (Game): La partie
+        include_history (bool): Inclure l'historique
+    
+    Returns:
+        bytes: L'instantané
+    """
+    header, names, names_blob, history_blob, size = _encode(game, include_history)
+    buffer = bytearray(size)
+    _write(buffer, game, header, names, names_blob, history_blob)
+    return bytes(buffer)
+
+
+def save_snapshot(game, path, include_history=False):
+    """
+    Écrit l'instantané d'une partie dans un fichier, via mmap
+    
+    Args:
+        game (Game): La partie
+        path (str): Chemin du fichier
+        include_history (bool): Inclure l'historique
+    """
+    header, names, names_blob, history_blob, size = _encode(game, include_history)
+    with open(path, 'w+b') as file:
+        file.truncate(size)
+        with mmap.mmap(file.fileno(), size) as buffer:
+            _write(buffer, game, header, names, names_blob, history_blob)
+
+
+def loads(data, **game_options):
+    """Restaure une partie depuis un instantané en mémoire"""
+    return Snapshot(data).restore(**game_options)
+
+
+def load_snapshot(path, include_history=True, **game_options):
+    """
+    Restaure une partie depuis un fichier
+    
+    Args:
+        path (str): Chemin du fichier
+        include_history (bool): Restaurer aussi l'historique s'il est présent
+        **game_options: Arguments passés à Game()
+    
+    Returns:
+        Game: La partie restaurée
+    """
+    with Snapshot.open(path) as snapshot:
+        return snapshot.restore(include_history, **game_options)
+
+
+class Snapshot:
+    """
+    Lecture paresseuse d'un instantané
+    
+    Seul l'en-tête est décodé à l'ouverture ; joueurs et historique sont lus
+    à la demande.
+    """
+    
+    def __init__(self, buffer, file=None):
+        """
+        Args:
+            buffer: Tampon contenant l'instantané (bytes, mmap...)
+            file: Fichier à fermer avec l'instantané
+        
+        Raises:
+            ValueError: Si le tampon n'est pas un instantané lisible
+        """
+        self._buffer = buffer
+        self._file = file
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Instantané tronqué")
+        
+        (magic, version, self.flags, self.turn_count, self.next_player_id,
+         self.winner_index, self.player_count, names_size, history_size) = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Ce n'est pas un instantané de partie")
+        if version != VERSION:
+            raise ValueError(f"Version d'instantané non prise en charge: {version}")
+        
+        self._names_offset = _HEADER.size + _PLAYER.size * self.player_count
+        self._history_offset = self._names_offset + names_size
+        self._history_size = history_size
+        if len(buffer) < self._history_offset + history_size:
+            raise ValueError("Instantané tronqué")
+    
+    @classmethod
+    def open(cls, path):
+        """Ouvre un fichier d'instantané en lecture via mmap"""
+        file = open(path, 'rb')
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            file.close()
+            raise ValueError("Instantané vide")
+        return cls(buffer, file)
+    
+    def close(self):
+        if self._file is not None:
+            self._buffer.close()
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @property
+    def game_over(self):
+        return bool(self.flags & FLAG_GAME_OVER)
+    
+    @property
+    def has_history(self):
+        return bool(self.flags & FLAG_HISTORY)
+    
+    def player(self, index):
+        """
+        Lit un joueur sans décoder les autres
+        
+        Returns:
+            dict: name, health, max_health, is_defending et player_id
+        """
+        if not 0 <= index < self.player_count:
+            raise IndexError("Indice de joueur hors limites")
+        health, max_health, player_id, name_offset, name_size, defending = _PLAYER.unpack_from(
+            self._buffer, _HEADER.size + index * _PLAYER.size)
+        start = self._names_offset + name_offset
+        return {
+            'name': bytes(self._buffer[start:start + name_size]).decode('utf-8'),
+            'health': health,
+            'max_health': max_health,
+            'is_defending': bool(defending),
+            'player_id': player_id
+        }
+    
+    def iter_history(self):
+        """Décode l'historique, s'il a été enregistré"""
+        if not self._history_size:
+            return
+        data = zlib.decompress(self._buffer[self._history_offset:self._history_offset + self._history_size])
+        if not data:
+            return
+        for line in data.decode('utf-8').split('\n'):
+            yield json.loads(line)
+    
+    def restore(self, include_history=True, **game_options):
+        """
+        Reconstruit la partie
+        
+        Args:
+            include_history (bool): Restaurer aussi l'historique s'il est présent
+            **game_options: Arguments passés à Game()
+        
+        Returns:
+            Game: La partie restaurée
+        """
+        game = Game(**game_options)
+        records = self._buffer[_HEADER.size:self._names_offset]
+        names = bytes(self._buffer[self._names_offset:self._history_offset])
+        
+        for health, max_health, player_id, name_offset, name_size, defending in _PLAYER.iter_unpack(records):
+            player = Character(names[name_offset:name_offset + name_size].decode('utf-8'), health)
+            player.max_health = max_health
+            player.is_defending = bool(defending)
+            game._register_player(player, player_id)
+        
+        game._next_player_id = self.next_player_id
+        game.turn_count = self.turn_count
+        game.game_over = self.game_over
+        if self.winner_index >= 0:
+            game.winner = game.players[self.winner_index]
+        if include_history:
+            game.history.extend(self.iter_history())
+        return game
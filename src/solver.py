@@ -0,0 +1,206 @@
+"""
+Stratégie optimale d'un duel par itération de valeur vectorisée
+
+Un état de duel est vu du joueur au trait : (sa santé, santé adverse, sa
+défense, défense adverse). Les règles sont celles de Character : attaquer
+inflige ATTACK_DAMAGE (moitié, au moins 1, contre un adversaire en défense)
+et fait tomber les deux défenses, se défendre lève sa défense, se soigner
+rend HEAL_AMOUNT sans dépasser MAX_HEALTH.
+
+Le duel est déterministe : chaque état est gagné, perdu ou nul (les deux
+joueurs peuvent se soigner indéfiniment). La valeur d'un état code l'issue
+et sa distance en demi-coups : SCALE - d pour une victoire en d demi-coups,
+-(SCALE - d) pour une défaite, 0 pour un nul. Le joueur gagnant cherche la
+victoire la plus rapide, le perdant retarde la défaite.
+"""
+import os
+
+import numpy as np
+
+from .character import Character
+
+ACTIONS = ('attack', 'defend', 'heal')
+ATTACK, DEFEND, HEAL = range(3)
+
+# Version du format des tables en cache
+CACHE_VERSION = 1
+
+
+class DuelSolver:
+    """
+    Résout toutes les positions d'un duel et donne le meilleur coup en O(1)
+    
+    Les tables de valeurs et de coups sont calculées une fois par jeu de
+    constantes, puis mises en cache sur disque (np.savez) si cache_dir est
+    donné.
+    """
+    
+    def __init__(self, max_health=Character.MAX_HEALTH, attack_damage=Character.ATTACK_DAMAGE,
+                 heal_amount=Character.HEAL_AMOUNT, cache_dir=None):
+        """
+        Initialise le solveur
+        
+        Args:
+            max_health (int): Santé maximale des deux combattants
+            attack_damage (int): Dégâts d'une attaque
+            heal_amount (int): Soins d'une action heal
+            cache_dir (str, optional): Répertoire du cache des tables
+        
+        Raises:
+            ValueError: Si les constantes ne sont pas positives
+        """
+        if max_health < 1 or attack_damage < 1 or heal_amount < 0:
+            raise ValueError("Les constantes du duel doivent être positives")
+        
+        self.max_health = max_health
+        self.attack_damage = attack_damage
+        self.heal_amount = heal_amount
+        self.cache_dir = cache_dir
+        # Plus longue partie décisive possible : au plus un demi-coup par état
+        self.scale = (max_health + 1) ** 2 * 4 + 1
+        self.values = None
+        self.policy = None
+        self.iterations = 0
+    
+    @classmethod
+    def for_character(cls, character_class=Character, cache_dir=None):
+        """Solveur pour les constantes d'une classe de personnage"""
+        return cls(character_class.MAX_HEALTH, character_class.ATTACK_DAMAGE,
+                   character_class.HEAL_AMOUNT, cache_dir)
+    
+    @property
+    def cache_path(self):
+        """Fichier du cache pour ces constantes, ou None sans cache"""
+        if self.cache_dir is None:
+            return None
+        name = (f"duel_v{CACHE_VERSION}_h{self.max_health}_a{self.attack_damage}"
+                f"_s{self.heal_amount}.npz")
+        return os.path.join(self.cache_dir, name)
+    
+    def solve(self):
+        """
+        Calcule (ou relit depuis le cache) les tables de valeurs et de coups
+        
+        Returns:
+            DuelSolver: self
+        """
+        if self.values is not None:
+            return self
+        
+        path = self.cache_path
+        if path is not None and os.path.exists(path):
+            with np.load(path) as tables:
+                self.values = tables['values']
+                self.policy = tables['policy']
+                self.iterations = int(tables['iterations'])
+            return self
+        
+        self._iterate()
+        if path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Écrire puis renommer, pour qu'un lecteur ne voie jamais un fichier partiel
+            temporary = f"{path}.{os.getpid()}.tmp.npz"
+            np.savez_compressed(temporary, values=self.values, policy=self.policy,
+                                iterations=self.iterations)
+            os.replace(temporary, path)
+        return self
+    
+    def _transitions(self):
+        """
+        Indices des états suivants, vus de l'adversaire, pour chaque action
+        
+        Returns:
+            tuple: (indices suivants par action, masque des attaques qui
+                tuent, masque des états où le joueur au trait peut jouer)
+        """
+        size = self.max_health + 1
+        me, opponent, me_defending, opponent_defending = np.meshgrid(
+            np.arange(size), np.arange(size), np.arange(2), np.arange(2), indexing='ij')
+        shape = me.shape
+        
+        def index(me, opponent, me_defending, opponent_defending):
+            return np.ravel_multi_index((me, opponent, me_defending, opponent_defending), shape)
+        
+        damage = np.where(opponent_defending == 1, max(1, self.attack_damage // 2), self.attack_damage)
+        opponent_after = np.maximum(0, opponent - damage)
+        undefended = np.zeros_like(me)
+        healed = np.minimum(self.max_health, me + self.heal_amount)
+        
+        following = np.stack([
+            index(opponent_after, me, undefended, undefended),
+            index(opponent, me, opponent_defending, np.ones_like(me)),
+            index(opponent, healed, opponent_defending, me_defending),
+        ]).reshape(3, -1)
+        kills = (opponent_after == 0).ravel()
+        playable = ((me > 0) & (opponent > 0)).ravel()
+        return following, kills, playable
+    
+    def _iterate(self):
+        """Itération de valeur en négamax jusqu'au point fixe"""
+        following, kills, playable = self._transitions()
+        values = np.zeros(following.shape[1], dtype=np.int32)
+        win_now = self.scale - 1
+        
+        while True:
+            self.iterations += 1
+            child = -values[following]
+            # Une issue décidée s'éloigne d'un demi-coup en remontant
+            candidates = child - np.sign(child)
+            candidates[ATTACK, kills] = win_now
+            best = candidates.max(axis=0)
+            best[~playable] = 0
+            if np.array_equal(best, values):
+                break
+            values = best
+        
+        policy = candidates.argmax(axis=0).astype(np.int8)
+        shape = (self.max_health + 1, self.max_health + 1, 2, 2)
+        self.values = values.reshape(shape)
+        self.policy = policy.reshape(shape)
+    
+    def _state(self, my_health, opponent_health, my_defending, opponent_defending):
+        if not (0 < my_health <= self.max_health and 0 < opponent_health <= self.max_health):
+            raise ValueError("Santés hors de l'espace résolu")
+        self.solve()
+        return my_health, opponent_health, int(bool(my_defending)), int(bool(opponent_defending))
+    
+    def best_action(self, my_health, opponent_health, my_defending=False, opponent_defending=False):
+        """
+        Meilleur coup du joueur au trait
+        
+        Returns:
+            str: 'attack', 'defend' ou 'heal'
+        
+        Raises:
+            ValueError: Si une santé est nulle ou dépasse max_health
+        """
+        state = self._state(my_health, opponent_health, my_defending, opponent_defending)
+        return ACTIONS[self.policy[state]]
+    
+    def outcome(self, my_health, opponent_health, my_defending=False, opponent_defending=False):
+        """
+        Issue du duel avec un jeu optimal des deux côtés
+        
+        Returns:
+            tuple: ('win', 'loss' ou 'draw', nombre de demi-coups avant
+                l'issue ou None pour un nul)
+        """
+        state = self._state(my_health, opponent_health, my_defending, opponent_defending)
+        value = int(self.values[state])
+        if value == 0:
+            return 'draw', None
+        return ('win' if value > 0 else 'loss'), self.scale - abs(value)
+    
+    def win_probability(self, my_health, opponent_health, my_defending=False, opponent_defending=False):
+        """
+        Probabilité de victoire du joueur au trait avec un jeu optimal
+        
+        Le duel étant déterministe, elle vaut 1, 0, ou 0.5 pour un nul.
+        """
+        result, _ = self.outcome(my_health, opponent_health, my_defending, opponent_defending)
+        return {'win': 1.0, 'loss': 0.0, 'draw': 0.5}[result]
+    
+    def best_action_for(self, player, opponent):
+        """Meilleur coup de player, au trait, face à opponent"""
+        return self.best_action(player.health, opponent.health, player.is_defending,
+                                opponent.is_defending)
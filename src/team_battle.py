@@ -0,0 +1,283 @@
+import heapq
+import random
+
+from .battle_log import BattleLog
+
+
+class TargetingPolicy:
+    """
+    Picks which living member of a team is attacked next.
+    
+    A policy is built over the defending team and is told about every hit,
+    so it can keep its own index up to date instead of rescanning the team.
+    Subclasses implement choose, and hit and remove when they track state.
+    """
+    
+    def __init__(self, defenders, rng):
+        """
+        Args:
+            defenders (list): Members of the defending team
+            rng (random.Random): Random source shared by the battle
+        """
+        self.defenders = defenders
+        self.rng = rng
+    
+    def choose(self):
+        """Return the index of the next target in the defending team."""
+        raise NotImplementedError
+    
+    def hit(self, index):
+        """Called after a living defender lost health."""
+    
+    def remove(self, index):
+        """Called once when a defender dies."""
+
+
+class LowestHealthFirst(TargetingPolicy):
+    """
+    Attack the living defender with the least health, first in team order on ties.
+    
+    Backed by a heap of (health, index) entries. A hit pushes a fresh entry
+    and leaves the old one in place; stale entries are skipped when they
+    reach the top, and the heap is rebuilt once they outnumber live ones.
+    """
+    
+    def __init__(self, defenders, rng):
+        super().__init__(defenders, rng)
+        self._alive = sum(1 for defender in defenders if defender.is_alive())
+        self._heap = [(defender.health, index) for index, defender in enumerate(defenders)
+                      if defender.is_alive()]
+        heapq.heapify(self._heap)
+    
+    def choose(self):
+        heap = self._heap
+        defenders = self.defenders
+        while heap:
+            health, index = heap[0]
+            defender = defenders[index]
+            if defender.health == health and defender.is_alive():
+                return index
+            heapq.heappop(heap)
+        return None
+    
+    def hit(self, index):
+        heapq.heappush(self._heap, (self.defenders[index].health, index))
+        if len(self._heap) > 2 * self._alive + 16:
+            self._rebuild()
+    
+    def remove(self, index):
+        self._alive -= 1
+    
+    def _rebuild(self):
+        self._heap = [(defender.health, index) for index, defender in enumerate(self.defenders)
+                      if defender.is_alive()]
+        heapq.heapify(self._heap)
+
+
+class RandomTarget(TargetingPolicy):
+    """
+    Attack a uniformly random living defender.
+    
+    Living indices are kept in a list with their positions, so a death is
+    removed in O(1) by swapping the last entry into its slot.
+    """
+    
+    def __init__(self, defenders, rng):
+        super().__init__(defenders, rng)
+        self._alive = [index for index, defender in enumerate(defenders) if defender.is_alive()]
+        self._positions = {index: position for position, index in enumerate(self._alive)}
+    
+    def choose(self):
+        if not self._alive:
+            return None
+        return self._alive[self.rng.randrange(len(self._alive))]
+    
+    def remove(self, index):
+        position = self._positions.pop(index)
+        last = self._alive.pop()
+        if last != index:
+            self._alive[position] = last
+            self._positions[last] = position
+
+
+class RoundRobin(TargetingPolicy):
+    """
+    Attack living defenders in turn, in team order.
+    
+    Living indices form a circular doubly linked list, so a death is
+    unlinked in O(1) and the cursor never visits the dead.
+    """
+    
+    def __init__(self, defenders, rng):
+        super().__init__(defenders, rng)
+        alive = [index for index, defender in enumerate(defenders) if defender.is_alive()]
+        self._next = {index: alive[(position + 1) % len(alive)] for position, index in enumerate(alive)}
+        self._previous = {index: alive[position - 1] for position, index in enumerate(alive)}
+        self._cursor = alive[0] if alive else None
+    
+    def choose(self):
+        index = self._cursor
+        if index is not None:
+            self._cursor = self._next[index]
+        return index
+    
+    def remove(self, index):
+        following = self._next.pop(index)
+        preceding = self._previous.pop(index)
+        if following == index:
+            self._cursor = None
+            return
+        self._next[preceding] = following
+        self._previous[following] = preceding
+        if self._cursor == index:
+            self._cursor = following
+
+
+POLICIES = {
+    'lowest_health': LowestHealthFirst,
+    'random': RandomTarget,
+    'round_robin': RoundRobin,
+}
+
+
+class TeamBattleLog(BattleLog):
+    """Battle log whose START record names the two teams."""
+    
+    START_TEXT = "Battle started between {} and {}"
+
+
+class TeamBattle:
+    """
+    Battle between two teams of any size, generalizing Battle.start_duel.
+    
+    Each turn, every living member of team 1 attacks in team order, then
+    every living member of team 2, with the same rules as a duel. Targets
+    are picked by each defending team's targeting policy. The battle ends
+    when a team has no living member.
+    """
+    
+    def __init__(self, team1, team2, policy='lowest_health', names=("Team 1", "Team 2"),
+                 seed=None, log_enabled=True):
+        """
+        Initialize a team battle.
+        
+        Args:
+            team1 (iterable): Members of the first team
+            team2 (iterable): Members of the second team
+            policy: Targeting policy name or class used against both
+                teams, or a (policy against team 1, policy against team 2)
+                pair
+            names (tuple): Team names
+            seed (int, optional): Seed of the random targeting policy
+            log_enabled (bool): Record the battle log
+        
+        Raises:
+            ValueError: If a team is empty, a combatant appears twice or a
+                policy is unknown
+        """
+        self.team1 = list(team1)
+        self.team2 = list(team2)
+        if not self.team1 or not self.team2:
+            raise ValueError("Both teams need at least one member")
+        if len({id(member) for member in self.team1 + self.team2}) != len(self.team1) + len(self.team2):
+            raise ValueError("A combatant can only appear once")
+        
+        policies = policy if isinstance(policy, (tuple, list)) else (policy, policy)
+        self.policies = tuple(self._resolve_policy(p) for p in policies)
+        
+        self.names = tuple(names)
+        self.rng = random.Random(seed)
+        self.turn_count = 0
+        self.attacks = 0
+        self.damage_dealt = [0, 0]
+        self.winner = None
+        self.log_enabled = log_enabled
+        members = [member.name for member in self.team1 + self.team2]
+        self.log = TeamBattleLog(members + list(self.names))
+        self._rendered_log = []
+    
+    @staticmethod
+    def _resolve_policy(policy):
+        if not isinstance(policy, str):
+            return policy
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown targeting policy: {policy}")
+        return POLICIES[policy]
+    
+    @property
+    def battle_log(self):
+        """Battle log lines, rendered from the structured log on access."""
+        if len(self._rendered_log) < len(self.log):
+            self._rendered_log.extend(self.log.render(len(self._rendered_log)))
+        return self._rendered_log
+    
+    def start_battle(self):
+        """
+        Fight until one team is wiped out.
+        
+        Returns:
+            list or None: The winning team, None if neither team had a
+                living member to begin with
+        """
+        teams = (self.team1, self.team2)
+        offsets = (0, len(self.team1))
+        # policies[i] targets team i, so team i's attackers use the other one
+        targeting = [self.policies[side](teams[side], self.rng) for side in (0, 1)]
+        alive = [sum(1 for member in team if member.is_alive()) for team in teams]
+        log = self.log if self.log_enabled else None
+        # Team names follow the members in the log's name list
+        first_team_name = len(self.team1) + len(self.team2)
+        
+        if log is not None:
+            log.record(BattleLog.START, self.turn_count, first_team_name, first_team_name + 1)
+        
+        while alive[0] and alive[1]:
+            self.turn_count += 1
+            for side in (0, 1):
+                other = 1 - side
+                defenders = teams[other]
+                policy = targeting[other]
+                for attacker_index, attacker in enumerate(teams[side]):
+                    if not alive[other]:
+                        break
+                    if not attacker.is_alive():
+                        continue
+                    
+                    target_index = policy.choose()
+                    target = defenders[target_index]
+                    old_health = target.health
+                    attacker.attack(target)
+                    damage = old_health - target.health
+                    self.attacks += 1
+                    self.damage_dealt[side] += damage
+                    
+                    if not target.is_alive():
+                        alive[other] -= 1
+                        policy.remove(target_index)
+                    elif damage:
+                        policy.hit(target_index)
+                    
+                    if log is not None:
+                        log.record(BattleLog.ATTACK, self.turn_count, offsets[side] + attacker_index,
+                                   offsets[other] + target_index, damage)
+        
+        if alive[0] or alive[1]:
+            side = 0 if alive[0] else 1
+            self.winner = teams[side]
+            if log is not None:
+                log.record(BattleLog.END, self.turn_count, first_team_name + side)
+        return self.winner
+    
+    def get_battle_stats(self):
+        """Get battle statistics."""
+        return {
+            'turns': self.turn_count,
+            'attacks': self.attacks,
+            'team1_hp': sum(member.health for member in self.team1),
+            'team2_hp': sum(member.health for member in self.team2),
+            'team1_alive': sum(1 for member in self.team1 if member.is_alive()),
+            'team2_alive': sum(1 for member in self.team2 if member.is_alive()),
+            'team1_damage': self.damage_dealt[0],
+            'team2_damage': self.damage_dealt[1],
+            'battle_log': self.battle_log
+        }
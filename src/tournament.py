@@ -0,0 +1,248 @@
+import os
+import random
+import time
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations, islice
+
+from .battle import Battle
+from .character import Character
+
+# Configuration des duels, fixée une fois par processus de travail
+_WORKER_CONFIG = None
+
+
+def _init_worker(names, healths, character_class, defend_chance, seed):
+    """Initialise un processus de travail avec la configuration du tournoi"""
+    global _WORKER_CONFIG
+    _WORKER_CONFIG = (names, healths, character_class, defend_chance, seed)
+
+
+def _play_chunk(chunk_index, pairs, keep_winners):
+    """
+    Joue un paquet de duels et renvoie des résultats agrégés
+    
+    Le générateur aléatoire est dérivé de la graine du tournoi et de l'indice
+    du paquet : les résultats ne dépendent pas du nombre de processus.
+    
+    Returns:
+        tuple: (indice du paquet, victoires, défaites, tours, duels, gagnants)
+    """
+    names, healths, character_class, defend_chance, seed = _WORKER_CONFIG
+    rng = random.Random(f"{seed}:{chunk_index}")
+    wins = {}
+    losses = {}
+    turns = 0
+    winners = [] if keep_winners else None
+    
+    for first, second in pairs:
+        # Tirer au sort qui frappe en premier et les postures de départ
+        if rng.random() < 0.5:
+            first, second = second, first
+        player1 = character_class(names[first], healths[first])
+        player2 = character_class(names[second], healths[second])
+        player1.is_defending = rng.random() < defend_chance
+        player2.is_defending = rng.random() < defend_chance
+        
+        battle = Battle(player1, player2, log_enabled=False)
+        if battle.start_duel() is player1:
+            winner, loser = first, second
+        else:
+            winner, loser = second, first
+        
+        wins[winner] = wins.get(winner, 0) + 1
+        losses[loser] = losses.get(loser, 0) + 1
+        turns += battle.turn_count
+        if keep_winners:
+            winners.append(winner)
+    
+    return chunk_index, wins, losses, turns, len(pairs), winners
+
+
+class TournamentResult:
+    """Résultats agrégés d'un tournoi"""
+    
+    def __init__(self, names):
+        self.names = list(names)
+        self.wins = [0] * len(self.names)
+        self.losses = [0] * len(self.names)
+        self.duels = 0
+        self.turns = 0
+        self.elapsed = 0.0
+        self.champion = None
+    
+    @property
+    def duels_per_second(self):
+        """Débit du tournoi en duels par seconde"""
+        return self.duels / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def win_rate(self, name):
+        """
+        Retourne le taux de victoire d'un participant
+        
+        Args:
+            name (str): Nom du participant
+        
+        Returns:
+            float: Victoires divisées par duels joués (0 si aucun duel)
+        """
+        index = self.names.index(name)
+        played = self.wins[index] + self.losses[index]
+        return self.wins[index] / played if played else 0.0
+    
+    def standings(self):
+        """Retourne les (nom, victoires, défaites) triés par victoires"""
+        rows = zip(self.names, self.wins, self.losses)
+        return sorted(rows, key=lambda row: row[1], reverse=True)
+    
+    def _merge(self, wins, losses, turns, duels):
+        for index, count in wins.items():
+            self.wins[index] += count
+        for index, count in losses.items():
+            self.losses[index] += count
+        self.turns += turns
+        self.duels += duels
+
+
+class Tournament:
+    """
+    Tournoi Monte Carlo de duels répartis sur plusieurs processus
+    
+    Les duels sont découpés en paquets envoyés à un ProcessPoolExecutor.
+    Chaque paquet a son propre flux aléatoire, dérivé de la graine, et ne
+    renvoie que des compteurs agrégés, jamais les journaux de combat.
+    """
+    
+    def __init__(self, entrants, workers=None, chunk_size=10_000, seed=0,
+                 defend_chance=0.0, character_class=Character, progress=None):
+        """
+        Initialise le tournoi
+        
+        Args:
+            entrants (iterable): Noms ou tuples (nom, HP) des participants
+            workers (int, optional): Nombre de processus (défaut: nombre de cœurs)
+            chunk_size (int): Nombre de duels par paquet
+            seed (int): Graine rendant le tournoi reproductible
+            defend_chance (float): Probabilité de commencer un duel en défense
+            character_class (type): Classe des combattants (MAX_HEALTH, etc.)
+            progress (callable, optional): Appelé avec (duels joués, duels
+                prévus, secondes écoulées) après chaque paquet
+        
+        Raises:
+            ValueError: Si les participants ou les paramètres sont invalides
+        """
+        names = []
+        healths = []
+        for entrant in entrants:
+            name, health = (entrant, None) if isinstance(entrant, str) else entrant
+            names.append(name)
+            healths.append(health)
+        
+        if len(names) < 2:
+            raise ValueError("Il faut au moins deux participants")
+        if len(set(names)) != len(names):
+            raise ValueError("Les noms des participants doivent être uniques")
+        if chunk_size < 1:
+            raise ValueError("La taille des paquets doit être positive")
+        
+        self.names = names
+        self.healths = healths
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.defend_chance = defend_chance
+        self.character_class = character_class
+        self.progress = progress
+    
+    def round_robin(self, rounds=1):
+        """
+        Fait s'affronter chaque paire de participants
+        
+        Args:
+            rounds (int): Nombre de duels par paire
+        
+        Returns:
+            TournamentResult: Résultats agrégés
+        """
+        result = TournamentResult(self.names)
+        pairs = (pair for _ in range(rounds)
+                 for pair in combinations(range(len(self.names)), 2))
+        total = rounds * len(self.names) * (len(self.names) - 1) // 2
+        
+        start = time.perf_counter()
+        with self._executor() as executor:
+            self._play(executor, pairs, total, result, start)
+        result.elapsed = time.perf_counter() - start
+        return result
+    
+    def bracket(self):
+        """
+        Joue un tournoi à élimination directe
+        
+        Un participant sans adversaire passe au tour suivant.
+        
+        Returns:
+            TournamentResult: Résultats agrégés, avec le champion
+        """
+        result = TournamentResult(self.names)
+        contenders = list(range(len(self.names)))
+        total = len(contenders) - 1
+        chunk_offset = 0
+        
+        start = time.perf_counter()
+        with self._executor() as executor:
+            while len(contenders) > 1:
+                pairs = list(zip(contenders[0::2], contenders[1::2]))
+                bye = contenders[-1:] if len(contenders) % 2 else []
+                winners = self._play(executor, iter(pairs), total, result, start,
+                                     keep_winners=True, chunk_offset=chunk_offset)
+                chunk_offset += -(-len(pairs) // self.chunk_size)
+                contenders = winners + bye
+        result.elapsed = time.perf_counter() - start
+        result.champion = self.names[contenders[0]]
+        return result
+    
+    @contextmanager
+    def _executor(self):
+        """Fournit le pool de processus, ou None pour jouer sur place"""
+        initargs = (self.names, self.healths, self.character_class,
+                    self.defend_chance, self.seed)
+        if self.workers == 1:
+            _init_worker(*initargs)
+            yield None
+            return
+        
+        with ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                 initargs=initargs) as executor:
+            yield executor
+    
+    def _play(self, executor, pairs, total, result, start, keep_winners=False, chunk_offset=0):
+        """Joue tous les duels d'une étape et renvoie les gagnants dans l'ordre"""
+        chunks = iter(lambda: list(islice(pairs, self.chunk_size)), [])
+        winners_by_chunk = {}
+        
+        def collect(outcome):
+            chunk_index, wins, losses, turns, duels, winners = outcome
+            result._merge(wins, losses, turns, duels)
+            if keep_winners:
+                winners_by_chunk[chunk_index] = winners
+            if self.progress is not None:
+                self.progress(result.duels, total, time.perf_counter() - start)
+        
+        if executor is None:
+            for chunk_index, chunk in enumerate(chunks, chunk_offset):
+                collect(_play_chunk(chunk_index, chunk, keep_winners))
+        else:
+            # Garder un nombre borné de paquets en vol pour limiter la mémoire
+            pending = set()
+            for chunk_index, chunk in enumerate(chunks, chunk_offset):
+                if len(pending) >= 2 * self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+                pending.add(executor.submit(_play_chunk, chunk_index, chunk, keep_winners))
+            for future in pending:
+                collect(future.result())
+        
+        return [winner for index in sorted(winners_by_chunk)
+                for winner in winners_by_chunk[index]]
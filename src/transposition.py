@@ -0,0 +1,161 @@
+"""
+Hachage de Zobrist des positions de jeu et table de transposition
+
+Une position est le vecteur des santés, les drapeaux de défense et le
+joueur au trait. Sa clé de 64 bits est le XOR d'une clé pseudo-aléatoire
+par composante (joueur, attribut, valeur) : changer une composante ne
+coûte que deux XOR. Les clés sont dérivées à la demande par splitmix64,
+sans table précalculée, ce qui accepte des santés quelconques ; les plus
+récentes sont gardées en cache. Une santé non entière (soins de 1.5, par
+exemple) est ramenée à un entier par hash(), qui donne la même valeur
+pour 2 et 2.0.
+"""
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+_MASK = (1 << 64) - 1
+
+# Attributs hachés
+HEALTH = 0
+DEFENDING = 1
+SIDE_TO_MOVE = 2
+
+
+def _mix(value):
+    """Fonction de mélange de splitmix64"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+@lru_cache(maxsize=1 << 16)
+def zobrist_key(player_id, attribute, value=0):
+    """
+    Clé de Zobrist d'une composante de position
+    
+    Args:
+        player_id (int): Identifiant du joueur (position du joueur au trait
+            pour SIDE_TO_MOVE)
+        attribute (int): HEALTH, DEFENDING ou SIDE_TO_MOVE
+        value (int): Valeur de l'attribut (santé)
+    
+    Returns:
+        int: Clé de 64 bits
+    """
+    if not isinstance(value, int):
+        value = hash(value)
+    return _mix(_mix(((player_id & _MASK) << 2 | attribute) & _MASK) ^ (value & _MASK))
+
+
+def _mix_array(values):
+    """_mix appliqué à un tableau uint64, l'arithmétique bouclant modulo 2**64"""
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def zobrist_keys(player_ids, attribute, values=0):
+    """
+    Clés de Zobrist de nombreuses composantes à la fois, égales à zobrist_key
+    
+    Args:
+        player_ids (array-like): Identifiants des joueurs
+        attribute (int): HEALTH, DEFENDING ou SIDE_TO_MOVE
+        values (array-like or int): Valeurs de l'attribut
+    
+    Returns:
+        numpy.ndarray: Clés de 64 bits (uint64)
+    """
+    player_ids = np.asarray(player_ids, dtype=np.int64).astype(np.uint64)
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iub':
+        values = np.array([value if isinstance(value, int) else hash(value)
+                           for value in values.ravel().tolist()], dtype=np.int64).reshape(values.shape)
+    values = values.astype(np.int64).astype(np.uint64)
+    return _mix_array(_mix_array(player_ids << np.uint64(2) | np.uint64(attribute)) ^ values)
+
+
+class TranspositionTable:
+    """
+    Table bornée de positions déjà évaluées, indexée par hachage de Zobrist
+    
+    Chaque entrée garde une valeur et la profondeur de recherche qui l'a
+    produite. Une entrée n'est remplacée que par une évaluation au moins
+    aussi profonde ; quand la table est pleine, l'entrée utilisée le moins
+    récemment est évincée.
+    """
+    
+    def __init__(self, capacity=1 << 20):
+        """
+        Args:
+            capacity (int): Nombre maximum d'entrées
+        
+        Raises:
+            ValueError: Si la capacité n'est pas positive
+        """
+        if capacity < 1:
+            raise ValueError("La capacité doit être positive")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def __contains__(self, key):
+        return key in self._entries
+    
+    def lookup(self, key, min_depth=0):
+        """
+        Cherche l'évaluation d'une position
+        
+        Args:
+            key (int): Hachage de la position
+            min_depth (int): Profondeur minimale exigée
+        
+        Returns:
+            La valeur enregistrée, ou None si la position est absente ou a
+            été évaluée moins profondément
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[1] < min_depth:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def store(self, key, value, depth=0):
+        """
+        Enregistre l'évaluation d'une position
+        
+        Args:
+            key (int): Hachage de la position
+            value: Évaluation (None n'est pas distinguable d'une absence)
+            depth (int): Profondeur de recherche de l'évaluation
+        
+        Returns:
+            bool: True si l'entrée a été écrite
+        """
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None:
+            if depth < entry[1]:
+                return False
+            entries.move_to_end(key)
+        elif len(entries) >= self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = (value, depth)
+        return True
+    
+    def clear(self):
+        """Vide la table et remet les compteurs à zéro"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
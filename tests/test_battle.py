@@ -1,6 +1,7 @@
 # tests/test_battle.py - Version corrigée qui marche avec ton Character existant
 import pytest
 from src.battle import Battle
+from src.battle_log import BattleLog
 from src.character import Character
 from src.game import Game
 
@@ -71,4 +72,140 @@ def test_invalid_battle():
     
     # Test same character battle
     battle2 = Battle(char1, char1)
-    assert not battle2.is_valid_battle()  # Should be invalid - same character
\ No newline at end of file
+    assert not battle2.is_valid_battle()  # Should be invalid - same character
+
+class SlowCharacter(Character):
+    """Character whose attack goes through a custom method"""
+    def attack(self, target):
+        return super().attack(target)
+
+
+def striker(base, name, health, damage):
+    """Create a character of a subclass of base dealing the given damage"""
+    return type('Striker', (base,), {'ATTACK_DAMAGE': damage})(name, health)
+
+
+def run_loop_duel(health1, health2, defend1, defend2, damage1=1, damage2=1):
+    """Run the reference turn loop with custom characters"""
+    char1 = striker(SlowCharacter, "Alice", health1, damage1)
+    char2 = striker(SlowCharacter, "Bob", health2, damage2)
+    char1.is_defending, char2.is_defending = defend1, defend2
+    battle = Battle(char1, char2)
+    winner = battle.start_duel()
+    return battle, winner
+
+
+def test_closed_form_duel_matches_loop():
+    """The closed-form duel gives the same result, stats and log as the loop"""
+    for health1 in range(0, 7):
+        for health2 in range(0, 7):
+            for defend1 in (False, True):
+                for defend2 in (False, True):
+                    for damage1, damage2 in ((1, 1), (3, 2), (2, 5)):
+                        expected, expected_winner = run_loop_duel(
+                            health1, health2, defend1, defend2, damage1, damage2)
+                        
+                        char1 = striker(Character, "Alice", health1, damage1)
+                        char2 = striker(Character, "Bob", health2, damage2)
+                        char1.is_defending, char2.is_defending = defend1, defend2
+                        battle = Battle(char1, char2)
+                        winner = battle.start_duel()
+                        
+                        assert winner.name == expected_winner.name
+                        assert battle.get_battle_stats() == expected.get_battle_stats()
+                        assert char1.is_defending == expected.player1.is_defending
+                        assert char2.is_defending == expected.player2.is_defending
+
+
+def test_closed_form_duel_log_is_lazy(sample_characters):
+    """The log is only rendered when accessed"""
+    char1, char2 = sample_characters
+    battle = Battle(char1, char2)
+    battle.start_duel()
+    
+    assert len(battle._log) == 0
+    assert battle.turn_count == 10
+    assert battle.battle_log[0] == "Duel started between Alice and Bob"
+    assert battle.battle_log[-1] == "Battle ended! Winner: Alice"
+    assert len(battle.battle_log) == 21
+    assert battle.battle_log[1] == "Turn 1: Alice attacks Bob for 1 damage"
+    assert len(battle.log) == 21
+
+
+def test_custom_rules_use_turn_loop():
+    """Subclasses changing the combat rules fall back to the loop"""
+    battle, winner = run_loop_duel(3, 3, False, False)
+    
+    assert not battle._has_standard_rules()
+    assert battle._pending_duel is None
+    assert winner.name == "Alice"
+    assert battle.turn_count == 3
+
+    
+
+def test_structured_log_records(sample_characters):
+    """The log keeps typed records for each event"""
+    char1, char2 = sample_characters
+    char2.health = 2
+    char2.defend()
+    battle = Battle(char1, char2)
+    battle.start_duel()
+    
+    assert list(battle.log)[:1] == [(BattleLog.START, 0, 0, 1, 0)]
+    assert list(battle.log)[1:] == [
+        (BattleLog.ATTACK, 1, 0, 1, 1),
+        (BattleLog.ATTACK, 1, 1, 0, 1),
+        (BattleLog.ATTACK, 2, 0, 1, 1),
+        (BattleLog.END, 2, 0, -1, 0),
+    ]
+    assert battle.get_battle_stats()['battle_log'][-1] == "Battle ended! Winner: Alice"
+
+
+def test_disabled_log(sample_characters):
+    """Headless battles keep no log at all"""
+    char1, char2 = sample_characters
+    battle = Battle(char1, char2, log_enabled=False)
+    
+    assert battle.start_duel() is char1
+    assert battle.turn_count == 10
+    assert battle.get_battle_stats()['battle_log'] == []
+    
+    loop_battle, _ = run_loop_duel(3, 3, False, False)
+    assert len(loop_battle.battle_log) == 7
+
+def test_execute_turn_reports_actual_damage(sample_characters):
+    """Turn-by-turn battles report the damage actually dealt"""
+    char1, char2 = sample_characters
+    battle = Battle(char1, char2)
+    char2.defend()
+    
+    result = battle.execute_turn(char1, char2)
+    assert result == {'success': True, 'attacker': "Alice", 'defender': "Bob",
+                      'damage': 1, 'defender_health': 9, 'battle_over': False}
+    assert battle.turn_count == 1
+    battle.execute_turn(char2, char1)
+    assert battle.turn_count == 1
+    assert not battle.is_battle_over()
+    assert battle.get_winner() is None
+    
+    char2.health = 1
+    result = battle.execute_turn(char1, char2)
+    assert result['battle_over']
+    assert battle.get_winner() is char1
+    assert not battle.execute_turn(char2, char1)['success']
+    assert battle.battle_log == [
+        "Duel started between Alice and Bob",
+        "Turn 1: Alice attacks Bob for 1 damage",
+        "Turn 1: Bob attacks Alice for 1 damage",
+        "Turn 2: Alice attacks Bob for 1 damage",
+        "Battle ended! Winner: Alice",
+    ]
+
+def test_execute_turn_rejects_outsiders(sample_characters):
+    """Only the two sides of the battle can take turns"""
+    char1, char2 = sample_characters
+    battle = Battle(char1, char2)
+    with pytest.raises(ValueError):
+        battle.execute_turn(char1, Character("Eve"))
+    with pytest.raises(ValueError):
+        battle.execute_turn(char1, char1)
@@ -0,0 +1,50 @@
+import json
+import unittest
+
+from benchmarks import bench_hot_paths
+
+
+class TestBenchHotPaths(unittest.TestCase):
+    """Tests pour la suite de benchmarks des chemins critiques"""
+    
+    def test_run_measures_every_benchmark(self):
+        """Test 1: Chaque benchmark produit une courbe par taille"""
+        results = bench_hot_paths.run(sizes=[2, 3], number=5, repeat=1)
+        
+        self.assertEqual(set(results['results']), set(bench_hot_paths.BENCHMARKS))
+        for curve in results['results'].values():
+            self.assertEqual(set(curve), {'2', '3'})
+            self.assertGreater(curve['2']['seconds_per_op'], 0)
+        json.dumps(results)
+    
+    def test_unknown_benchmark(self):
+        """Test 2: Un benchmark inconnu est refusé"""
+        with self.assertRaises(ValueError):
+            bench_hot_paths.run(sizes=[2], names=['game.inconnu'])
+    
+    def test_compare_flags_regressions(self):
+        """Test 3: Seules les dégradations au-delà du seuil sont signalées"""
+        baseline = {'results': {'game.execute_action': {
+            '10': {'seconds_per_op': 1e-6, 'bytes_per_op': 100.0, 'peak_bytes_per_op': 100.0},
+            '100': {'seconds_per_op': 1e-6, 'bytes_per_op': 100.0, 'peak_bytes_per_op': 100.0}
+        }}}
+        results = {'results': {'game.execute_action': {
+            '10': {'seconds_per_op': 1.2e-6, 'bytes_per_op': 150.0, 'peak_bytes_per_op': 150.0},
+            '100': {'seconds_per_op': 2e-6, 'bytes_per_op': 400.0, 'peak_bytes_per_op': 400.0},
+            '1000': {'seconds_per_op': 9e-6, 'bytes_per_op': 900.0, 'peak_bytes_per_op': 900.0}
+        }}}
+        
+        regressions = bench_hot_paths.compare(results, baseline, threshold=0.25)
+        
+        self.assertEqual(regressions, [
+            ('game.execute_action', 100, 'seconds_per_op', 1e-6, 2e-6),
+            ('game.execute_action', 100, 'bytes_per_op', 100.0, 400.0)
+        ])
+    
+    def test_scaling_exponents(self):
+        """Test 4: La pente log-log distingue coût constant et linéaire"""
+        constant = {'10': {'seconds_per_op': 1.0}, '100': {'seconds_per_op': 1.0}}
+        linear = {'10': {'seconds_per_op': 1.0}, '100': {'seconds_per_op': 10.0}}
+        
+        self.assertAlmostEqual(bench_hot_paths.scaling_exponents(constant)[0][1], 0.0)
+        self.assertAlmostEqual(bench_hot_paths.scaling_exponents(linear)[0][1], 1.0)
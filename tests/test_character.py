@@ -141,3 +141,37 @@ class TestCharacter(unittest.TestCase):
         self.hero.health = 0
         result = str(self.hero)
         self.assertIn("Mort", result)
+    
+    def test_listener_notified_on_health_change(self):
+        """Test 18: Les observateurs sont prévenus des changements de santé"""
+        events = []
+        listener = lambda character, attribute, old, new: events.append((attribute, old, new))
+        self.villain.add_listener(listener)
+        
+        self.hero.attack(self.villain)
+        self.villain.health = 9  # Pas de changement, pas de notification
+        self.villain.remove_listener(listener)
+        self.villain.health = 3
+        
+        self.assertEqual(events, [('health', 10, 9)])
+    
+    def test_character_has_no_instance_dict(self):
+        """Test 19: Les personnages utilisent __slots__, sans __dict__"""
+        self.assertFalse(hasattr(self.hero, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.hero.mana = 5
+        
+        self.hero.defend()
+        self.assertEqual(str(self.hero), "Héros: 10/10 HP - Vivant (Défense)")
+        self.assertEqual(repr(self.hero), "Character(name='Héros', health=10)")
+    
+    def test_listener_notified_of_defense_changes(self):
+        """Test 20: Les observateurs sont prévenus des changements de défense"""
+        events = []
+        self.hero.add_listener(lambda character, attribute, old, new: events.append((attribute, old, new)))
+        
+        self.hero.defend()
+        self.hero.defend()
+        self.hero.attack(self.villain)
+        
+        self.assertEqual(events, [('is_defending', False, True), ('is_defending', True, False)])
@@ -0,0 +1,85 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.export import (RESULT_COLUMNS, export_history, iter_results, read_columnar,
+                        write_columnar, write_jsonl)
+from src.game import Game
+
+
+class TestExport(unittest.TestCase):
+    """Tests pour l'export de l'historique et des résultats"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.game = Game()
+        self.game.add_player("Alice")
+        self.game.add_player("Bob", 3)
+        self.game.execute_action("Alice", "attack", "Bob")
+        self.game.execute_action("Bob", "defend")
+        self.game.execute_action("Alice", "heal")
+        self.game.execute_action("Bob", "attack", "Alice")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+    
+    def test_jsonl_export(self):
+        """Test 1: Une ligne par entrée, par paquets, compressée en .gz"""
+        for name in ("history.jsonl", "history.jsonl.gz"):
+            count = export_history(self.game, self.path(name), chunk_size=4)
+            self.assertEqual(count, 6)
+            opener = gzip.open if name.endswith('.gz') else open
+            with opener(self.path(name), 'rt', encoding='utf-8') as file:
+                self.assertEqual([json.loads(line) for line in file], list(self.game.history))
+    
+    def test_columnar_export(self):
+        """Test 2: Une colonne par champ, relue à l'identique"""
+        count = export_history(self.game, self.path("columns"), format='columnar', chunk_size=4)
+        self.assertEqual(count, 6)
+        
+        columns = read_columnar(self.path("columns"))
+        history = list(self.game.history)
+        for field in ('turn', 'player', 'action', 'target', 'success', 'damage_dealt',
+                      'target_health', 'health_restored', 'current_health'):
+            self.assertEqual(columns[field], [entry.get(field) for entry in history], field)
+        
+        with open(self.path("columns/manifest.json"), encoding='utf-8') as file:
+            manifest = json.load(file)
+        self.assertEqual(manifest['rows'], 6)
+        self.assertEqual(manifest['columns']['action']['dictionary'],
+                         ['player_added', 'attack', 'defend', 'heal'])
+        damage = np.fromfile(self.path("columns/damage_dealt.bin"),
+                             manifest['columns']['damage_dealt']['dtype'])
+        self.assertEqual(damage[2], 1)
+        self.assertEqual(damage[5], 1)
+    
+    def test_results_export(self):
+        """Test 3: Résultats dans l'ordre du classement, sous les deux formats"""
+        results = list(iter_results(self.game))
+        self.assertEqual([(row['rank'], row['name'], row['health']) for row in results],
+                         [(1, "Alice", 9), (2, "Bob", 2)])
+        
+        self.assertEqual(write_jsonl(iter_results(self.game), self.path("results.jsonl")), 2)
+        write_columnar(iter_results(self.game), self.path("results"), columns=RESULT_COLUMNS)
+        self.assertEqual(read_columnar(self.path("results"), fields=['name', 'is_alive']),
+                         {'name': ["Alice", "Bob"], 'is_alive': [True, True]})
+    
+    def test_invalid_options(self):
+        """Test 4: Format, type de colonne ou taille de paquet invalide"""
+        with self.assertRaises(ValueError):
+            export_history(self.game, self.path("history.csv"), format='csv')
+        with self.assertRaises(ValueError):
+            write_columnar([], self.path("bad"), columns=[('turn', 'float')])
+        with self.assertRaises(ValueError):
+            write_jsonl([{}], self.path("empty.jsonl"), chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -156,4 +156,357 @@ class TestGame(unittest.TestCase):
         self.assertEqual(state['alive_players'], 2)
         self.assertEqual(state['dead_players'], 0)
         self.assertFalse(state['game_over'])
-        self.assertIsNone(state['winner'])
\ No newline at end of file
+        self.assertIsNone(state['winner'])
+    
+    def test_add_player_duplicate_name(self):
+        """Test 30: Un nom déjà pris est refusé"""
+        self.game.add_player("Alice")
+        
+        with self.assertRaises(ValueError):
+            self.game.add_player("Alice")
+        self.assertEqual(len(self.game.players), 1)
+    
+    def test_player_ids_are_stable(self):
+        """Test 31: Les identifiants sont stables et jamais réutilisés"""
+        alice = self.game.add_player("Alice")
+        bob = self.game.add_player("Bob")
+        
+        self.assertEqual(self.game.get_player_id("Alice"), 0)
+        self.assertEqual(self.game.get_player_id("Bob"), 1)
+        self.assertIs(self.game.get_player_by_id(1), bob)
+        
+        self.game.remove_player("Alice")
+        carol = self.game.add_player("Carol")
+        
+        self.assertEqual(self.game.get_player_id("Carol"), 2)
+        self.assertIsNone(self.game.get_player_id("Alice"))
+        self.assertIsNone(self.game.get_player_by_id(0))
+        self.assertEqual(self.game.players, [bob, carol])
+        self.assertIsNot(alice, carol)
+    
+    def test_remove_player(self):
+        """Test 32: Retirer un joueur libère son nom"""
+        self.game.add_player("Alice")
+        removed = self.game.remove_player("Alice")
+        
+        self.assertEqual(removed.name, "Alice")
+        self.assertIsNone(self.game.get_player("Alice"))
+        self.assertEqual(len(self.game.players), 0)
+        self.assertEqual(self.game.history[-1]['action'], 'player_removed')
+        
+        self.game.add_player("Alice")
+        self.assertIsNotNone(self.game.get_player("Alice"))
+        
+        with self.assertRaises(ValueError):
+            self.game.remove_player("Inconnu")
+    
+    def test_alive_and_dead_tracking(self):
+        """Test 33: Les vivants et morts suivent les changements de santé"""
+        alice = self.game.add_player("Alice")
+        bob = self.game.add_player("Bob")
+        carol = self.game.add_player("Carol")
+        ghost = self.game.add_player("Ghost", health=0)
+        
+        self.assertEqual(self.game.alive_count, 3)
+        self.assertEqual(self.game.get_dead_players(), [ghost])
+        
+        carol.health = 0
+        alice.health = 0
+        self.assertEqual(self.game.get_dead_players(), [alice, carol, ghost])
+        self.assertTrue(self.game.is_game_over())
+        self.assertIs(self.game.get_winner(), bob)
+        
+        # Un joueur ranimé retrouve sa place dans l'ordre des joueurs
+        alice.health = 4
+        self.assertEqual(self.game.get_alive_players(), [alice, bob])
+        self.assertFalse(self.game.is_game_over())
+        self.assertIsNone(self.game.get_winner())
+        
+        self.game.remove_player("Bob")
+        bob.health = 0
+        self.assertEqual(self.game.get_alive_players(), [alice])
+        self.assertEqual(self.game.dead_count, 2)
+    
+    def test_execute_action_until_game_over(self):
+        """Test 34: La partie se termine quand il ne reste qu'un joueur"""
+        self.game.add_player("Alice")
+        self.game.add_player("Bob", health=1)
+        
+        result = self.game.execute_action("Alice", "attack", "Bob")
+        
+        self.assertTrue(result['game_over'])
+        self.assertEqual(result['winner'], "Alice")
+        self.assertEqual(self.game.get_game_state()['winner'], "Alice")
+        self.assertFalse(self.game.execute_action("Alice", "defend")['success'])
+    
+    def test_execute_actions_matches_sequential_calls(self):
+        """Test 35: Un flux d'actions équivaut à des appels successifs"""
+        actions = [
+            ("Alice", "attack", "Bob"),
+            ("Bob", "defend"),
+            ("Alice", "attack", "Bob"),
+            ("Bob", "heal", None, 5),
+            ("Carol", "attack", "Bob"),
+            ("Bob", "attack", "Bob"),
+            ("Alice", "dance"),
+        ] + [("Alice", "attack", "Bob")] * 12
+        
+        sequential = Game()
+        batched = Game()
+        for game in (sequential, batched):
+            game.add_player("Alice")
+            game.add_player("Bob")
+        
+        expected = []
+        for player_name, action, *arguments in actions:
+            expected.append(sequential.execute_action(player_name, action, *arguments))
+            if expected[-1].get('game_over'):
+                break
+        
+        results = list(batched.execute_actions(iter(actions)))
+        
+        self.assertEqual(results, expected)
+        self.assertEqual(list(batched.history), list(sequential.history))
+        self.assertEqual(batched.get_game_state(), sequential.get_game_state())
+        self.assertEqual(batched.winner.name, "Alice")
+    
+    def test_execute_actions_is_lazy(self):
+        """Test 36: Le flux est consommé au fur et à mesure"""
+        self.game.add_player("Alice")
+        self.game.add_player("Bob")
+        consumed = []
+        
+        def stream():
+            while True:
+                consumed.append(1)
+                yield ("Alice", "defend")
+        
+        results = self.game.execute_actions(stream())
+        for turn in range(1, 6):
+            self.assertTrue(next(results)['success'])
+            # L'historique suit les tours même entre deux résultats
+            self.assertEqual(len(self.game.history), turn + 2)
+            self.assertEqual(self.game.get_game_state()['history_length'], turn + 2)
+        
+        self.assertEqual(len(consumed), 5)
+        self.assertEqual(self.game.turn_count, 5)
+    
+    def test_game_state_is_cached(self):
+        """Test 37: L'état n'est recalculé que pour les joueurs modifiés"""
+        alice = self.game.add_player("Alice")
+        bob = self.game.add_player("Bob")
+        
+        first = self.game.get_game_state()
+        cached = self.game._statuses[0]
+        second = self.game.get_game_state()
+        self.assertEqual(first, second)
+        self.assertIsNot(first['players'][0], second['players'][0])
+        
+        self.game.execute_action("Alice", "attack", "Bob")
+        third = self.game.get_game_state()
+        self.assertIs(self.game._statuses[0], cached)
+        self.assertEqual(third['players'][1], bob.get_status())
+        self.assertEqual(third['history_length'], 3)
+        self.assertEqual(third['turn_count'], 1)
+        
+        # Modifier l'état renvoyé n'altère pas le cache
+        third['players'][1]['health'] = -5
+        third['players'].clear()
+        self.assertEqual(self.game.get_game_state()['players'], [alice.get_status(), bob.get_status()])
+        
+        # max_health change aussi le statut et le pourcentage
+        bob.max_health = 20
+        status = self.game.get_game_state()['players'][1]
+        self.assertEqual((status['max_health'], status['health_percentage']), (20, 45.0))
+        delta = self.game.get_state_delta(self.game.version - 1)['players']
+        self.assertEqual(delta, [{'name': "Bob", 'max_health': 20, 'health_percentage': 45.0}])
+    
+    def test_state_delta(self):
+        """Test 38: Le delta ne contient que les joueurs et champs modifiés"""
+        self.game.add_player("Alice")
+        self.game.add_player("Bob")
+        self.game.add_player("Charlie")
+        
+        full = self.game.get_state_delta(0)
+        self.assertEqual([player['name'] for player in full['players']], ["Alice", "Bob", "Charlie"])
+        self.assertEqual(full['players'][0], self.game.get_player("Alice").get_status())
+        
+        version = full['version']
+        self.game.execute_action("Bob", "defend")
+        self.game.execute_action("Alice", "attack", "Charlie")
+        delta = self.game.get_state_delta(version)
+        
+        self.assertEqual(delta['since_version'], version)
+        self.assertEqual(delta['version'], self.game.version)
+        self.assertEqual(delta['turn_count'], 2)
+        self.assertEqual(delta['players'], [
+            {'name': "Bob", 'is_defending': True},
+            {'name': "Charlie", 'health': 9, 'health_percentage': 90.0}
+        ])
+        self.assertEqual(delta['removed_players'], [])
+        
+        self.assertEqual(self.game.get_state_delta(self.game.version)['players'], [])
+    
+    def test_state_delta_reports_deaths_and_removals(self):
+        """Test 39: Le delta signale les morts et les joueurs retirés"""
+        self.game.add_player("Alice")
+        self.game.add_player("Bob", health=1)
+        self.game.add_player("Charlie")
+        version = self.game.version
+        
+        self.game.execute_action("Alice", "attack", "Bob")
+        self.game.remove_player("Charlie")
+        delta = self.game.get_state_delta(version)
+        
+        self.assertEqual(delta['players'], [
+            {'name': "Bob", 'health': 0, 'is_alive': False, 'health_percentage': 0.0}
+        ])
+        self.assertEqual(delta['removed_players'], ["Charlie"])
+        self.assertTrue(delta['game_over'])
+        self.assertEqual(delta['winner'], "Alice")
+    
+    def test_apply_and_undo_restore_state(self):
+        """Test 40: apply puis undo restaurent exactement la partie"""
+        self.game.add_player("Alice")
+        self.game.add_player("Bob", health=3)
+        self.game.add_player("Charlie")
+        self.game.execute_action("Bob", "defend")
+        before = self.game.get_game_state()
+        history_length = len(self.game.history)
+        
+        tokens = [
+            self.game.apply(("Alice", "attack", "Bob")),
+            self.game.apply(("Charlie", "defend")),
+            self.game.apply(("Bob", "heal", None, 5)),
+            self.game.apply(("Alice", "attack", "Charlie")),
+        ]
+        self.assertEqual(tokens[0].result['damage_dealt'], 1)
+        self.assertEqual(self.game.turn_count, 5)
+        
+        for token in reversed(tokens):
+            self.game.undo(token)
+        
+        self.assertEqual(self.game.get_game_state(), before)
+        self.assertTrue(self.game.get_player("Bob").is_defending)
+        self.assertEqual(len(self.game.history), history_length)
+    
+    def test_undo_restores_game_over(self):
+        """Test 41: Annuler le coup final ressuscite la cible et rouvre la partie"""
+        self.game.add_player("Alice")
+        self.game.add_player("Bob", health=1)
+        
+        token = self.game.apply(("Alice", "attack", "Bob"))
+        self.assertTrue(token.result['game_over'])
+        self.assertTrue(self.game.game_over)
+        
+        self.game.undo(token)
+        
+        self.assertFalse(self.game.game_over)
+        self.assertIsNone(self.game.winner)
+        self.assertFalse(self.game.is_game_over())
+        self.assertEqual(self.game.get_alive_players(), self.game.players)
+        self.assertEqual(self.game.get_leaderboard()[0].name, "Alice")
+    
+    def test_undo_in_reverse_order_only(self):
+        """Test 42: Seule la dernière action appliquée peut être annulée"""
+        self.game.add_player("Alice")
+        self.game.add_player("Bob")
+        first = self.game.apply(("Alice", "attack", "Bob"))
+        second = self.game.apply(("Bob", "attack", "Alice"))
+        
+        with self.assertRaises(ValueError):
+            self.game.undo(first)
+        self.game.undo(second)
+        self.game.undo(first)
+        with self.assertRaises(ValueError):
+            self.game.undo(first)
+        
+        # Une action invalide donne aussi un jeton
+        token = self.game.apply(("Zoé", "defend"))
+        self.assertFalse(token.result['success'])
+        self.game.undo(token)
+        self.assertEqual(self.game.turn_count, 0)
+    
+    def test_add_players_in_bulk(self):
+        """Test 43: Ajout en bloc avec un seul événement d'historique"""
+        self.game.add_player("Alice")
+        created = self.game.add_players([("Bob", 4), "Carol", ["Dave", 0]])
+        
+        self.assertEqual([player.name for player in created], ["Bob", "Carol", "Dave"])
+        self.assertEqual(len(self.game.players), 4)
+        self.assertEqual(self.game.get_player_id("Dave"), 3)
+        self.assertEqual([player.name for player in self.game.get_alive_players()],
+                         ["Alice", "Bob", "Carol"])
+        self.assertEqual([player.name for player in self.game.get_leaderboard()],
+                         ["Alice", "Carol", "Bob", "Dave"])
+        self.assertEqual(len(self.game.history), 2)
+        self.assertEqual(self.game.history[-1]['action'], 'players_added')
+        entry = self.game.history[-1]
+        self.assertEqual((entry['count'], entry['first_player_id'], entry['last_player_id']), (3, 1, 3))
+        self.assertNotIn('players', entry)
+    
+    def test_add_players_matches_add_player(self):
+        """Test 44: L'ajout en bloc donne le même état que des ajouts un par un"""
+        roster = [("P{}".format(i), i % 7 + 1) for i in range(50)]
+        one_by_one = Game()
+        for name, health in roster:
+            one_by_one.add_player(name, health)
+        self.game.add_players(roster)
+        
+        state = self.game.get_game_state()
+        expected = one_by_one.get_game_state()
+        self.assertEqual(state['history_length'], 1)
+        state['history_length'] = expected['history_length']
+        self.assertEqual(state, expected)
+        self.assertEqual(self.game.state_hash, one_by_one.state_hash)
+        self.assertEqual(self.game.get_state_delta(0)['players'],
+                         one_by_one.get_state_delta(0)['players'])
+        
+        self.game.execute_action("P3", "attack", "P4")
+        one_by_one.execute_action("P3", "attack", "P4")
+        self.assertEqual(self.game.get_player("P4").health, 4)
+        self.assertEqual(self.game.leaderboard.rank_of(4), one_by_one.leaderboard.rank_of(4))
+        self.assertEqual([player.name for player in self.game.get_leaderboard()],
+                         [player.name for player in one_by_one.get_leaderboard()])
+    
+    def test_add_players_duplicates(self):
+        """Test 45: Doublons refusés sans rien ajouter, ou ignorés"""
+        self.game.add_player("Alice")
+        
+        for roster in (["Bob", "Alice"], ["Bob", "Bob"], ["Bob", ""]):
+            with self.assertRaises(ValueError):
+                self.game.add_players(roster)
+            self.assertEqual(len(self.game.players), 1)
+            self.assertEqual(len(self.game.history), 1)
+        
+        created = self.game.add_players(["Bob", "Alice", "Bob", "Carol"], on_duplicate='skip')
+        self.assertEqual([player.name for player in created], ["Bob", "Carol"])
+        self.assertEqual(self.game.add_players(["Alice"], on_duplicate='skip'), [])
+        self.assertEqual(len(self.game.history), 2)
+        with self.assertRaises(ValueError):
+            self.game.add_players(["Zoé"], on_duplicate='rename')
+    
+    def test_players_keep_arrival_order_after_removals(self):
+        """Test 46: La liste des joueurs garde l'ordre d'arrivée après des retraits"""
+        names = [f"P{i}" for i in range(10)]
+        self.game.add_players(names)
+        for name in ("P0", "P4", "P9"):
+            self.game.remove_player(name)
+        self.game.add_player("Zoé")
+        
+        expected = ["P1", "P2", "P3", "P5", "P6", "P7", "P8", "Zoé"]
+        self.assertEqual([player.name for player in self.game.players], expected)
+        self.assertEqual(len(self.game.players), 8)
+        self.assertEqual(self.game.players[0].name, "P1")
+        self.assertEqual(self.game.players[3].name, "P5")
+        self.assertEqual(self.game.players[-1].name, "Zoé")
+        self.assertEqual([player.name for player in self.game.players[1:3]], ["P2", "P3"])
+        self.assertIn(self.game.get_player("P5"), self.game.players)
+        self.assertIsInstance(self.game.players, list)
+        
+        # Une liste réordonnée de l'extérieur reste cohérente
+        self.game.players.reverse()
+        self.game.remove_player("P6")
+        self.game.remove_player("P2")
+        self.assertEqual([player.name for player in self.game.players],
+                         ["Zoé", "P8", "P7", "P5", "P3", "P1"])
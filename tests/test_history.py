@@ -0,0 +1,131 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from src.game import Game
+from src.history import HistoryStore
+
+
+class TestHistoryStore(unittest.TestCase):
+    """Tests pour l'historique borné"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.history = HistoryStore(memory_limit=8, segment_size=3, spill_dir=self.directory.name)
+    
+    def tearDown(self):
+        self.history.close()
+        self.directory.cleanup()
+    
+    def test_unbounded_by_default(self):
+        """Sans limite, tout reste en mémoire"""
+        history = HistoryStore()
+        history.extend({'turn': i} for i in range(100))
+        
+        self.assertEqual(len(history), 100)
+        self.assertEqual(history.in_memory, 100)
+        self.assertEqual(history[-1], {'turn': 99})
+    
+    def test_spill_keeps_memory_bounded(self):
+        """Les entrées anciennes partent sur disque en segments"""
+        for i in range(50):
+            self.history.append({'turn': i, 'player': 'Élise'})
+            self.assertLessEqual(self.history.in_memory, 8)
+        
+        self.assertEqual(len(self.history), 50)
+        segments = os.listdir(os.path.join(self.directory.name, os.listdir(self.directory.name)[0]))
+        self.assertTrue(all(name.endswith('.jsonl.gz') for name in segments))
+        self.assertEqual(len(segments), 14)
+    
+    def test_indexing_and_iteration_across_tiers(self):
+        """Indexation et itération couvrent la mémoire et le disque"""
+        entries = [{'turn': i, 'player': 'Élise'} for i in range(50)]
+        self.history.extend(entries)
+        
+        self.assertEqual(list(self.history), entries)
+        self.assertEqual(self.history[0], entries[0])
+        self.assertEqual(self.history[20], entries[20])
+        self.assertEqual(self.history[-1], entries[-1])
+        self.assertEqual(self.history[10:14], entries[10:14])
+        with self.assertRaises(IndexError):
+            self.history[50]
+    
+    def test_close_removes_segments(self):
+        """close() supprime les segments écrits"""
+        self.history.extend({'turn': i} for i in range(20))
+        self.history.close()
+        
+        self.assertEqual(len(self.history), 0)
+        self.assertEqual(os.listdir(self.directory.name), [])
+    
+    def test_pickle_round_trip(self):
+        """Un historique déversé reste sérialisable"""
+        self.history.extend({'turn': i} for i in range(20))
+        restored = pickle.loads(pickle.dumps(self.history))
+        
+        self.assertEqual(list(restored), list(self.history))
+        restored.close()
+    
+    def test_invalid_limits(self):
+        """Les limites incohérentes sont refusées"""
+        with self.assertRaises(ValueError):
+            HistoryStore(memory_limit=0)
+        with self.assertRaises(ValueError):
+            HistoryStore(memory_limit=4, segment_size=5)
+    
+    def test_game_history_length_with_spill(self):
+        """history_length reste correct quand l'historique est déversé"""
+        game = Game(history_limit=4, history_dir=self.directory.name)
+        game.add_player("Alice")
+        game.add_player("Bob")
+        for _ in range(9):
+            game.execute_action("Alice", "attack", "Bob")
+        
+        self.assertEqual(game.get_game_state()['history_length'], 11)
+        self.assertEqual(game.history[0]['action'], 'player_added')
+        self.assertEqual(game.history[2]['target_health'], 9)
+        self.assertLessEqual(game.history.in_memory, 4)
+        game.history.close()
+    
+    def test_iter_from_skips_earlier_segments(self):
+        """iter_from reprend à n'importe quel indice, segments compris"""
+        self.history.extend({'turn': i} for i in range(20))
+        
+        for start in (0, 2, 3, 7, 11, 12, 19, 20, 25):
+            self.assertEqual(list(self.history.iter_from(start)), list(self.history)[start:])
+        self.assertEqual(list(self.history.iter_from(-2)), [{'turn': 18}, {'turn': 19}])
+    
+    def test_iteration_survives_appends_and_spills(self):
+        """L'itération lit sur place et suit les ajouts, même déversés entre-temps"""
+        self.history.extend({'turn': i} for i in range(5))
+        
+        seen = []
+        for entry in self.history:
+            seen.append(entry['turn'])
+            if entry['turn'] < 15:
+                # Chaque ajout finit par déverser les entrées en cours de lecture
+                self.history.append({'turn': entry['turn'] + 5})
+        
+        self.assertEqual(seen, list(range(20)))
+        self.assertGreater(len(self.history._segments), 0)
+        
+        unbounded = HistoryStore()
+        unbounded.extend({'turn': i} for i in range(3))
+        entries = unbounded.iter_from(1)
+        self.assertIs(next(entries), unbounded[1])
+    
+    def test_game_iter_history(self):
+        """Game.iter_history parcourt l'historique, filtré par type d'action"""
+        game = Game(history_limit=4, history_dir=self.directory.name)
+        game.add_player("Alice")
+        game.add_player("Bob")
+        for _ in range(5):
+            game.execute_action("Alice", "attack", "Bob")
+            game.execute_action("Bob", "heal")
+        
+        self.assertEqual(list(game.iter_history()), list(game.history))
+        attacks = list(game.iter_history(actions=['attack']))
+        self.assertEqual([entry['turn'] for entry in attacks], [1, 3, 5, 7, 9])
+        self.assertEqual(list(game.iter_history(start=10)), [game.history[10], game.history[11]])
+        game.history.close()
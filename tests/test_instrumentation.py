@@ -0,0 +1,135 @@
+import cProfile
+import gc
+import unittest
+import weakref
+
+from src.battle import Battle
+from src.character import Character
+from src.game import Game
+from src.instrumentation import Instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Tests pour l'instrumentation des actions"""
+    
+    def setUp(self):
+        self.game = Game()
+        self.game.add_player("Alice")
+        self.game.add_player("Bob")
+        self.stats = Instrumentation()
+    
+    def test_disabled_by_default(self):
+        """Test 1: Sans instrumentation, les méthodes de la classe sont appelées directement"""
+        self.assertNotIn('execute_action', vars(self.game))
+        
+        self.stats.instrument(self.game)
+        self.assertIn('execute_action', vars(self.game))
+        self.stats.uninstrument(self.game)
+        self.assertNotIn('execute_action', vars(self.game))
+        self.assertFalse(self.stats.is_instrumented(self.game))
+    
+    def test_counts_per_action_type(self):
+        """Test 2: Compteurs et histogramme par type d'action"""
+        self.stats.instrument(self.game, label="g1")
+        self.game.execute_action("Alice", "attack", "Bob")
+        self.game.execute_action("Bob", action="defend")
+        self.game.execute_action("Alice", "attack", "Bob")
+        self.game.simulate_turn("Bob", None, "heal")
+        
+        stats = self.stats.to_dict()['g1']
+        attack = stats['execute_action']['attack']
+        self.assertEqual(attack['count'], 2)
+        self.assertEqual(attack['errors'], 0)
+        self.assertEqual(stats['execute_action']['defend']['count'], 1)
+        self.assertEqual(stats['simulate_turn']['heal']['count'], 1)
+        self.assertEqual(list(attack['histogram'].values())[-1], 2)
+        self.assertGreater(attack['total_seconds'], 0)
+        # Les actions s'exécutent normalement
+        self.assertEqual(self.game.get_player("Bob").health, 10)
+    
+    def test_errors_are_counted(self):
+        """Test 3: Une action qui lève une exception est comptée en erreur"""
+        class BrokenGame(Game):
+            def execute_action(self, player_name, action, target_name=None, amount=None):
+                raise RuntimeError("panne")
+        
+        game = self.stats.instrument(BrokenGame())
+        with self.assertRaises(RuntimeError):
+            game.execute_action("Alice", "attack", "Bob")
+        
+        stats = self.stats.to_dict()['default']['execute_action']['attack']
+        self.assertEqual((stats['count'], stats['errors']), (1, 1))
+    
+    def test_battle_and_slow_hook(self):
+        """Test 4: Les duels lents sont signalés avec leur profil"""
+        slow = []
+        stats = Instrumentation(slow_threshold=0.0, on_slow=slow.append,
+                                profiler=cProfile.Profile, profile_rate=1.0)
+        battle = stats.instrument(Battle(Character("A"), Character("B")), label="duel")
+        
+        winner = battle.start_duel()
+        
+        self.assertEqual(winner.name, "A")
+        self.assertEqual(stats.to_dict()['duel']['start_duel']['start_duel']['count'], 1)
+        self.assertEqual(len(slow), 1)
+        self.assertEqual(slow[0]['operation'], 'start_duel')
+        self.assertIsInstance(slow[0]['profile'], cProfile.Profile)
+    
+    def test_prometheus_export(self):
+        """Test 5: Export au format texte de Prometheus"""
+        self.stats.instrument(self.game, label='partie "1"')
+        self.game.execute_action("Alice", "attack", "Bob")
+        
+        text = self.stats.to_prometheus()
+        labels = 'game="partie \\"1\\"",operation="execute_action",action="attack"'
+        self.assertIn(f"rpg_actions_total{{{labels}}} 1\n", text)
+        self.assertIn(f'rpg_action_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n', text)
+        self.assertIn(f"rpg_action_duration_seconds_count{{{labels}}} 1\n", text)
+        self.assertIn("# TYPE rpg_action_duration_seconds histogram", text)
+        
+        self.stats.reset()
+        self.assertEqual(self.stats.to_dict(), {})
+    
+    def test_uninstrument_keeps_other_wrappers(self):
+        """Test 6: Retirer l'instrumentation rend la méthode enveloppée avant elle"""
+        def wrapper(*args):
+            calls.append(args[1])
+            return original(*args)
+        
+        calls = []
+        original = self.game.execute_action
+        self.game.execute_action = wrapper
+        
+        self.stats.instrument(self.game)
+        self.stats.uninstrument(self.game)
+        self.assertIs(self.game.execute_action, wrapper)
+        
+        self.stats.instrument(self.game)
+        self.game.execute_action("Alice", "attack", "Bob")
+        self.assertEqual(calls, ["attack"])
+        self.assertEqual(self.stats.to_dict()['default']['execute_action']['attack']['count'], 1)
+        
+        self.stats.uninstrument(self.game)
+        del self.game.execute_action
+        self.assertEqual(self.game.execute_action.__func__, Game.execute_action)
+    
+    def test_instrumented_objects_are_freed(self):
+        """Test 7: Une partie instrumentée puis abandonnée est libérée"""
+        self.stats.instrument(self.game)
+        self.game.execute_action("Alice", "attack", "Bob")
+        reference = weakref.ref(self.game)
+        
+        del self.game
+        gc.collect()
+        self.assertIsNone(reference())
+        self.assertEqual(len(self.stats._instrumented), 0)
+    
+    def test_unknown_actions_share_one_label(self):
+        """Test 8: Les actions inconnues sont regroupées sous une seule étiquette"""
+        self.stats.instrument(self.game)
+        for action in ("attack", "x1", "x2", ["liste"], None):
+            self.game.execute_action("Alice", action, "Bob")
+        
+        actions = self.stats.to_dict()['default']['execute_action']
+        self.assertEqual(sorted(actions), ['attack', 'other'])
+        self.assertEqual(actions['other']['count'], 4)
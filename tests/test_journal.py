@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+
+from src.game import Game
+from src.journal import Journal, recover
+
+
+class TestJournal(unittest.TestCase):
+    """Tests pour le journal d'actions"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.journal")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def play(self, journal):
+        game = Game()
+        journal.attach(game)
+        game.add_player("Alice")
+        game.add_player("Bob", 3)
+        game.execute_action("Alice", "attack", "Bob")
+        game.execute_action("Bob", "defend")
+        game.execute_action("Alice", "attack", "Bob")
+        game.execute_action("Bob", "heal")
+        return game
+    
+    def test_recover_replays_games(self):
+        """Test 1: Rejouer le journal reconstruit l'état et l'historique"""
+        with Journal(self.path) as journal:
+            game = self.play(journal)
+        
+        games = recover(self.path)
+        self.assertEqual(list(games), [1])
+        self.assertEqual(games[1].get_game_state(), game.get_game_state())
+        self.assertEqual(list(games[1].history), list(game.history))
+    
+    def test_only_accepted_actions_are_journaled(self):
+        """Test 2: Une action refusée n'est pas journalisée"""
+        with Journal(self.path) as journal:
+            game = self.play(journal)
+            records = journal.records
+            self.assertFalse(game.execute_action("Carol", "attack", "Bob")['success'])
+            self.assertEqual(journal.records, records)
+    
+    def test_existing_game_is_snapshotted(self):
+        """Test 3: Une partie déjà commencée est retrouvée depuis son état au rattachement"""
+        game = Game()
+        game.add_player("Alice")
+        game.add_player("Bob")
+        game.execute_action("Alice", "attack", "Bob")
+        game.execute_action("Bob", "defend")
+        
+        with Journal(self.path) as journal:
+            journal.attach(game, 7)
+            game.execute_action("Alice", "attack", "Bob")
+        
+        recovered = recover(self.path)[7]
+        self.assertEqual(recovered.get_player("Bob").health, game.get_player("Bob").health)
+        self.assertEqual(recovered.turn_count, game.turn_count)
+    
+    def test_torn_tail_is_ignored_and_truncated(self):
+        """Test 4: Une dernière ligne incomplète est ignorée puis coupée"""
+        with Journal(self.path) as journal:
+            game = self.play(journal)
+        with open(self.path, 'ab') as file:
+            file.write(b'{"op": "action", "game": 1, "pla')
+        
+        self.assertEqual(list(recover(self.path)[1].history), list(game.history))
+        
+        journal = Journal.open(self.path)
+        journal.games[1].execute_action("Alice", "attack", "Bob")
+        journal.close()
+        self.assertEqual(len(recover(self.path)[1].history), len(game.history) + 1)
+    
+    def test_open_resumes_journaling(self):
+        """Test 5: Les parties rouvertes continuent d'être journalisées"""
+        with Journal(self.path) as journal:
+            self.play(journal)
+        
+        with Journal.open(self.path) as journal:
+            self.assertEqual(list(journal.games), [1])
+            journal.games[1].execute_action("Alice", "attack", "Bob")
+            second = Game()
+            self.assertEqual(journal.attach(second), 2)
+            second.add_player("Carol")
+        
+        games = recover(self.path)
+        self.assertEqual(games[1].get_player("Bob").health, 2)
+        self.assertEqual(games[2].get_player("Carol").health, 10)
+    
+    def test_detach_forgets_game(self):
+        """Test 6: Une partie détachée n'est plus retrouvée"""
+        with Journal(self.path) as journal:
+            game = self.play(journal)
+            journal.detach(game)
+            self.assertIsNone(journal.game_id(game))
+            self.assertNotIn('execute_action', vars(game))
+        
+        self.assertEqual(recover(self.path), {})
+    
+    def test_syncs_per_durability(self):
+        """Test 7: Nombre de fsync selon la durabilité"""
+        expected = {'none': 0, 'always': 7}
+        for durability, syncs in expected.items():
+            with Journal(self.path + durability, durability=durability) as journal:
+                self.play(journal)
+                self.assertEqual(journal.syncs, syncs)
+        
+        with Journal(self.path, group_size=4, group_interval=60) as journal:
+            self.play(journal)
+            self.assertEqual(journal.syncs, 1)
+            journal.commit()
+            self.assertEqual(journal.syncs, 2)
+            journal.commit()
+            self.assertEqual(journal.syncs, 2)
+    
+    def test_invalid_options(self):
+        """Test 8: Durabilité ou taille de paquet invalide"""
+        with self.assertRaises(ValueError):
+            Journal(self.path, durability='sometimes')
+        with self.assertRaises(ValueError):
+            Journal(self.path, group_size=0)
+    
+    def test_bulk_additions_are_journaled(self):
+        """Test 9: Un ajout en bloc est un seul enregistrement, rejoué à l'identique"""
+        with Journal(self.path) as journal:
+            game = Game()
+            journal.attach(game)
+            game.add_players([("Alice", 4), "Bob"])
+            game.add_players(["Bob"], on_duplicate='skip')
+            self.assertEqual(journal.records, 2)
+        
+        recovered = recover(self.path)[1]
+        self.assertEqual(recovered.get_game_state(), game.get_game_state())
+    
+    def test_batched_actions_are_journaled(self):
+        """Test 10: Les actions d'execute_actions sont journalisées comme les autres"""
+        with Journal(self.path) as journal:
+            game = Game()
+            journal.attach(game)
+            game.add_players(["Alice", "Bob"])
+            results = list(game.execute_actions([
+                ("Alice", "attack", "Bob"),
+                ("Carol", "attack", "Bob"),
+                ("Bob", "defend"),
+                ("Alice", "attack", "Bob"),
+            ]))
+            self.assertFalse(results[1]['success'])
+            self.assertEqual(journal.records, 5)
+        
+        recovered = recover(self.path)[1]
+        self.assertEqual(recovered.get_game_state(), game.get_game_state())
+        self.assertEqual(list(recovered.history), list(game.history))
+
+if __name__ == '__main__':
+    unittest.main()
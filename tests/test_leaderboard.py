@@ -0,0 +1,100 @@
+import random
+import unittest
+
+from src.character import Character
+from src.game import Game
+from src.leaderboard import Leaderboard
+
+
+class TestLeaderboard(unittest.TestCase):
+    """Tests pour le classement maintenu"""
+    
+    def setUp(self):
+        self.game = Game()
+        self.alice = self.game.add_player("Alice", health=5)
+        self.bob = self.game.add_player("Bob", health=8)
+        self.carol = self.game.add_player("Carol", health=5)
+        self.dave = self.game.add_player("Dave", health=10)
+    
+    def test_leaderboard_order_and_ties(self):
+        """Test 1: Tri par HP décroissant, égalités dans l'ordre d'arrivée"""
+        self.assertEqual(self.game.get_leaderboard(), [self.dave, self.bob, self.alice, self.carol])
+        
+        self.carol.heal(3)
+        self.dave.take_damage(2)
+        self.assertEqual(self.game.get_leaderboard(), [self.bob, self.carol, self.dave, self.alice])
+    
+    def test_top_k_and_rank(self):
+        """Test 2: Requêtes top-k et rang d'un joueur"""
+        self.assertEqual(self.game.get_leaderboard(limit=2), [self.dave, self.bob])
+        self.assertEqual(self.game.get_leaderboard(limit=0), [])
+        self.assertEqual(self.game.get_player_rank("Carol"), 4)
+        self.assertIsNone(self.game.get_player_rank("Zoé"))
+        
+        self.game.execute_action("Alice", "attack", "Dave")
+        self.game.execute_action("Carol", "heal", amount=5)
+        self.assertEqual(self.game.get_player_rank("Carol"), 1)
+        self.assertEqual(self.game.get_player_rank("Dave"), 2)
+    
+    def test_health_range(self):
+        """Test 3: Requête par plage de HP"""
+        board = self.game.leaderboard
+        self.assertEqual(board.in_health_range(5, 8), [self.bob, self.alice, self.carol])
+        self.assertEqual(board.in_health_range(6, 7), [])
+        self.assertEqual(board.in_health_range(10, 10), [self.dave])
+    
+    def test_removed_players_leave_the_leaderboard(self):
+        """Test 4: Un joueur retiré quitte le classement"""
+        self.game.remove_player("Bob")
+        self.bob.health = 100
+        
+        self.assertEqual(self.game.get_leaderboard(), [self.dave, self.alice, self.carol])
+    
+    def test_matches_sorted_players(self):
+        """Test 5: Identique au tri complet après des actions aléatoires"""
+        rng = random.Random(5)
+        game = Game()
+        names = [f"P{i}" for i in range(30)]
+        for name in names:
+            game.add_player(name, health=rng.randint(1, 10))
+        
+        for _ in range(300):
+            player, target = rng.sample(names, 2)
+            game.execute_action(player, rng.choice(('attack', 'heal', 'defend')), target)
+            expected = sorted(game.players, key=lambda p: p.health, reverse=True)
+            self.assertEqual(game.get_leaderboard(), expected)
+    
+    def test_buckets_match_sorted_players(self):
+        """Test 6: Seaux coupés et vidés, ordre et rangs identiques au tri complet"""
+        rng = random.Random(13)
+        board = Leaderboard()
+        board.LOAD = 4
+        players = {player_id: Character(f"P{player_id}", rng.randint(1, 10))
+                   for player_id in range(20)}
+        board.add_many(players.items())
+        
+        for step in range(500):
+            choice = rng.random()
+            if choice < 0.3 or not players:
+                player_id = 20 + step
+                players[player_id] = Character(f"P{player_id}", rng.randint(1, 10))
+                board.add(player_id, players[player_id])
+            elif choice < 0.5:
+                player_id = rng.choice(list(players))
+                board.remove(player_id)
+                del players[player_id]
+            else:
+                player_id = rng.choice(list(players))
+                players[player_id].health = rng.randint(0, 10)
+                board.update(player_id, players[player_id].health)
+            
+            expected = sorted(players, key=lambda key: (-players[key].health, key))
+            self.assertEqual(list(board), [players[key] for key in expected])
+            self.assertEqual(len(board), len(players))
+            self.assertTrue(all(len(bucket) <= 8 for bucket in board._buckets))
+        
+        for rank, player_id in enumerate(expected, 1):
+            self.assertEqual(board.rank_of(player_id), rank)
+        self.assertEqual(board.top_k(3), [players[key] for key in expected[:3]])
+        self.assertEqual(board.in_health_range(3, 6),
+                         [players[key] for key in expected if 3 <= players[key].health <= 6])
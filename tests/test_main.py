@@ -0,0 +1,44 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+import main
+
+
+class TestMain(unittest.TestCase):
+    """Tests pour le point d'entrée en ligne de commande"""
+    
+    def test_verbose_fight_reports_real_damage(self):
+        """Test 1: Le combat commenté affiche les dégâts réellement subis"""
+        out = io.StringIO()
+        winner = main.play_verbose(health=3, out=out)
+        text = out.getvalue()
+        
+        self.assertEqual(winner.name, main.HERO)
+        self.assertIn("→ Ennemi perd 1 HP (reste: 2/3)", text)
+        self.assertIn("→ Ennemi perd 1 HP (reste: 0/3)", text)
+        self.assertEqual(text.count("Héros attaque Ennemi!"), 3)
+        self.assertIn("🎉 Héros remporte la victoire!", text)
+    
+    def test_quiet_mode_prints_summary(self):
+        """Test 2: Le mode silencieux joue N combats et affiche le résumé"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            result = main.main(['--games', '200', '--seed', '7', '--health', '5', '--quiet'])
+        
+        self.assertEqual(result.duels, 200)
+        self.assertEqual(result.win_rate(main.HERO) + result.win_rate(main.ENEMY), 1.0)
+        self.assertIn("200 combats en", out.getvalue())
+        self.assertIn("combats/s", out.getvalue())
+        self.assertNotIn("Tour", out.getvalue())
+    
+    def test_same_seed_same_results(self):
+        """Test 3: Une graine donne toujours les mêmes résultats"""
+        first = main.play_headless(500, seed=11, defend_chance=0.5)
+        second = main.play_headless(500, seed=11, defend_chance=0.5)
+        self.assertEqual(first.wins, second.wins)
+    
+    def test_invalid_arguments(self):
+        """Test 4: Les arguments invalides sont refusés"""
+        with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit):
+            main.parse_args(['--games', '0'])
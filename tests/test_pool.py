@@ -0,0 +1,159 @@
+import random
+import unittest
+
+from src.character import Character
+from src.game import Game
+from src.pool import CharacterPool, PooledCharacter
+
+
+class TestCharacterPool(unittest.TestCase):
+    """Tests pour la réserve de personnages vectorisée"""
+    
+    def setUp(self):
+        self.pool = CharacterPool(["Alice", "Bob", "Carol", "Dave"])
+    
+    def test_pool_defaults(self):
+        """Test 1: Les personnages de la réserve démarrent comme des personnages ordinaires"""
+        pool = self.pool
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(pool.health.tolist(), [10, 10, 10, 10])
+        self.assertEqual(pool.alive_count(), 4)
+        self.assertIsInstance(pool[0], PooledCharacter)
+        self.assertEqual(pool[-1].name, "Dave")
+        self.assertIs(pool[1], pool[1])
+    
+    def test_pool_rejects_invalid_names(self):
+        """Test 2: Les noms sont validés comme pour Character"""
+        with self.assertRaises(ValueError):
+            CharacterPool(["Alice", ""])
+    
+    def test_batch_attack_matches_character_rules(self):
+        """Test 3: La défense ne réduit que le premier coup, les attaquants la perdent"""
+        pool = self.pool
+        pool.defend([0, 1])
+        pool.health[3] = 0
+        
+        success = pool.attack([0, 2, 2, 3], [1, 1, 1, 0])
+        
+        self.assertEqual(success.tolist(), [True, True, True, False])
+        self.assertEqual(pool.health.tolist(), [10, 7, 10, 0])
+        self.assertFalse(pool.is_defending[0])
+        self.assertFalse(pool.is_defending[1])
+    
+    def test_batch_attack_clamps_at_zero(self):
+        """Test 4: La santé ne descend jamais sous zéro"""
+        pool = self.pool
+        pool.health[1] = 1
+        pool.attack([0, 2, 3], [1, 1, 1])
+        self.assertEqual(pool.health[1], 0)
+        self.assertEqual(pool.alive_count(), 3)
+    
+    def test_batch_heal_is_sequential_per_character(self):
+        """Test 5: Des soins répétés sont crédités dans l'ordre et plafonnés"""
+        pool = self.pool
+        pool.health[:] = [5, 9, 0, 10]
+        
+        restored = pool.heal([0, 1, 1, 2, 0, 3])
+        
+        self.assertEqual(restored.tolist(), [2, 1, 0, 0, 2, 0])
+        self.assertEqual(pool.health.tolist(), [9, 10, 0, 10])
+        
+        with self.assertRaises(ValueError):
+            pool.heal([0], -1)
+    
+    def test_batch_take_damage(self):
+        """Test 6: Les dégâts directs tiennent compte de la défense"""
+        pool = self.pool
+        pool.defend([1])
+        pool.take_damage([0, 1], [3, 4])
+        self.assertEqual(pool.health[:2].tolist(), [7, 8])
+        
+        with self.assertRaises(ValueError):
+            pool.take_damage([0], -1)
+    
+    def test_views_behave_like_characters(self):
+        """Test 7: Les vues appliquent les méthodes de Character aux tableaux"""
+        alice, bob = self.pool[0], self.pool[1]
+        bob.defend()
+        
+        self.assertTrue(alice.attack(bob))
+        self.assertEqual(bob.health, 9)
+        self.assertFalse(bob.is_defending)
+        self.assertEqual(bob.heal(), 1)
+        self.assertEqual(str(bob), "Bob: 10/10 HP - Vivant")
+        self.assertEqual(bob.get_status()['health_percentage'], 100)
+    
+    def test_views_match_scalar_simulation(self):
+        """Test 8: Des lots aléatoires à cibles uniques égalent des appels un par un"""
+        rng = random.Random(7)
+        size = 50
+        pool = CharacterPool([f"P{i}" for i in range(size)])
+        characters = [Character(f"P{i}") for i in range(size)]
+        
+        for _ in range(30):
+            defenders = rng.sample(range(size), 10)
+            pool.defend(defenders)
+            for index in defenders:
+                characters[index].defend()
+            
+            attackers = rng.sample(range(size), 10)
+            targets = rng.sample([i for i in range(size) if i not in attackers], 10)
+            pool.attack(attackers, targets)
+            for attacker, target in zip(attackers, targets):
+                if characters[attacker].is_alive():
+                    characters[target].take_damage(Character.ATTACK_DAMAGE)
+                    characters[attacker].is_defending = False
+            
+            healed = rng.sample(range(size), 5)
+            pool.heal(healed)
+            for index in healed:
+                characters[index].heal()
+        
+        self.assertEqual(pool.health.tolist(), [c.health for c in characters])
+    
+    def test_views_keep_game_in_sync(self):
+        """Test 9: Les opérations en lot préviennent la partie des morts"""
+        pool = CharacterPool(["Alice", "Bob"])
+        game = Game()
+        for view in pool:
+            game._register_player(view)
+        
+        pool[1].health = 1
+        pool.attack([0], [1])
+        
+        self.assertTrue(game.is_game_over())
+        self.assertIs(game.get_winner(), pool[0])
+    
+    def test_batch_defense_resets_keep_game_tracking_in_sync(self):
+        """Test 10: La défense perdue en lot met à jour le hachage et le delta"""
+        pool = self.pool
+        game = Game()
+        for view in pool:
+            game._register_player(view)
+        
+        def fresh_hash():
+            fresh = Game()
+            for view in pool:
+                fresh.add_player(view.name, view.health)
+                fresh.get_player(view.name).is_defending = view.is_defending
+            return fresh.state_hash
+        
+        pool.defend([0, 1, 2])
+        version = game.version
+        pool.attack([0, 3], [1, 1])
+        
+        self.assertEqual(pool.is_defending.tolist(), [False, False, True, False])
+        self.assertEqual(game.state_hash, fresh_hash())
+        changed = {player['name']: player for player in game.get_state_delta(version)['players']}
+        self.assertEqual(changed['Alice'], {'name': "Alice", 'is_defending': False})
+        self.assertIs(changed['Bob']['is_defending'], False)
+        self.assertNotIn('Carol', changed)
+        
+        version = game.version
+        pool.take_damage([2, 3], 1)
+        self.assertEqual(game.state_hash, fresh_hash())
+        self.assertIs(game.get_state_delta(version)['players'][0]['is_defending'], False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import random
+import unittest
+
+from src.game import Game
+from src.replay import ReplayEngine
+from src.snapshot import dumps
+
+
+def play_random_game(seed, players=4, actions=300):
+    """Joue une partie aléatoire et renvoie la partie et l'état à chaque tour"""
+    rng = random.Random(seed)
+    game = Game()
+    names = [f"P{i}" for i in range(players)]
+    for name in names:
+        game.add_player(name, health=rng.randint(20, 40))
+    
+    states = {0: game.get_game_state()}
+    for _ in range(actions):
+        if game.is_game_over():
+            break
+        player, target = rng.sample(names, 2)
+        action = rng.choice(('attack', 'attack', 'defend', 'heal'))
+        result = game.execute_action(player, action, target, rng.choice((None, 1, 5)))
+        if result['success']:
+            states[game.turn_count] = game.get_game_state()
+    return game, states
+
+
+def public_state(game):
+    state = game.get_game_state()
+    del state['history_length']
+    return state
+
+
+class TestReplayEngine(unittest.TestCase):
+    """Tests pour le moteur de rejeu"""
+    
+    def setUp(self):
+        self.game, self.states = play_random_game(seed=3)
+        for state in self.states.values():
+            del state['history_length']
+    
+    def test_full_replay_rebuilds_state(self):
+        """Test 1: Rejouer tout l'historique redonne l'état final"""
+        engine = ReplayEngine(self.game.history, checkpoint_interval=16)
+        replayed = engine.run()
+        
+        self.assertEqual(public_state(replayed), public_state(self.game))
+        self.assertEqual(engine.divergences, [])
+        self.assertEqual(engine.repairs, [])
+        self.assertEqual(len(replayed.history), 0)
+    
+    def test_seek_forward_and_backward(self):
+        """Test 2: seek() atteint n'importe quel tour, dans les deux sens"""
+        engine = ReplayEngine(self.game.history, checkpoint_interval=10)
+        turns = sorted(self.states)
+        
+        for turn in [turns[-1], 0, turns[len(turns) // 2], 7, turns[-1], 3]:
+            self.assertEqual(public_state(engine.seek(turn)), self.states[turn])
+        self.assertEqual(engine.divergences, [])
+    
+    def test_seek_cost_is_bounded_by_interval(self):
+        """Test 3: Après un premier passage, seek rejoue moins d'un intervalle"""
+        engine = ReplayEngine(self.game.history, checkpoint_interval=10)
+        engine.run()
+        
+        steps = []
+        original_step = engine.step
+        engine.step = lambda: steps.append(1) or original_step()
+        engine.seek(max(self.states) // 2)
+        
+        self.assertLessEqual(len(steps), 10)
+    
+    def test_fast_forward_without_verification(self):
+        """Test 4: Le rejeu rapide ne vérifie rien et donne le même état"""
+        tampered = list(self.game.history)
+        tampered[10] = dict(tampered[10], turn=tampered[10]['turn'], success=False)
+        
+        engine = ReplayEngine(tampered, verify=False)
+        self.assertEqual(public_state(engine.run()), public_state(self.game))
+        self.assertEqual(engine.divergences, [])
+        
+        checked = ReplayEngine(tampered)
+        checked.run()
+        self.assertEqual(checked.divergences, [(10, 'success', False, True)])
+    
+    def test_incomplete_history_is_repaired(self):
+        """Test 5: Un historique tronqué est complété au mieux"""
+        game = Game()
+        game.add_player("Alice")
+        game.add_player("Bob", health=5)
+        game.execute_action("Alice", "attack", "Bob")
+        game.execute_action("Bob", "defend")
+        game.execute_action("Alice", "attack", "Bob")
+        
+        entries = list(game.history)
+        engine = ReplayEngine([entries[2], entries[4]])
+        replayed = engine.run()
+        
+        self.assertEqual(replayed.get_player("Bob").health, 3)
+        self.assertEqual(replayed.turn_count, 3)
+        self.assertEqual(len(engine.repairs), 3)
+        self.assertEqual(engine.divergences, [])
+    
+    def test_removed_players_are_replayed(self):
+        """Test 6: Les départs de joueurs sont rejoués"""
+        game = Game()
+        for name in ("Alice", "Bob", "Carol"):
+            game.add_player(name)
+        game.execute_action("Alice", "attack", "Carol")
+        game.remove_player("Carol")
+        game.execute_action("Bob", "heal")
+        
+        replayed = ReplayEngine(game.history).run()
+        
+        self.assertEqual(dumps(replayed), dumps(game))
+    
+    def test_bulk_added_players_are_replayed(self):
+        """Test 7: Les ajouts de joueurs en bloc sont rejoués"""
+        roster = [("Alice", 5), "Bob", ("Carol", 3)]
+        game = Game()
+        game.add_player("Zoé")
+        game.add_players(roster)
+        game.execute_action("Alice", "attack", "Carol")
+        game.execute_action("Bob", "attack", "Alice")
+        game.add_player("Yann")
+        
+        replayed = ReplayEngine(game.history, rosters={1: roster}).run()
+        self.assertEqual(dumps(replayed), dumps(game))
+        
+        # Sans roster, les joueurs sont recréés à leur première mention
+        engine = ReplayEngine(game.history)
+        replayed = engine.run()
+        self.assertEqual(engine.repairs[0], (1, "roster de l'ajout en bloc 1 absent"))
+        self.assertEqual(replayed.get_player("Carol").health, 2)
+        self.assertEqual(len(replayed.players), len(game.players))
+    
+    def test_join_health_is_not_read_from_the_name(self):
+        """Test 8: La santé d'arrivée vient du champ health, pas du nom"""
+        game = Game()
+        game.add_player("Bob avec 3 HP", 7)
+        game.add_player("Alice")
+        game.execute_action("Alice", "attack", "Bob avec 3 HP")
+        
+        replayed = ReplayEngine(game.history).run()
+        self.assertEqual(dumps(replayed), dumps(game))
+        
+        legacy = [dict(entry) for entry in game.history]
+        for entry in legacy[:2]:
+            del entry['health']
+        replayed = ReplayEngine(legacy).run()
+        self.assertEqual(dumps(replayed), dumps(game))
@@ -0,0 +1,74 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+from src.game import Game
+from src.roster import load_roster, read_csv, read_jsonl, read_roster
+
+
+class TestRoster(unittest.TestCase):
+    """Tests pour la lecture des rosters"""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        opener = gzip.open if name.endswith('.gz') else open
+        with opener(path, 'wt', encoding='utf-8') as file:
+            file.write(text)
+        return path
+    
+    def test_read_csv(self):
+        """Test 1: Colonnes dans n'importe quel ordre, santé facultative"""
+        path = self.write("roster.csv", "team,health,name\nred,4,Alice\nblue,,Bob\n\n")
+        self.assertEqual(list(read_csv(path)), [("Alice", 4), ("Bob", None)])
+        
+        path = self.write("names.csv", "name\nAlice\nZoé\n")
+        self.assertEqual(list(read_csv(path)), [("Alice", None), ("Zoé", None)])
+    
+    def test_read_jsonl(self):
+        """Test 2: Un objet par ligne, lignes vides ignorées"""
+        path = self.write("roster.jsonl", '{"name": "Alice", "health": 4}\n\n{"name": "Bob"}\n')
+        self.assertEqual(list(read_jsonl(path)), [("Alice", 4), ("Bob", None)])
+    
+    def test_invalid_rosters(self):
+        """Test 3: Erreurs signalées avec leur numéro de ligne"""
+        cases = [
+            ("bad_health.csv", "name,health\nAlice,4\nBob,beaucoup\n", "Ligne 3"),
+            ("no_name.csv", "player,health\nAlice,4\n", "name"),
+            ("bad_json.jsonl", '{"name": "Alice"}\n{"name": \n', "Ligne 2"),
+            ("not_object.jsonl", '["Alice", 4]\n', "Ligne 1"),
+        ]
+        for name, text, message in cases:
+            with self.assertRaisesRegex(ValueError, message):
+                list(read_roster(self.write(name, text)))
+        with self.assertRaises(ValueError):
+            read_roster(self.write("roster.txt", "Alice\n"))
+    
+    def test_load_roster(self):
+        """Test 4: Chargement dans une partie, fichiers compressés compris"""
+        game = Game()
+        game.add_player("Alice")
+        path = self.write("roster.ndjson.gz", "\n".join(
+            '{"name": "P%d", "health": %d}' % (i, i % 5 + 1) for i in range(100)))
+        
+        created = load_roster(game, path)
+        self.assertEqual(len(created), 100)
+        self.assertEqual(game.get_player("P7").health, 3)
+        self.assertEqual(len(game.history), 2)
+        
+        csv_path = self.write("more.csv", "name\nAlice\nP1\nCarol\n")
+        with self.assertRaises(ValueError):
+            load_roster(game, csv_path)
+        created = load_roster(game, csv_path, on_duplicate='skip')
+        self.assertEqual([player.name for player in created], ["Carol"])
+        self.assertEqual(len(game.players), 102)
+
+
+if __name__ == '__main__':
+    unittest.main()
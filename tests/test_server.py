@@ -0,0 +1,236 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from src.instrumentation import Instrumentation
+from src.journal import Journal
+from src.load_client import GameClient, run_load
+from src.server import GameServer, ServerError
+
+
+def run(coroutine):
+    """Exécute une coroutine dans une nouvelle boucle d'événements"""
+    return asyncio.run(coroutine)
+
+
+async def start_server(**options):
+    server = GameServer(**options)
+    address = await server.start()
+    return server, address
+
+
+class TestGameServer(unittest.TestCase):
+    """Tests pour le serveur de parties en JSON sur socket"""
+    
+    def test_game_operations_over_tcp(self):
+        """Test 1: Les parties sont créées et jouées via le protocole JSON"""
+        async def scenario():
+            server, address = await start_server()
+            client = await GameClient.connect(address)
+            
+            game_id = (await client.request('create_game'))['game']
+            await client.request('add_player', game=game_id, name="Alice")
+            await client.request('add_player', game=game_id, name="Bob", health=1)
+            result = await client.request('execute_action', game=game_id, player="Alice",
+                                          action="attack", target="Bob")
+            state = await client.request('get_game_state', game=game_id)
+            
+            await client.close()
+            await server.close()
+            return result, state
+        
+        result, state = run(scenario())
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(result['winner'], "Alice")
+        self.assertTrue(state['game_over'])
+        self.assertEqual(state['history_length'], 3)
+    
+    def test_errors_are_reported(self):
+        """Test 2: Une requête invalide reçoit une erreur, la connexion reste ouverte"""
+        async def scenario():
+            server, address = await start_server()
+            client = await GameClient.connect(address)
+            errors = []
+            
+            game_id = (await client.request('create_game'))['game']
+            await client.request('add_player', game=game_id, name="Alice")
+            for op, params in (('get_game_state', {'game': 999}),
+                               ('fly', {'game': game_id}),
+                               ('add_player', {'game': game_id, 'name': "Alice"})):
+                with self.assertRaises(ServerError) as error:
+                    await client.request(op, **params)
+                errors.append(str(error.exception))
+            
+            await client.request('close_game', game=game_id)
+            self.assertNotIn(game_id, server.games)
+            
+            await client.close()
+            await server.close()
+            return errors
+        
+        errors = run(scenario())
+        
+        self.assertIn("introuvable", errors[0])
+        self.assertIn("inconnue", errors[1])
+        self.assertIn("existe déjà", errors[2])
+    
+    def test_closed_games_are_uninstrumented(self):
+        """Test 3: Fermer une partie retire son instrumentation pour la libérer"""
+        async def scenario():
+            stats = Instrumentation()
+            server, address = await start_server(instrumentation=stats)
+            client = await GameClient.connect(address)
+            
+            game_id = (await client.request('create_game'))['game']
+            game = server.games[game_id]
+            self.assertTrue(stats.is_instrumented(game))
+            await client.request('close_game', game=game_id)
+            
+            await client.close()
+            await server.close()
+            return stats, game
+        
+        stats, game = run(scenario())
+        
+        self.assertFalse(stats.is_instrumented(game))
+        self.assertNotIn('execute_action', vars(game))
+    
+    def test_malformed_request_does_not_stop_the_game(self):
+        """Test 4: Une requête qui échoue reçoit une réponse et la partie continue"""
+        async def scenario():
+            server, address = await start_server()
+            client = await GameClient.connect(address)
+            errors = []
+            
+            game_id = (await client.request('create_game'))['game']
+            await client.request('add_player', game=game_id, name="Alice", health=5)
+            await client.request('add_player', game=game_id, name="Carol")
+            for op, params in (('execute_action', {'player': "Alice", 'action': "heal", 'amount': "5"}),
+                               ('add_player', {'name': "Bob", 'health': "10"}),
+                               ('get_state_delta', {'since': "0"}),
+                               # Passe la validation, échoue dans Game avec une TypeError
+                               ('execute_action', {'player': ["Alice"], 'action': "defend"})):
+                with self.assertRaises(ServerError) as error:
+                    await asyncio.wait_for(client.request(op, game=game_id, **params), 5)
+                errors.append(str(error.exception))
+            
+            result = await asyncio.wait_for(
+                client.request('execute_action', game=game_id, player="Alice", action="heal", amount=2), 5)
+            state = await asyncio.wait_for(client.request('get_game_state', game=game_id), 5)
+            
+            await client.close()
+            await server.close()
+            return errors, result, state
+        
+        errors, result, state = run(scenario())
+        
+        self.assertTrue(all("entier" in error for error in errors[:3]))
+        self.assertTrue(errors[3])
+        self.assertTrue(result['success'])
+        self.assertEqual(state['players'][0]['health'], 7)
+    
+    def test_actions_are_serialized_per_game(self):
+        """Test 5: Les actions envoyées à la suite sur une partie sont appliquées dans l'ordre"""
+        async def scenario():
+            server, address = await start_server(max_pending_per_game=2,
+                                                 max_inflight_per_connection=4)
+            client = await GameClient.connect(address)
+            game_id = (await client.request('create_game'))['game']
+            await client.request('add_player', game=game_id, name="Alice")
+            await client.request('add_player', game=game_id, name="Bob", health=100)
+            
+            results = await asyncio.gather(*(
+                client.request('execute_action', game=game_id, player="Alice",
+                               action="attack", target="Bob")
+                for _ in range(20)))
+            
+            await client.close()
+            await server.close()
+            return results
+        
+        results = run(scenario())
+        
+        self.assertEqual([result['turn'] for result in results], list(range(1, 21)))
+        self.assertEqual(results[-1]['target_health'], 80)
+    
+    def test_connection_limit(self):
+        """Test 6: Les connexions au-delà de la limite sont refusées"""
+        async def scenario():
+            server, address = await start_server(max_connections=1)
+            first = await GameClient.connect(address)
+            await first.request('create_game')
+            
+            second = await GameClient.connect(address)
+            with self.assertRaises((ServerError, ConnectionError)):
+                await second.request('create_game')
+            
+            await second.close()
+            await first.close()
+            await server.close()
+        
+        run(scenario())
+    
+    def test_load_client_over_unix_socket(self):
+        """Test 7: Le générateur de charge rapporte le débit et les percentiles de latence"""
+        async def scenario():
+            with tempfile.TemporaryDirectory() as directory:
+                server = GameServer()
+                address = await server.start(path=os.path.join(directory, "rpg.sock"))
+                stats = await run_load(address, games=3, actions=300, connections=2, concurrency=8)
+                await server.close()
+                return stats
+        
+        stats = run(scenario())
+        
+        self.assertEqual(stats['actions'], 300)
+        self.assertGreater(stats['actions_per_second'], 0)
+        self.assertGreaterEqual(stats['p99_ms'], stats['p50_ms'])
+    
+    def test_games_survive_restart_with_journal(self):
+        """Test 8: Les actions acquittées sont journalisées et rejouées au redémarrage"""
+        async def scenario(path):
+            journal = Journal.open(path)
+            server, address = await start_server(journal=journal)
+            client = await GameClient.connect(address)
+            
+            game_id = (await client.request('create_game'))['game']
+            closed_id = (await client.request('create_game'))['game']
+            await client.request('add_player', game=game_id, name="Alice")
+            await client.request('add_player', game=game_id, name="Bob")
+            await asyncio.gather(*(
+                client.request('execute_action', game=game_id, player="Alice",
+                               action="attack", target="Bob")
+                for _ in range(5)
+            ))
+            await client.request('close_game', game=closed_id)
+            state = await client.request('get_game_state', game=game_id)
+            
+            await client.close()
+            await server.close()
+            journal.close()
+            
+            journal = Journal.open(path)
+            server, address = await start_server(journal=journal)
+            client = await GameClient.connect(address)
+            recovered = await client.request('get_game_state', game=game_id)
+            new_id = (await client.request('create_game'))['game']
+            with self.assertRaises(ServerError):
+                await client.request('get_game_state', game=closed_id)
+            
+            await client.close()
+            await server.close()
+            journal.close()
+            return state, recovered, new_id, closed_id
+        
+        with tempfile.TemporaryDirectory() as directory:
+            state, recovered, new_id, closed_id = run(scenario(os.path.join(directory, "games.journal")))
+        
+        self.assertEqual(recovered, state)
+        self.assertEqual(recovered['players'][1]['health'], 5)
+        self.assertEqual(new_id, closed_id + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
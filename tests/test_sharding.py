@@ -0,0 +1,86 @@
+import unittest
+
+from src.sharding import Shard, ShardedGame
+
+
+def names(count):
+    return [f"P{i}" for i in range(count)]
+
+
+class TestShardedGame(unittest.TestCase):
+    """Tests pour la mêlée générale répartie en fragments"""
+    
+    def test_game_runs_to_a_single_winner(self):
+        """Test 1: Les joueurs sont répartis également et le dernier debout gagne"""
+        with ShardedGame(names(50), shards=3, inline=True, seed=7) as game:
+            self.assertEqual(game.alive_counts, [17, 17, 16])
+            winner = game.play()
+            stats = game.get_stats()
+        
+        self.assertTrue(game.is_game_over())
+        self.assertEqual(game.alive_count, 1)
+        self.assertTrue(winner.is_alive())
+        self.assertIn(winner.name, names(50))
+        self.assertEqual(stats['turn_count'], game.turn_count)
+        self.assertGreater(game.turn_count, 0)
+        self.assertGreater(stats['remote_attacks'], 0)
+        self.assertGreater(stats['attacks'], 0)
+    
+    def test_processes_match_inline_run(self):
+        """Test 2: Une partie ne dépend que de la graine, pas du lieu d'exécution des fragments"""
+        results = []
+        for inline in (True, False):
+            with ShardedGame(names(200), shards=2, inline=inline, seed=3, defend_chance=0.3) as game:
+                winner = game.play()
+                results.append((winner and winner.name, game.turn_count, game.get_stats()))
+        
+        self.assertEqual(results[0], results[1])
+    
+    def test_game_over_semantics_match_game(self):
+        """Test 3: Pas de gagnant tant que plusieurs joueurs vivent, toujours un à la fin"""
+        with ShardedGame([("A", 1), ("B", 1)], shards=2, inline=True) as game:
+            self.assertFalse(game.is_game_over())
+            self.assertIsNone(game.get_winner())
+            game.play_turn()
+            # Comme dans Game, l'attaque d'un joueur déjà mort échoue
+            self.assertEqual(game.alive_count, 1)
+            self.assertTrue(game.is_game_over())
+            self.assertIn(game.get_winner().name, ("A", "B"))
+        
+        for health in (1, 5):
+            with ShardedGame([("A", health), ("B", health)], shards=2, inline=True) as game:
+                self.assertIsNotNone(game.play())
+        for seed in range(50):
+            with ShardedGame(names(200), shards=4, inline=True, seed=seed) as game:
+                winner = game.play()
+                self.assertEqual(game.alive_counts.count(0), 3)
+                self.assertTrue(winner is not None and winner.is_alive())
+    
+    def test_max_turns_stops_a_stalled_game(self):
+        """Test 4: Une partie où tout le monde se défend s'arrête après max_turns"""
+        with ShardedGame(names(4), shards=2, inline=True, defend_chance=1.0) as game:
+            self.assertIsNone(game.play(max_turns=5))
+            self.assertEqual(game.turn_count, 5)
+            self.assertEqual(game.alive_count, 4)
+    
+    def test_shard_resolves_remote_attacks_on_living_players(self):
+        """Test 5: Un paquet d'attaques distantes ne touche que des joueurs vivants"""
+        shard = Shard(0, 2, [("A", 2), ("B", 1)])
+        
+        self.assertEqual(shard.receive(10), 0)
+        self.assertTrue(all(player.is_dead() for player in shard.players))
+        
+        # Les attaques au-delà des survivants gardés viennent de joueurs morts
+        shard = Shard(0, 2, [("A", 1), ("B", 1)])
+        self.assertEqual(shard.receive(10, keep=1), 1)
+    
+    def test_invalid_entrants(self):
+        """Test 6: Trop peu de joueurs ou des noms en double sont refusés"""
+        with self.assertRaises(ValueError):
+            ShardedGame(["A"], inline=True)
+        with self.assertRaises(ValueError):
+            ShardedGame(["A", "A"], inline=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+from src.game import Game
+from src.snapshot import Snapshot, dumps, load_snapshot, loads, save_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    """Tests pour les instantanés binaires"""
+    
+    def setUp(self):
+        self.game = Game()
+        self.game.add_player("Alice")
+        self.game.add_player("Bérénice", health=4)
+        self.game.add_player("Carl")
+        self.game.remove_player("Carl")
+        self.game.add_player("Dora", health=2)
+        self.game.execute_action("Alice", "attack", "Dora")
+        self.game.execute_action("Bérénice", "defend")
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game.snap")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def assertSameGame(self, restored, original):
+        self.assertEqual(restored.get_game_state(), original.get_game_state())
+        self.assertEqual(restored.turn_count, original.turn_count)
+        self.assertEqual(restored.game_over, original.game_over)
+        for player in original.players:
+            self.assertEqual(restored.get_player_id(player.name), original.get_player_id(player.name))
+    
+    def test_round_trip_without_history(self):
+        """Test 1: Un instantané restaure joueurs, santé, défense et tour"""
+        restored = loads(dumps(self.game))
+        
+        self.assertEqual([p.get_status() for p in restored.players],
+                         [p.get_status() for p in self.game.players])
+        self.assertEqual(len(restored.history), 0)
+        self.assertEqual(len(loads(dumps(Game(), include_history=True)).history), 0)
+        self.assertEqual(restored.add_player("Eve").name, "Eve")
+        self.assertEqual(restored.get_player_id("Eve"), 4)
+    
+    def test_file_round_trip_with_history(self):
+        """Test 2: Sauvegarde et restauration via mmap avec historique"""
+        save_snapshot(self.game, self.path, include_history=True)
+        restored = load_snapshot(self.path)
+        
+        self.assertSameGame(restored, self.game)
+        self.assertEqual(list(restored.history), list(self.game.history))
+    
+    def test_game_over_and_winner(self):
+        """Test 3: Fin de partie et gagnant sont restaurés"""
+        self.game.execute_action("Alice", "attack", "Dora")
+        self.game.get_player("Bérénice").health = 0
+        self.game.execute_action("Alice", "defend")
+        self.game.winner = self.game.get_winner()
+        self.game.game_over = True
+        
+        restored = loads(dumps(self.game, include_history=True))
+        
+        self.assertTrue(restored.game_over)
+        self.assertEqual(restored.winner.name, "Alice")
+        self.assertIs(restored.winner, restored.get_player("Alice"))
+    
+    def test_lazy_player_access(self):
+        """Test 4: Un joueur se lit sans restaurer la partie"""
+        save_snapshot(self.game, self.path)
+        with Snapshot.open(self.path) as snapshot:
+            self.assertEqual(snapshot.player_count, 3)
+            self.assertFalse(snapshot.has_history)
+            self.assertEqual(snapshot.player(1), {
+                'name': "Bérénice", 'health': 4, 'max_health': 10,
+                'is_defending': True, 'player_id': 1
+            })
+            with self.assertRaises(IndexError):
+                snapshot.player(3)
+    
+    def test_invalid_snapshots(self):
+        """Test 5: Les données invalides sont refusées"""
+        data = dumps(self.game)
+        with self.assertRaises(ValueError):
+            loads(b'XXXX' + data[4:])
+        with self.assertRaises(ValueError):
+            loads(data[:-3])
+        with self.assertRaises(ValueError):
+            loads(data[:4] + b'\x09\x00' + data[6:])
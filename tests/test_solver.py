@@ -0,0 +1,83 @@
+import itertools
+import os
+import tempfile
+import unittest
+
+from src.character import Character
+from src.solver import DuelSolver
+
+
+class SmallCharacter(Character):
+    __slots__ = ()
+    MAX_HEALTH = 6
+    ATTACK_DAMAGE = 3
+    HEAL_AMOUNT = 1
+
+
+def play_out(solver, health1, health2, defending1, defending2, max_plies):
+    """Joue le duel avec de vrais personnages, chacun suivant le solveur"""
+    mover = SmallCharacter("A", health1)
+    waiting = SmallCharacter("B", health2)
+    mover.is_defending = defending1
+    waiting.is_defending = defending2
+    
+    for ply in range(1, max_plies + 1):
+        action = solver.best_action_for(mover, waiting)
+        if action == 'attack':
+            mover.attack(waiting)
+        elif action == 'defend':
+            mover.defend()
+        else:
+            mover.heal()
+        if waiting.is_dead():
+            # Le joueur au trait au départ gagne si le dernier coup est le sien
+            return ('win' if ply % 2 else 'loss'), ply
+        mover, waiting = waiting, mover
+    return 'draw', None
+
+
+class TestDuelSolver(unittest.TestCase):
+    """Tests pour le solveur de duels"""
+    
+    def setUp(self):
+        self.solver = DuelSolver.for_character(SmallCharacter).solve()
+    
+    def test_finishing_blow(self):
+        """Test 1: Un coup mortel est toujours joué"""
+        self.assertEqual(self.solver.best_action(1, 3), 'attack')
+        self.assertEqual(self.solver.outcome(1, 3), ('win', 1))
+        self.assertEqual(self.solver.win_probability(1, 3), 1.0)
+    
+    def test_policy_matches_real_rules(self):
+        """Test 2: Jouer la politique avec les vraies règles donne l'issue annoncée"""
+        states = itertools.product(range(1, 7), range(1, 7), (False, True), (False, True))
+        for state in states:
+            expected = self.solver.outcome(*state)
+            limit = expected[1] if expected[1] is not None else 200
+            self.assertEqual(play_out(self.solver, *state, max_plies=limit), expected, state)
+    
+    def test_default_rules(self):
+        """Test 3: Avec les règles par défaut, se soigner tient indéfiniment"""
+        solver = DuelSolver()
+        self.assertEqual(solver.outcome(10, 10), ('draw', None))
+        self.assertEqual(solver.best_action(1, 10), 'heal')
+        self.assertEqual(solver.win_probability(1, 10), 0.5)
+        with self.assertRaises(ValueError):
+            solver.best_action(0, 5)
+        with self.assertRaises(ValueError):
+            solver.best_action(11, 5)
+    
+    def test_tables_are_cached_on_disk(self):
+        """Test 4: Les tables sont relues depuis le cache sans être recalculées"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            solved = DuelSolver(8, 3, 2, cache_dir=cache_dir).solve()
+            self.assertTrue(os.path.exists(solved.cache_path))
+            
+            cached = DuelSolver(8, 3, 2, cache_dir=cache_dir)
+            cached._iterate = None  # Échouerait si les tables étaient recalculées
+            cached.solve()
+            
+            self.assertEqual(cached.iterations, solved.iterations)
+            self.assertTrue((cached.policy == solved.policy).all())
+            self.assertEqual(cached.outcome(8, 8), solved.outcome(8, 8))
+            self.assertNotEqual(DuelSolver(8, 3, 1, cache_dir=cache_dir).cache_path, solved.cache_path)
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from src.battle import Battle
+from src.character import Character
+from src.team_battle import LowestHealthFirst, RandomTarget, RoundRobin, TeamBattle
+
+
+def team(prefix, *healths):
+    return [Character(f"{prefix}{i}", health) for i, health in enumerate(healths)]
+
+
+def test_one_vs_one_matches_duel():
+    """A 1-vs-1 team battle plays out like a duel"""
+    for health1, health2 in [(10, 10), (3, 7), (7, 3), (1, 1)]:
+        duel = Battle(Character("A", health1), Character("B", health2))
+        duel_winner = duel.start_duel()
+        
+        battle = TeamBattle(team("A", health1), team("B", health2))
+        winner = battle.start_battle()
+        
+        assert (winner is battle.team1) == (duel_winner is duel.player1)
+        assert battle.turn_count == duel.turn_count
+        assert battle.get_battle_stats()['team1_hp'] == duel.player1.health
+
+
+def test_lowest_health_first_targets_weakest():
+    """Lowest-HP-first always hits the weakest living defender"""
+    defenders = team("B", 5, 2, 2, 9)
+    policy = LowestHealthFirst(defenders, None)
+    
+    assert policy.choose() == 1
+    defenders[1].take_damage(2)
+    policy.remove(1)
+    assert policy.choose() == 2
+    defenders[2].health = 4
+    defenders[0].health = 3
+    policy.hit(2)
+    policy.hit(0)
+    assert policy.choose() == 0
+
+
+def test_round_robin_skips_the_dead():
+    """Round-robin cycles over living defenders only"""
+    defenders = team("B", 5, 5, 5)
+    policy = RoundRobin(defenders, None)
+    
+    assert [policy.choose() for _ in range(4)] == [0, 1, 2, 0]
+    policy.remove(1)
+    assert [policy.choose() for _ in range(3)] == [2, 0, 2]
+    policy.remove(0)
+    policy.remove(2)
+    assert policy.choose() is None
+
+
+def test_random_target_only_picks_living():
+    """Random targeting never picks a dead defender"""
+    defenders = team("B", 5, 5, 5, 5)
+    policy = RandomTarget(defenders, random.Random(3))
+    policy.remove(2)
+    policy.remove(0)
+    
+    assert {policy.choose() for _ in range(100)} == {1, 3}
+
+
+@pytest.mark.parametrize("policy", ["lowest_health", "random", "round_robin"])
+def test_large_team_battle(policy):
+    """Hundreds of combatants per side fight until a team is wiped out"""
+    battle = TeamBattle(team("A", *[10] * 300), team("B", *[10] * 300), policy=policy, seed=5,
+                        names=("Red", "Blue"))
+    winner = battle.start_battle()
+    stats = battle.get_battle_stats()
+    
+    loser_alive = stats['team2_alive'] if winner is battle.team1 else stats['team1_alive']
+    assert loser_alive == 0
+    assert stats['team1_damage'] + stats['team2_damage'] == 6000 - stats['team1_hp'] - stats['team2_hp']
+    assert stats['battle_log'][0] == "Battle started between Red and Blue"
+    assert stats['battle_log'][-1].startswith("Battle ended! Winner: ")
+    assert len(stats['battle_log']) == stats['attacks'] + 2
+
+
+def test_same_seed_same_battle():
+    """Random targeting is reproducible with a seed"""
+    logs = []
+    for _ in range(2):
+        battle = TeamBattle(team("A", *[4] * 20), team("B", *[4] * 20), policy="random", seed=9)
+        battle.start_battle()
+        logs.append(list(battle.log))
+    assert logs[0] == logs[1]
+
+
+def test_invalid_teams():
+    """Empty teams, shared combatants and unknown policies are rejected"""
+    shared = Character("S")
+    with pytest.raises(ValueError):
+        TeamBattle([], team("B", 5))
+    with pytest.raises(ValueError):
+        TeamBattle([shared], [shared])
+    with pytest.raises(ValueError):
+        TeamBattle(team("A", 5), team("B", 5), policy="strongest")
@@ -0,0 +1,100 @@
+import unittest
+from unittest import mock
+
+from src.battle import Battle
+from src.character import Character
+from src.tournament import Tournament
+
+
+class TankCharacter(Character):
+    """Personnage plus résistant, pour régler l'équilibre"""
+    MAX_HEALTH = 20
+
+
+class HeavyHitter(Character):
+    """Personnage dont l'attaque change les règles du combat"""
+    
+    def attack(self, target):
+        if self.is_dead():
+            return False
+        target.take_damage(2)
+        self.is_defending = False
+        return True
+
+
+class TestTournament(unittest.TestCase):
+    """Tests pour les tournois Monte Carlo"""
+    
+    def test_round_robin_counts(self):
+        """Test 1: Chaque paire joue le nombre de duels demandé"""
+        tournament = Tournament(["A", "B", "C", "D"], workers=1, chunk_size=4, seed=1)
+        result = tournament.round_robin(rounds=3)
+        
+        self.assertEqual(result.duels, 18)
+        self.assertEqual(sum(result.wins), 18)
+        self.assertEqual(sum(result.losses), 18)
+        self.assertGreater(result.turns, 0)
+        self.assertGreater(result.duels_per_second, 0)
+    
+    def test_round_robin_is_reproducible_across_workers(self):
+        """Test 2: Les résultats ne dépendent que de la graine, pas du nombre de processus"""
+        entrants = [("A", 10), ("B", 9), ("C", 10), ("D", 8)]
+        progress = []
+        
+        inline = Tournament(entrants, workers=1, chunk_size=5, seed=42,
+                            defend_chance=0.5).round_robin(rounds=10)
+        parallel = Tournament(entrants, workers=2, chunk_size=5, seed=42, defend_chance=0.5,
+                              progress=lambda done, total, elapsed: progress.append((done, total))
+                              ).round_robin(rounds=10)
+        
+        self.assertEqual(inline.wins, parallel.wins)
+        self.assertEqual(inline.turns, parallel.turns)
+        self.assertEqual(progress[-1], (60, 60))
+    
+    def test_stronger_entrant_wins_more(self):
+        """Test 3: La santé de départ se retrouve dans les taux de victoire"""
+        result = Tournament([("Strong", 10), ("Weak", 5)], workers=1, seed=3).round_robin(rounds=50)
+        
+        self.assertEqual(result.win_rate("Strong"), 1.0)
+        self.assertEqual(result.standings()[0][0], "Strong")
+    
+    def test_bracket_champion(self):
+        """Test 4: Un tableau à élimination directe désigne un seul champion"""
+        entrants = [("A", 3), ("B", 4), ("C", 10), ("D", 2), ("E", 5)]
+        result = Tournament(entrants, workers=1, chunk_size=1, seed=0).bracket()
+        
+        self.assertEqual(result.champion, "C")
+        self.assertEqual(result.duels, 4)
+        self.assertEqual(result.losses[2], 0)
+    
+    def test_character_class_is_used(self):
+        """Test 5: Les constantes d'équilibre viennent de la classe de personnage choisie"""
+        result = Tournament(["A", "B"], workers=1, character_class=TankCharacter).round_robin()
+        self.assertEqual(result.turns, 20)
+    
+    def test_invalid_entrants(self):
+        """Test 6: Un tournoi demande des participants uniques"""
+        with self.assertRaises(ValueError):
+            Tournament(["A"])
+        with self.assertRaises(ValueError):
+            Tournament(["A", "A"])
+    
+    def test_workers_do_not_log_battles(self):
+        """Test 7: Les duels aux règles modifiées se jouent sans journal de combat"""
+        battles = []
+        
+        class RecordingBattle(Battle):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                battles.append(self)
+        
+        with mock.patch('src.tournament.Battle', RecordingBattle):
+            Tournament(["A", "B", "C"], workers=1, character_class=HeavyHitter).round_robin()
+        
+        self.assertEqual(len(battles), 3)
+        self.assertTrue(all(battle.turn_count > 0 for battle in battles))
+        self.assertTrue(all(len(battle.log) == 0 for battle in battles))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from src.game import Game
+from src.snapshot import dumps, loads
+from src.transposition import DEFENDING, HEALTH, TranspositionTable, zobrist_key, zobrist_keys
+
+
+class TestStateHash(unittest.TestCase):
+    """Tests pour le hachage de Zobrist des positions"""
+    
+    def setUp(self):
+        self.game = Game()
+        for name in ("Alice", "Bob", "Charlie"):
+            self.game.add_player(name)
+    
+    def recompute(self, game):
+        """Hachage recalculé depuis zéro, pour vérifier la mise à jour incrémentale"""
+        fresh = Game()
+        for player in game.players:
+            fresh.add_player(player.name, player.health)
+            fresh.get_player(player.name).is_defending = player.is_defending
+        fresh.turn_count = game.turn_count
+        return fresh.state_hash
+    
+    def test_transpositions_share_a_hash(self):
+        """Test 1: Deux ordres d'actions menant à la même position ont le même hachage"""
+        other = Game()
+        for name in ("Alice", "Bob", "Charlie"):
+            other.add_player(name)
+        
+        self.game.execute_action("Alice", "attack", "Bob")
+        self.game.execute_action("Charlie", "attack", "Bob")
+        other.execute_action("Charlie", "attack", "Bob")
+        other.execute_action("Alice", "attack", "Bob")
+        
+        self.assertEqual(self.game.state_hash, other.state_hash)
+        self.assertEqual(self.game.state_hash, self.recompute(self.game))
+    
+    def test_hash_tracks_every_component(self):
+        """Test 2: Santé, défense et joueur au trait changent le hachage"""
+        seen = {self.game.state_hash}
+        self.game.execute_action("Alice", "defend")
+        seen.add(self.game.state_hash)
+        self.game.execute_action("Bob", "attack", "Alice")
+        seen.add(self.game.state_hash)
+        self.game.get_player("Charlie").take_damage(3)
+        seen.add(self.game.state_hash)
+        self.game.turn_count += 1
+        seen.add(self.game.state_hash)
+        
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(self.game.state_hash, self.recompute(self.game))
+    
+    def test_hash_restored_by_undo_and_snapshot(self):
+        """Test 3: undo et les instantanés restaurent le hachage"""
+        start = self.game.state_hash
+        token = self.game.apply(("Alice", "attack", "Bob"))
+        self.assertNotEqual(self.game.state_hash, start)
+        self.game.undo(token)
+        self.assertEqual(self.game.state_hash, start)
+        
+        self.game.execute_action("Bob", "defend")
+        self.assertEqual(loads(dumps(self.game)).state_hash, self.game.state_hash)
+        
+        self.game.remove_player("Charlie")
+        self.assertEqual(self.game.state_hash, self.recompute(self.game))
+    
+    def test_non_integer_health_is_hashed(self):
+        """Test 7: Une santé non entière est hachée sans désynchroniser la partie"""
+        self.game.execute_action("Alice", "attack", "Bob")
+        self.assertTrue(self.game.execute_action("Bob", "heal", amount=0.5)['success'])
+        self.game.get_player("Bob").take_damage(3)
+        
+        self.assertEqual(self.game.get_player("Bob").health, 6.5)
+        self.assertEqual(self.game.get_player_rank("Bob"), 3)
+        self.assertEqual(self.game.state_hash, self.recompute(self.game))
+        self.assertEqual(zobrist_key(3, HEALTH, 2.0), zobrist_key(3, HEALTH, 2))
+        
+        one_by_one = Game()
+        one_by_one.add_player("Alice", 9.5)
+        one_by_one.add_player("Bob", 2)
+        bulk = Game()
+        bulk.add_players([("Alice", 9.5), ("Bob", 2)])
+        self.assertEqual(bulk.state_hash, one_by_one.state_hash)
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Tests pour la table de transposition"""
+    
+    def test_lookup_and_depth(self):
+        """Test 4: Une entrée n'est remplacée que par une évaluation au moins aussi profonde"""
+        table = TranspositionTable(capacity=4)
+        self.assertIsNone(table.lookup(1))
+        
+        self.assertTrue(table.store(1, 0.5, depth=3))
+        self.assertFalse(table.store(1, 0.9, depth=2))
+        self.assertEqual(table.lookup(1), 0.5)
+        self.assertIsNone(table.lookup(1, min_depth=4))
+        self.assertTrue(table.store(1, 0.7, depth=4))
+        self.assertEqual(table.lookup(1, min_depth=4), 0.7)
+        self.assertEqual((table.hits, table.misses), (2, 2))
+    
+    def test_least_recently_used_is_evicted(self):
+        """Test 5: La table pleine évince l'entrée utilisée le moins récemment"""
+        table = TranspositionTable(capacity=3)
+        for key in (1, 2, 3):
+            table.store(key, key * 10)
+        table.lookup(1)
+        table.store(4, 40)
+        
+        self.assertEqual(len(table), 3)
+        self.assertNotIn(2, table)
+        self.assertIn(1, table)
+        self.assertEqual(table.evictions, 1)
+        
+        table.clear()
+        self.assertEqual((len(table), table.evictions), (0, 0))
+        with self.assertRaises(ValueError):
+            TranspositionTable(capacity=0)
+    
+    def test_vectorized_keys_match_scalar_keys(self):
+        """Test 6: Les clés calculées en bloc égalent les clés une à une"""
+        player_ids = [0, 1, 7, 12345, 2 ** 40]
+        healths = [10, 0, 3, -1, 7]
+        
+        keys = zobrist_keys(player_ids, HEALTH, healths)
+        self.assertEqual([int(key) for key in keys],
+                         [zobrist_key(i, HEALTH, h) for i, h in zip(player_ids, healths)])
+        self.assertEqual([int(key) for key in zobrist_keys(player_ids, DEFENDING)],
+                         [zobrist_key(i, DEFENDING) for i in player_ids])